@@ -1,18 +1,41 @@
+from pydantic import BaseModel
 from pydantic_settings import BaseSettings
 from functools import lru_cache
 from typing import Optional, Literal
 
 
+class ProviderLimits(BaseModel):
+    """Provider별 호출 제한 설정 (None 은 제한 없음)"""
+    max_concurrency: Optional[int] = None
+    requests_per_minute: Optional[int] = None
+    tokens_per_minute: Optional[int] = None
+
+
+class LLMVariant(BaseModel):
+    """트래픽 분할용 LLM 설정 (provider/model/temperature 가 없으면 기본 설정 사용)"""
+    name: str
+    weight: float = 1.0
+    provider: Optional[str] = None
+    model: Optional[str] = None
+    temperature: Optional[float] = None
+
+
 class Settings(BaseSettings):
     # === LLM Provider 설정 ===
     llm_provider: Literal[
-        "openai", "ollama", "lmstudio", "huggingface", "google", "xai"
+        "openai", "ollama", "lmstudio", "huggingface", "google", "xai", "fake"
     ] = "openai"
     llm_model: str = "gpt-4o-mini"
     llm_temperature: float = 0.7
+    # 채팅 요청 가중치 분할 (JSON, 예: [{"name": "control", "weight": 90},
+    #   {"name": "mini", "provider": "openai", "model": "gpt-4o-mini", "weight": 10}])
+    llm_traffic_split: list[LLMVariant] = []
+    # 채팅 요청에서 지정할 수 있는 추가 LLM ("provider:model" JSON 목록)
+    # 기본 LLM, LLM_TRAFFIC_SPLIT 변형, LLM_FAILOVER_CHAIN 의 모델은 항상 허용
+    llm_allowed_models: list[str] = []
 
     # === Embedding Provider 설정 ===
-    embedding_provider: Literal["openai", "huggingface", "ollama"] = "openai"
+    embedding_provider: Literal["openai", "huggingface", "ollama", "fake"] = "openai"
     embedding_model: str = "text-embedding-3-small"
     embedding_dimension: int = 1536
 
@@ -26,19 +49,94 @@ class Settings(BaseSettings):
     ollama_base_url: str = "http://localhost:11434"
     lmstudio_base_url: str = "http://localhost:1234/v1"
 
+    # === 로컬 Provider 모델 탐색 (LM Studio / Ollama) ===
+    provider_discovery_ttl: float = 30.0  # 초과 시 이전 목록 반환 후 백그라운드 갱신
+    provider_discovery_timeout: float = 2.0
+    provider_discovery_refresh_interval: float = 60.0  # 0 이면 주기적 갱신 안 함
+
+    # === Provider 헬스 체크 / 서킷 브레이커 ===
+    provider_health_check_interval: float = 60.0  # 0 이면 백그라운드 점검 안 함
+    provider_health_check_timeout: float = 5.0
+    circuit_breaker_failure_threshold: int = 3  # 연속 실패 횟수
+    circuit_breaker_reset_timeout: float = 30.0  # 열림 유지 시간 (초)
+    circuit_breaker_error_rate: float = 0.5  # 최근 호출 실패율 기준
+    circuit_breaker_window_size: int = 20  # 실패율 계산에 쓰는 최근 호출 수
+    circuit_breaker_min_calls: int = 10  # 실패율 판단 최소 호출 수
+    circuit_breaker_slow_call_seconds: Optional[float] = None  # 초과 시 실패로 계산
+
+    # === Provider 장애 대응 (예: ["lmstudio:qwen2-7b-instruct", "ollama:llama3.1"]) ===
+    llm_failover_chain: list[str] = []  # 기본 LLM 실패 시 순서대로 시도할 "provider:model"
+    embedding_failover_chain: list[str] = []  # 같은 모델의 다른 엔드포인트/키만 (질의 임베딩에만 적용)
+    provider_hedge_delay: float = 0.0  # 응답이 없으면 다음 Provider 로 추가 요청 (초, 0 은 끔)
+
+    # === Provider별 호출 제한 (JSON, 예: {"openai": {"max_concurrency": 8, "requests_per_minute": 500}}) ===
+    llm_provider_limits: dict[str, ProviderLimits] = {}
+    embedding_provider_limits: dict[str, ProviderLimits] = {}
+    provider_queue_timeout: float = 30.0  # 대기열 최대 대기 시간 (초)
+    provider_pool_max_idle: int = 4  # 기본이 아닌 유휴 Provider 인스턴스 최대 보관 수
+
+    # === Fake Provider (부하 테스트용) ===
+    fake_llm_latency_ms: int = 200  # 첫 토큰까지 지연 시간
+    fake_llm_tokens_per_second: float = 50.0  # 0 이면 지연 없이 즉시 생성
+
     # === HuggingFace 모델 관리 ===
     huggingface_cache_dir: str = "./models"
     huggingface_device: str = "cpu"  # "cpu", "cuda", "mps"
+    model_download_max_concurrent: int = 2  # 동시에 다운로드할 모델 수
+    model_download_file_workers: int = 8  # 모델당 병렬 파일 다운로드 수
+    model_download_resume_on_startup: bool = True  # 중단된 다운로드 이어받기
+    model_cache_quota_gb: float = 0  # 모델 캐시 디스크 할당량 (0 이면 제한 없음)
 
     # === Database ===
     database_url: str = "postgresql+psycopg://localhost:5432/ragdoc"
+    # psycopg prepare_threshold - 같은 쿼리가 N 번 실행되면 prepared statement 로 재사용
+    # (PgBouncer transaction 모드 등 prepared statement 미지원 환경은 -1 로 끔)
+    database_prepare_threshold: int = 1
+    database_pool_size: int = 5
+    database_max_overflow: int = 10
+    # 읽기 전용 복제본 (JSON 목록) - 검색/목록 조회를 라운드 로빈으로 분산
+    database_replica_urls: list[str] = []
+    database_replica_max_lag_seconds: float = 5.0  # 초과 시 해당 복제본 대신 primary 사용
+    database_replica_check_interval: float = 10.0  # 복제본 상태/지연 점검 주기 (초)
 
     # === Upload ===
     upload_dir: str = "./uploads"
     max_file_size: int = 10485760  # 10MB
 
+    # === Document listing ===
+    document_list_default_limit: int = 50
+    document_list_max_limit: int = 200
+    document_count_exact_threshold: int = 10000  # 초과 시 통계 기반 추정치 사용
+
     # === Vector store ===
-    collection_name: str = "documents"
+    collection_name: str = "documents"  # 기본 컬렉션 (컬렉션 미지정 요청)
+    collection_hnsw_m: int = 16  # 컬렉션 파티션 HNSW 인덱스 파라미터
+    collection_hnsw_ef_construction: int = 64
+    # 필터 조건의 예상 행 수가 이하이면 인덱스 대신 정확 검색 (필터 후 전체 거리 계산)
+    search_exact_scan_max_rows: int = 5000
+    # 넓은 필터에서 ANN 인덱스 결과가 부족하지 않도록 반복 스캔 (pgvector >= 0.8)
+    search_iterative_scan: Literal["off", "relaxed_order", "strict_order"] = "relaxed_order"
+    # 커넥션 단위 pgvector 검색 파라미터 (미설정 시 서버 기본값)
+    search_hnsw_ef_search: Optional[int] = None
+    search_ivfflat_probes: Optional[int] = None
+    search_snippet_chars: int = 240  # fields="snippet" 발췌 길이
+    document_cache_max_entries: int = 10000  # 검색 결과용 문서 정보 캐시 크기
+    # 벡터 검색 백엔드: pgvector (Postgres SQL), hnswlib (프로세스 내장 인덱스, 선택 설치)
+    vector_store: Literal["pgvector", "hnswlib"] = "pgvector"
+    vector_index_dir: str = "./vector_index"  # hnswlib 컬렉션별 인덱스 파일 위치
+    vector_index_sync_interval: float = 60.0  # document_chunks 와 동기화 주기 (초, 0 은 시작 시만)
+
+    # === Tracing (OpenTelemetry) ===
+    tracing_exporter: Literal["none", "otlp", "console", "memory"] = "none"
+    tracing_service_name: str = "ragdocsearch-backend"
+    otlp_endpoint: str = "http://localhost:4318/v1/traces"
+
+    # === Startup warmup ===
+    warmup_enabled: bool = False  # 시작 시 Provider 생성 및 모델 사전 로딩
+    warmup_db_connections: int = 2  # 미리 열어 검색 쿼리를 준비해 둘 DB 풀 커넥션 수
+    warmup_retry_initial_delay: float = 2.0  # 실패한 워밍업 단계 재시도 간격 (초, 지수 증가)
+    warmup_retry_max_delay: float = 60.0
+    warmup_retry_deadline: float = 0  # 초과 시 재시도 중단 ("failed"), 0 이면 계속 재시도
 
     class Config:
         env_file = ".env"
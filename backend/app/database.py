@@ -1,11 +1,73 @@
-from sqlalchemy import create_engine, text
-from sqlalchemy.orm import sessionmaker, declarative_base
+import logging
+
+from sqlalchemy import create_engine, event, inspect, text
+from sqlalchemy.engine import Engine
+from sqlalchemy.orm import Session, sessionmaker, declarative_base
 from app.config import get_settings
+from app.replicas import ReplicaRouter
+
+logger = logging.getLogger(__name__)
 
 settings = get_settings()
 
-engine = create_engine(settings.database_url)
-SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+
+def _configure_connection(dbapi_connection, connection_record):
+    """pgvector psycopg 어댑터 등록 (numpy 벡터를 binary 파라미터로 전송) 및 검색 GUC 설정"""
+    from pgvector.psycopg import register_vector
+    from app.repositories.search_repository import configure_search_session
+
+    try:
+        register_vector(dbapi_connection)
+    except Exception as e:
+        # vector 확장 생성 전 (init_db 가 확장 생성 후 풀을 비움)
+        logger.debug("pgvector adapter not registered: %s", e)
+    dbapi_connection.rollback()
+    configure_search_session(dbapi_connection)
+
+
+def _create_engine(url: str, **connect_args) -> Engine:
+    new_engine = create_engine(
+        url,
+        pool_size=settings.database_pool_size,
+        max_overflow=settings.database_max_overflow,
+        # N 번 실행된 쿼리는 커넥션별 서버 측 prepared statement 로 재사용 (음수는 끔)
+        connect_args={
+            "prepare_threshold": (settings.database_prepare_threshold
+                                  if settings.database_prepare_threshold >= 0 else None),
+            **connect_args,
+        },
+    )
+    event.listen(new_engine, "connect", _configure_connection)
+    return new_engine
+
+
+# primary (쓰기 및 기본 읽기)
+engine = _create_engine(settings.database_url)
+
+# 읽기 전용 복제본 (검색/목록 조회)
+replica_router = ReplicaRouter(
+    engine,
+    # 응답 없는 복제본 점검이 오래 걸리지 않도록 접속 타임아웃 지정
+    [_create_engine(url, connect_timeout=2) for url in settings.database_replica_urls],
+    max_lag_seconds=settings.database_replica_max_lag_seconds,
+)
+
+
+class RoutingSession(Session):
+    """읽기 세션은 복제본 하나에 고정, flush(쓰기)는 항상 primary"""
+
+    def get_bind(self, mapper=None, clause=None, **kwargs):
+        if self._flushing or not self.info.get("read_only"):
+            return engine
+        if "read_bind" not in self.info:
+            # 요청 동안 같은 복제본 사용 (복제본 간 지연 차이로 결과가 섞이지 않도록)
+            self.info["read_bind"] = replica_router.choose()
+        return self.info["read_bind"]
+
+
+SessionLocal = sessionmaker(
+    class_=RoutingSession, autocommit=False, autoflush=False, bind=engine
+)
 
 Base = declarative_base()
 
@@ -18,12 +80,113 @@ def get_db():
         db.close()
 
 
+def get_read_db():
+    """읽기 전용 요청용 세션 (복제본이 설정되어 있으면 복제본에서 조회)"""
+    db = SessionLocal(info={"read_only": True})
+    try:
+        yield db
+    finally:
+        db.close()
+
+
 def init_db():
     """Initialize database and create pgvector extension."""
     with engine.connect() as conn:
         # Create pgvector extension if not exists
         conn.execute(text("CREATE EXTENSION IF NOT EXISTS vector"))
         conn.commit()
+    # 확장 생성 전에 열린 커넥션은 vector 어댑터가 없으므로 폐기
+    engine.dispose()
+
+    # 기존 컬럼 보강 후, 파티션 도입 전 청크 테이블은 옮길 수 있도록 이름 변경
+    _add_missing_columns()
+    legacy_chunks = _detach_unpartitioned_chunks()
 
     # Create all tables
     Base.metadata.create_all(bind=engine)
+
+    # 컬렉션별 청크 파티션 (파티션이 있어야 청크를 넣을 수 있음)
+    from app.services.collection_service import ensure_default_collections
+    with engine.begin() as conn:
+        ensure_default_collections(conn)
+        if legacy_chunks:
+            _copy_legacy_chunks(conn)
+
+    # 기존 테이블에 새로 추가된 인덱스 생성 (create_all은 기존 테이블의 인덱스를 만들지 않음)
+    for table in Base.metadata.sorted_tables:
+        for index in table.indexes:
+            index.create(bind=engine, checkfirst=True)
+
+
+def _add_missing_columns():
+    """기존 테이블에 모델에 새로 추가된 컬럼 생성 (create_all은 컬럼을 추가하지 않음)"""
+    inspector = inspect(engine)
+    with engine.begin() as conn:
+        for table in Base.metadata.sorted_tables:
+            if not inspector.has_table(table.name):
+                continue
+            existing = {c["name"] for c in inspector.get_columns(table.name)}
+            for column in table.columns:
+                if column.name in existing:
+                    continue
+                ddl = (
+                    f'ALTER TABLE {table.name} ADD COLUMN IF NOT EXISTS "{column.name}" '
+                    f"{column.type.compile(dialect=engine.dialect)}"
+                )
+                if column.server_default is not None:
+                    default = column.server_default.arg
+                    default = getattr(default, "text", None) or f"'{default}'"
+                    ddl += f" DEFAULT {default}"
+                    if not column.nullable:
+                        ddl += " NOT NULL"
+                conn.execute(text(ddl))
+
+
+LEGACY_CHUNKS_TABLE = "document_chunks_legacy"
+
+
+def _detach_unpartitioned_chunks() -> bool:
+    """파티션이 아닌 기존 document_chunks 를 document_chunks_legacy 로 이름 변경
+
+    새 파티션 테이블과 이름이 겹치지 않도록 기본 키 제약, 시퀀스, 인덱스 이름도
+    정리한다. 데이터는 파티션 생성 후 _copy_legacy_chunks 에서 옮긴다.
+    """
+    with engine.begin() as conn:
+        relkind = conn.execute(text(
+            "SELECT relkind FROM pg_class WHERE oid = to_regclass('document_chunks')"
+        )).scalar()
+        if relkind != "r":
+            return conn.execute(text(
+                "SELECT to_regclass(:name) IS NOT NULL"
+            ), {"name": LEGACY_CHUNKS_TABLE}).scalar()
+
+        conn.execute(text(f"ALTER TABLE document_chunks RENAME TO {LEGACY_CHUNKS_TABLE}"))
+        conn.execute(text(
+            f"ALTER TABLE {LEGACY_CHUNKS_TABLE} "
+            f"RENAME CONSTRAINT document_chunks_pkey TO {LEGACY_CHUNKS_TABLE}_pkey"
+        ))
+        conn.execute(text(
+            f"ALTER SEQUENCE IF EXISTS document_chunks_id_seq RENAME TO {LEGACY_CHUNKS_TABLE}_id_seq"
+        ))
+        indexes = conn.execute(text(
+            "SELECT indexname FROM pg_indexes WHERE tablename = :table AND indexname <> :pkey"
+        ), {"table": LEGACY_CHUNKS_TABLE, "pkey": f"{LEGACY_CHUNKS_TABLE}_pkey"}).scalars()
+        for index in list(indexes):
+            conn.execute(text(f'DROP INDEX IF EXISTS "{index}"'))
+        return True
+
+
+def _copy_legacy_chunks(conn):
+    """기존 청크를 파티션 테이블로 복사 후 이전 테이블 삭제"""
+    columns = ", ".join(
+        f'"{c.name}"' for c in Base.metadata.tables["document_chunks"].columns
+    )
+    conn.execute(text(
+        f"INSERT INTO document_chunks ({columns}) "
+        f"SELECT {columns} FROM {LEGACY_CHUNKS_TABLE}"
+    ))
+    conn.execute(text(
+        "SELECT setval(pg_get_serial_sequence('document_chunks', 'id'), "
+        "COALESCE((SELECT MAX(id) FROM document_chunks), 0) + 1, false)"
+    ))
+    conn.execute(text(f"DROP TABLE {LEGACY_CHUNKS_TABLE}"))
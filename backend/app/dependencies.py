@@ -1,32 +1,73 @@
 """FastAPI 의존성 주입 설정"""
 
-from typing import Optional
-from fastapi import Depends
+import logging
+from contextlib import contextmanager, ExitStack
+from typing import Iterator, Optional
+from fastapi import Depends, HTTPException
 
 from app.config import Settings, get_settings
 from app.providers.base import LLMConfig, EmbeddingConfig
 from app.providers.registry import ProviderRegistry
+from app.providers.governor import govern_llm_provider, govern_embedding_provider
+from app.providers.instrumented import (
+    instrument_llm_provider,
+    instrument_embedding_provider,
+)
+from app.providers.failover import (
+    parse_chain_entry,
+    build_failover_llm_provider,
+    build_failover_embedding_provider,
+)
+from app.providers.pool import ProviderPool
+from app.providers.variants import select_llm_config, VariantLLMProvider
+from app.schemas import ChatQuery
+from app.metrics import record_cache
 from app.providers.llm.base import BaseLLMProvider
 from app.providers.embedding.base import BaseEmbeddingProvider
 
+logger = logging.getLogger(__name__)
+
 
 class ProviderManager:
-    """Provider 인스턴스 관리 (캐싱 및 상태 관리)"""
+    """Provider 인스턴스 관리 (설정별 풀, 기본 Provider 고정)"""
 
-    _llm_provider: Optional[BaseLLMProvider] = None
-    _embedding_provider: Optional[BaseEmbeddingProvider] = None
-    _current_llm_config: Optional[LLMConfig] = None
-    _current_embedding_config: Optional[EmbeddingConfig] = None
+    _pool: Optional[ProviderPool] = None
 
     @classmethod
-    def get_llm_config(cls, settings: Settings) -> LLMConfig:
-        """현재 설정에서 LLM Config 생성"""
+    def pool(cls) -> ProviderPool:
+        if cls._pool is None:
+            cls._pool = ProviderPool(max_idle=get_settings().provider_pool_max_idle)
+        return cls._pool
+
+    @staticmethod
+    def _pool_key(kind: str, config) -> tuple:
+        # temperature 는 호출마다 전달하므로 인스턴스 구분에 쓰지 않음
+        return (
+            kind,
+            config.provider,
+            config.model_name,
+            config.model_dump_json(exclude={"temperature"}),
+        )
+
+    @classmethod
+    def get_llm_config(
+        cls,
+        settings: Settings,
+        provider: Optional[str] = None,
+        model_name: Optional[str] = None,
+        temperature: Optional[float] = None,
+    ) -> LLMConfig:
+        """현재 설정에서 LLM Config 생성 (인자로 요청별 변경 가능)"""
+        if provider and provider != settings.llm_provider and not model_name:
+            raise ValueError("model_name is required when overriding the LLM provider")
+        provider = provider or settings.llm_provider
+        model_name = model_name or settings.llm_model
         return LLMConfig(
-            provider=settings.llm_provider,
-            model_name=settings.llm_model,
-            temperature=settings.llm_temperature,
-            api_key=settings.get_api_key_for_provider(settings.llm_provider),
-            base_url=settings.get_base_url_for_provider(settings.llm_provider),
+            provider=provider,
+            model_name=model_name,
+            temperature=settings.llm_temperature if temperature is None else temperature,
+            api_key=settings.get_api_key_for_provider(provider),
+            base_url=settings.get_base_url_for_provider(provider),
         )
 
     @classmethod
@@ -41,28 +82,137 @@ class ProviderManager:
         )
 
     @classmethod
-    def get_llm_provider(cls, settings: Settings) -> BaseLLMProvider:
-        """LLM Provider 인스턴스 반환 (캐싱)"""
-        config = cls.get_llm_config(settings)
+    def _build_llm_provider(cls, config: LLMConfig, settings: Settings) -> BaseLLMProvider:
+        """단일 LLM Provider 생성 (메트릭 + 호출 제한 적용)"""
+        return govern_llm_provider(
+            instrument_llm_provider(ProviderRegistry.get_llm_provider(config)),
+            config,
+            settings.llm_provider_limits.get(config.provider),
+            settings.provider_queue_timeout,
+        )
 
-        # 설정 변경 시 재생성
-        if cls._llm_provider is None or cls._current_llm_config != config:
-            cls._llm_provider = ProviderRegistry.get_llm_provider(config)
-            cls._current_llm_config = config
+    @classmethod
+    def _build_embedding_provider(
+        cls,
+        config: EmbeddingConfig,
+        settings: Settings
+    ) -> BaseEmbeddingProvider:
+        """단일 Embedding Provider 생성 (메트릭 + 호출 제한 적용)"""
+        return govern_embedding_provider(
+            instrument_embedding_provider(ProviderRegistry.get_embedding_provider(config)),
+            config,
+            settings.embedding_provider_limits.get(config.provider),
+            settings.provider_queue_timeout,
+        )
 
-        return cls._llm_provider
+    @classmethod
+    def _build_llm_chain(cls, config: LLMConfig, settings: Settings) -> BaseLLMProvider:
+        """기본 LLM + 장애 대응 체인"""
+        providers = [cls._build_llm_provider(config, settings)]
+        for entry in settings.llm_failover_chain:
+            try:
+                provider_name, model_name = parse_chain_entry(entry)
+                providers.append(cls._build_llm_provider(config.model_copy(update={
+                    "provider": provider_name,
+                    "model_name": model_name,
+                    "api_key": settings.get_api_key_for_provider(provider_name),
+                    "base_url": settings.get_base_url_for_provider(provider_name),
+                }), settings))
+            except Exception:
+                # 대체 Provider 생성 실패는 기본 Provider 사용을 막지 않음
+                logger.exception("Skipping LLM failover entry %s", entry)
+        return build_failover_llm_provider(providers, settings.provider_hedge_delay)
 
     @classmethod
-    def get_embedding_provider(cls, settings: Settings) -> BaseEmbeddingProvider:
-        """Embedding Provider 인스턴스 반환 (캐싱)"""
-        config = cls.get_embedding_config(settings)
+    def _build_embedding_chain(
+        cls,
+        config: EmbeddingConfig,
+        settings: Settings
+    ) -> BaseEmbeddingProvider:
+        """기본 Embedding + 장애 대응 체인 (모델이 다른 Provider 는 제외)"""
+        providers = [cls._build_embedding_provider(config, settings)]
+        for entry in settings.embedding_failover_chain:
+            try:
+                provider_name, model_name = parse_chain_entry(entry)
+                providers.append(cls._build_embedding_provider(config.model_copy(update={
+                    "provider": provider_name,
+                    "model_name": model_name,
+                    "api_key": settings.get_api_key_for_provider(provider_name),
+                    "base_url": settings.get_base_url_for_provider(provider_name),
+                }), settings))
+            except Exception:
+                logger.exception("Skipping embedding failover entry %s", entry)
+        return build_failover_embedding_provider(providers, settings.provider_hedge_delay)
 
-        # 설정 변경 시 재생성
-        if cls._embedding_provider is None or cls._current_embedding_config != config:
-            cls._embedding_provider = ProviderRegistry.get_embedding_provider(config)
-            cls._current_embedding_config = config
+    @classmethod
+    def get_llm_provider(
+        cls,
+        settings: Settings,
+        config: Optional[LLMConfig] = None,
+    ) -> BaseLLMProvider:
+        """LLM Provider 인스턴스 반환 (config 가 없으면 기본 Provider)"""
+        is_default = config is None
+        config = config or cls.get_llm_config(settings)
+        provider, hit = cls.pool().get(
+            cls._pool_key("llm", config),
+            lambda: cls._build_llm_chain(config, settings),
+            pin_as="llm" if is_default else None,
+        )
+        record_cache("llm_provider", hit)
+        return provider
 
-        return cls._embedding_provider
+    @classmethod
+    def get_embedding_provider(
+        cls,
+        settings: Settings,
+        config: Optional[EmbeddingConfig] = None,
+    ) -> BaseEmbeddingProvider:
+        """Embedding Provider 인스턴스 반환 (config 가 없으면 기본 Provider)"""
+        is_default = config is None
+        config = config or cls.get_embedding_config(settings)
+        provider, hit = cls.pool().get(
+            cls._pool_key("embedding", config),
+            lambda: cls._build_embedding_chain(config, settings),
+            pin_as="embedding" if is_default else None,
+        )
+        record_cache("embedding_provider", hit)
+        return provider
+
+    @classmethod
+    @contextmanager
+    def lease_llm_provider(
+        cls,
+        settings: Settings,
+        config: Optional[LLMConfig] = None,
+    ) -> Iterator[BaseLLMProvider]:
+        """요청 동안 LLM Provider 사용 (사용 중에는 풀에서 정리되지 않음)"""
+        is_default = config is None
+        config = config or cls.get_llm_config(settings)
+        with cls.pool().lease(
+            cls._pool_key("llm", config),
+            lambda: cls._build_llm_chain(config, settings),
+            pin_as="llm" if is_default else None,
+        ) as (provider, hit):
+            record_cache("llm_provider", hit)
+            yield provider
+
+    @classmethod
+    @contextmanager
+    def lease_embedding_provider(
+        cls,
+        settings: Settings,
+        config: Optional[EmbeddingConfig] = None,
+    ) -> Iterator[BaseEmbeddingProvider]:
+        """요청 동안 Embedding Provider 사용 (사용 중에는 풀에서 정리되지 않음)"""
+        is_default = config is None
+        config = config or cls.get_embedding_config(settings)
+        with cls.pool().lease(
+            cls._pool_key("embedding", config),
+            lambda: cls._build_embedding_chain(config, settings),
+            pin_as="embedding" if is_default else None,
+        ) as (provider, hit):
+            record_cache("embedding_provider", hit)
+            yield provider
 
     @classmethod
     def update_llm_provider(
@@ -70,9 +220,8 @@ class ProviderManager:
         provider_name: str,
         model_name: str,
     ):
-        """런타임에 LLM Provider 변경"""
-        cls._llm_provider = None  # 재생성 트리거
-        cls._current_llm_config = None
+        """런타임에 LLM Provider 변경 (이전 기본 Provider 는 유휴 정리 대상이 됨)"""
+        cls.pool().unpin("llm")
 
     @classmethod
     def update_embedding_provider(
@@ -80,29 +229,49 @@ class ProviderManager:
         provider_name: str,
         model_name: str,
     ):
-        """런타임에 Embedding Provider 변경"""
-        cls._embedding_provider = None  # 재생성 트리거
-        cls._current_embedding_config = None
+        """런타임에 Embedding Provider 변경 (이전 기본 Provider 는 유휴 정리 대상이 됨)"""
+        cls.pool().unpin("embedding")
 
     @classmethod
     def reset(cls):
         """모든 Provider 캐시 초기화"""
-        cls._llm_provider = None
-        cls._embedding_provider = None
-        cls._current_llm_config = None
-        cls._current_embedding_config = None
+        cls.pool().clear()
 
 
 # FastAPI 의존성 함수들
 def get_llm_provider(
     settings: Settings = Depends(get_settings)
-) -> BaseLLMProvider:
-    """LLM Provider 의존성"""
-    return ProviderManager.get_llm_provider(settings)
+) -> Iterator[BaseLLMProvider]:
+    """LLM Provider 의존성 (요청이 끝날 때까지 임대)"""
+    with ProviderManager.lease_llm_provider(settings) as provider:
+        yield provider
 
 
 def get_embedding_provider(
     settings: Settings = Depends(get_settings)
-) -> BaseEmbeddingProvider:
-    """Embedding Provider 의존성"""
-    return ProviderManager.get_embedding_provider(settings)
+) -> Iterator[BaseEmbeddingProvider]:
+    """Embedding Provider 의존성 (요청이 끝날 때까지 임대)"""
+    with ProviderManager.lease_embedding_provider(settings) as provider:
+        yield provider
+
+
+def get_chat_llm_provider(
+    query: ChatQuery,
+    settings: Settings = Depends(get_settings)
+) -> Iterator[BaseLLMProvider]:
+    """채팅 요청의 LLM Provider 의존성 (요청별 지정 / 트래픽 분할 적용)"""
+    with ExitStack() as stack:
+        try:
+            variant, config, temperature = select_llm_config(
+                settings,
+                provider=query.llm_provider,
+                model=query.llm_model,
+                temperature=query.temperature,
+                variant=query.variant,
+            )
+            provider = stack.enter_context(
+                ProviderManager.lease_llm_provider(settings, config)
+            )
+        except ValueError as e:
+            raise HTTPException(status_code=400, detail=str(e))
+        yield VariantLLMProvider(provider, variant, temperature) if variant else provider
@@ -1,16 +1,75 @@
+import asyncio
 from contextlib import asynccontextmanager
-from fastapi import FastAPI
+from fastapi import FastAPI, Request
+from fastapi.responses import JSONResponse, Response
 from fastapi.middleware.cors import CORSMiddleware
-from app.database import init_db
-from app.routers import documents, search, providers, models
+from app.config import get_settings
+from app.database import init_db, replica_router
+from app.routers import documents, search, providers, models, collections
+from app.providers.governor import ProviderBusyError
+from app.providers.failover import ProviderUnavailableError
+from app.providers.discovery import get_model_discovery
+from app.providers.health import get_health_monitor
+from app.metrics import render_metrics
+from app.tracing import setup_tracing
+from app.vectorstores import get_vector_store
+from app.warmup import readiness, warmup, mark_ready
 
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     # Startup
     init_db()
+
+    settings = get_settings()
+    warmup_task = None
+    if settings.warmup_enabled:
+        # 워밍업은 백그라운드로 진행, 완료 전까지 /ready 는 503 반환
+        warmup_task = asyncio.create_task(warmup(settings))
+    else:
+        mark_ready()
+
+    discovery_task = None
+    if settings.provider_discovery_refresh_interval > 0:
+        discovery_task = asyncio.create_task(
+            get_model_discovery().run_periodic_refresh(
+                settings.provider_discovery_refresh_interval
+            )
+        )
+
+    health_task = None
+    if settings.provider_health_check_interval > 0:
+        health_task = asyncio.create_task(
+            get_health_monitor().run_periodic(
+                settings, settings.provider_health_check_interval
+            )
+        )
+
+    replica_task = None
+    if replica_router.replicas and settings.database_replica_check_interval > 0:
+        # 복제본 상태/지연 점검 (첫 점검 전까지 읽기는 primary 사용)
+        replica_task = asyncio.create_task(
+            replica_router.run_periodic(settings.database_replica_check_interval)
+        )
+
+    # 프로세스 내장 벡터 인덱스: 저장된 인덱스 읽기 + document_chunks 와 증분 동기화
+    vector_store = get_vector_store()
+    vector_store_task = asyncio.create_task(
+        vector_store.run(settings.vector_index_sync_interval)
+    )
+
+    if settings.model_download_resume_on_startup:
+        # 재시작 전에 중단된 모델 다운로드 이어받기
+        await models.downloader.resume_incomplete_downloads()
+
     yield
     # Shutdown
+    if warmup_task and not warmup_task.done():
+        warmup_task.cancel()
+    for task in (discovery_task, health_task, replica_task, vector_store_task):
+        if task:
+            task.cancel()
+    await asyncio.to_thread(vector_store.close)
 
 
 app = FastAPI(
@@ -20,6 +79,9 @@ app = FastAPI(
     lifespan=lifespan
 )
 
+# Tracing (TRACING_EXPORTER 설정 시)
+setup_tracing(app, get_settings())
+
 # CORS middleware
 app.add_middleware(
     CORSMiddleware,
@@ -29,8 +91,29 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+@app.exception_handler(ProviderBusyError)
+async def provider_busy_handler(request: Request, exc: ProviderBusyError):
+    """Provider 대기열 타임아웃 → 429"""
+    return JSONResponse(
+        status_code=429,
+        content={"detail": str(exc)},
+        headers={"Retry-After": str(max(1, round(exc.retry_after)))},
+    )
+
+
+@app.exception_handler(ProviderUnavailableError)
+async def provider_unavailable_handler(request: Request, exc: ProviderUnavailableError):
+    """모든 Provider 실패 또는 서킷 브레이커 열림 → 503"""
+    return JSONResponse(
+        status_code=503,
+        content={"detail": str(exc)},
+        headers={"Retry-After": str(max(1, round(exc.retry_after)))},
+    )
+
+
 # Include routers
 app.include_router(documents.router, prefix="/api")
+app.include_router(collections.router, prefix="/api")
 app.include_router(search.router, prefix="/api")
 app.include_router(providers.router, prefix="/api")
 app.include_router(models.router, prefix="/api")
@@ -44,3 +127,29 @@ async def root():
 @app.get("/health")
 async def health_check():
     return {"status": "healthy"}
+
+
+@app.get("/health/replicas")
+async def replica_health():
+    """읽기 복제본 상태 (마지막 점검 결과와 복제 지연)"""
+    return replica_router.snapshot()
+
+
+@app.get("/ready")
+async def readiness_check():
+    """준비 상태 확인 (워밍업 완료 여부)"""
+    body = {
+        "ready": readiness.ready,
+        "status": readiness.status,
+        "steps": readiness.steps,
+        "error": readiness.error,
+        "attempts": readiness.attempts,
+    }
+    return JSONResponse(content=body, status_code=200 if readiness.ready else 503)
+
+
+@app.get("/metrics", include_in_schema=False)
+async def metrics():
+    """Prometheus 메트릭"""
+    body, content_type = render_metrics()
+    return Response(content=body, media_type=content_type)
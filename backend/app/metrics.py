@@ -0,0 +1,198 @@
+"""Prometheus 메트릭 정의 및 수집"""
+
+from prometheus_client import Counter, Histogram, CONTENT_TYPE_LATEST, generate_latest
+from prometheus_client.core import GaugeMetricFamily, CounterMetricFamily, REGISTRY
+from prometheus_client.registry import Collector
+
+# 파이프라인 단계별 소요 시간 (RAGService / PDFService)
+PIPELINE_STAGE_SECONDS = Histogram(
+    "rag_pipeline_stage_seconds",
+    "Time spent in each RAG pipeline stage",
+    ["service", "stage"],
+    buckets=(0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30, 60, 120),
+)
+
+# Provider 호출
+PROVIDER_REQUESTS = Counter(
+    "provider_requests_total",
+    "Provider calls by outcome",
+    ["kind", "provider", "model", "operation", "status"],
+)
+PROVIDER_LATENCY_SECONDS = Histogram(
+    "provider_request_seconds",
+    "Provider call latency",
+    ["kind", "provider", "model", "operation"],
+    buckets=(0.01, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30, 60, 120),
+)
+PROVIDER_TOKENS = Counter(
+    "provider_tokens_total",
+    "Tokens reported by LLM providers",
+    ["provider", "model", "type"],  # type: "prompt" | "completion"
+)
+
+# Governor 대기 시간
+PROVIDER_QUEUE_WAIT_SECONDS = Histogram(
+    "provider_queue_wait_seconds",
+    "Time spent waiting for a provider governor slot",
+    ["governor"],
+    buckets=(0.001, 0.01, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30),
+)
+
+# 장애 대응 (event: "failover" | "hedge" | "served_by_fallback")
+PROVIDER_FAILOVERS = Counter(
+    "provider_failover_events_total",
+    "Provider failover and hedged request events",
+    ["kind", "event"],
+)
+
+# LLM 트래픽 분할 변형별 호출
+LLM_VARIANT_REQUESTS = Counter(
+    "llm_variant_requests_total",
+    "LLM calls per traffic-split variant",
+    ["variant", "status"],
+)
+LLM_VARIANT_LATENCY_SECONDS = Histogram(
+    "llm_variant_request_seconds",
+    "LLM call latency per traffic-split variant",
+    ["variant"],
+    buckets=(0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30, 60, 120),
+)
+LLM_VARIANT_TOKENS = Counter(
+    "llm_variant_tokens_total",
+    "Tokens per traffic-split variant",
+    ["variant", "type"],  # type: "prompt" | "completion"
+)
+
+# 읽기 요청 라우팅 (target: "replica-N" | "primary_fallback")
+DB_READ_ROUTES = Counter(
+    "db_read_routes_total",
+    "Read-only sessions by routed database",
+    ["target"],
+)
+
+# 필터 검색 실행 전략 (strategy: "index" | "exact" | "iterative")
+SEARCH_STRATEGY = Counter(
+    "search_strategy_total",
+    "Vector searches by execution strategy",
+    ["strategy"],
+)
+
+# 캐시 조회
+CACHE_REQUESTS = Counter(
+    "cache_requests_total",
+    "Cache lookups by result",
+    ["cache", "result"],  # result: "hit" | "miss"
+)
+
+
+def track_stage(service: str, stage: str):
+    """파이프라인 단계 타이머 (with 문으로 사용)"""
+    return PIPELINE_STAGE_SECONDS.labels(service=service, stage=stage).time()
+
+
+def record_cache(cache: str, hit: bool):
+    """캐시 조회 결과 기록"""
+    CACHE_REQUESTS.labels(cache=cache, result="hit" if hit else "miss").inc()
+
+
+def record_token_usage(provider: str, model: str, usage: dict | None):
+    """LLMResponse.usage 의 토큰 수 기록"""
+    if not usage:
+        return
+    prompt = usage.get("prompt_tokens", usage.get("input_tokens"))
+    completion = usage.get("completion_tokens", usage.get("output_tokens"))
+    if prompt:
+        PROVIDER_TOKENS.labels(provider, model, "prompt").inc(prompt)
+    if completion:
+        PROVIDER_TOKENS.labels(provider, model, "completion").inc(completion)
+
+
+class RuntimeStateCollector(Collector):
+    """수집 시점에 상태를 읽는 메트릭 (DB 풀, Governor, 서킷 브레이커, Single-flight)"""
+
+    def describe(self):
+        # 등록 시 collect() 가 호출되지 않도록 (순환 import 방지)
+        return []
+
+    def collect(self):
+        from app.database import engine
+        from app.providers.governor import list_governors
+        from app.providers.circuit_breaker import list_breakers, CLOSED, HALF_OPEN, OPEN
+        from app.services.rag_service import search_flight, chat_flight
+
+        pool = engine.pool
+        pool_gauge = GaugeMetricFamily(
+            "db_pool_connections", "DB connection pool state", labels=["state"]
+        )
+        for state in ("size", "checkedin", "checkedout", "overflow"):
+            getter = getattr(pool, state, None)
+            if callable(getter):
+                pool_gauge.add_metric([state], getter())
+        yield pool_gauge
+
+        in_flight = GaugeMetricFamily(
+            "provider_in_flight", "Provider calls in flight", labels=["governor"]
+        )
+        queued = GaugeMetricFamily(
+            "provider_queued", "Provider calls waiting in queue", labels=["governor"]
+        )
+        rejected = CounterMetricFamily(
+            "provider_queue_rejected",
+            "Provider calls rejected by queue timeout",
+            labels=["governor"],
+        )
+        for governor in list_governors():
+            in_flight.add_metric([governor.name], governor.stats.in_flight)
+            queued.add_metric([governor.name], governor.stats.queued)
+            rejected.add_metric([governor.name], governor.stats.rejected)
+        yield in_flight
+        yield queued
+        yield rejected
+
+        circuit_state = GaugeMetricFamily(
+            "provider_circuit_state",
+            "Circuit breaker state (0=closed, 1=half_open, 2=open)",
+            labels=["breaker"],
+        )
+        error_rate = GaugeMetricFamily(
+            "provider_circuit_error_rate",
+            "Failure rate over the circuit breaker window",
+            labels=["breaker"],
+        )
+        opened = CounterMetricFamily(
+            "provider_circuit_opened",
+            "Times the circuit breaker has opened",
+            labels=["breaker"],
+        )
+        state_values = {CLOSED: 0, HALF_OPEN: 1, OPEN: 2}
+        for breaker in list_breakers():
+            circuit_state.add_metric([breaker.name], state_values[breaker.state])
+            error_rate.add_metric([breaker.name], breaker.error_rate())
+            opened.add_metric([breaker.name], breaker.times_opened)
+        yield circuit_state
+        yield error_rate
+        yield opened
+
+        executed = CounterMetricFamily(
+            "singleflight_executed",
+            "Computations executed by single-flight groups",
+            labels=["group"],
+        )
+        coalesced = CounterMetricFamily(
+            "singleflight_coalesced",
+            "Requests coalesced onto an in-flight computation",
+            labels=["group"],
+        )
+        for flight in (search_flight, chat_flight):
+            executed.add_metric([flight.name], flight.stats.executed)
+            coalesced.add_metric([flight.name], flight.stats.coalesced)
+        yield executed
+        yield coalesced
+
+
+REGISTRY.register(RuntimeStateCollector())
+
+
+def render_metrics() -> tuple[bytes, str]:
+    """Prometheus 텍스트 포맷 출력"""
+    return generate_latest(REGISTRY), CONTENT_TYPE_LATEST
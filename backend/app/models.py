@@ -1,8 +1,21 @@
-from sqlalchemy import Column, Integer, String, DateTime, Text
-from sqlalchemy.sql import func
+from sqlalchemy import Column, Integer, String, DateTime, Text, Index
+from sqlalchemy.dialects.postgresql import JSONB
+from sqlalchemy.sql import func, text
 from pgvector.sqlalchemy import Vector
+from app.config import get_settings
 from app.database import Base
 
+DEFAULT_COLLECTION = get_settings().collection_name
+
+
+class Collection(Base):
+    """문서 컬렉션 (팀/네임스페이스) - 컬렉션마다 청크 파티션 하나"""
+    __tablename__ = "collections"
+
+    id = Column(Integer, primary_key=True, index=True)
+    name = Column(String(32), nullable=False, unique=True)
+    created_at = Column(DateTime(timezone=True), server_default=func.now())
+
 
 class Document(Base):
     __tablename__ = "documents"
@@ -15,20 +28,83 @@ class Document(Base):
     page_count = Column(Integer)
     created_at = Column(DateTime(timezone=True), server_default=func.now())
     updated_at = Column(DateTime(timezone=True), onupdate=func.now())
+    collection = Column(
+        String(32), nullable=False, default=DEFAULT_COLLECTION,
+        server_default=DEFAULT_COLLECTION,
+    )
 
     # 임베딩 메타데이터
     embedding_provider = Column(String(50), default="openai")
     embedding_model = Column(String(100), default="text-embedding-3-small")
     embedding_dimension = Column(Integer, default=1536)
 
+    # 검색 필터용 메타데이터 (tags, department, language 등)
+    doc_metadata = Column(
+        "metadata", JSONB, nullable=False, default=dict,
+        server_default=text("'{}'::jsonb"),
+    )
+
+    __table_args__ = (
+        # 목록 조회 keyset 페이지네이션 (created_at, id)
+        Index("ix_documents_created_at_id", created_at.desc(), id.desc()),
+        # 컬렉션별 목록 조회
+        Index(
+            "ix_documents_collection_created_at_id",
+            collection, created_at.desc(), id.desc(),
+        ),
+        # Provider/모델 필터 + 정렬
+        Index(
+            "ix_documents_embedding_provider_model_created_at",
+            embedding_provider, embedding_model, created_at.desc(),
+        ),
+        # 파일명 접두어 검색 (LIKE 'prefix%')
+        Index(
+            "ix_documents_original_filename_prefix",
+            original_filename,
+            postgresql_ops={"original_filename": "varchar_pattern_ops"},
+        ),
+        # 메타데이터 포함(@>) 조건
+        Index(
+            "ix_documents_metadata",
+            doc_metadata,
+            postgresql_using="gin",
+            postgresql_ops={"metadata": "jsonb_path_ops"},
+        ),
+    )
+
 
 class DocumentChunk(Base):
+    """문서 청크 - collection 기준 LIST 파티션 (파티션별 ANN 인덱스)
+
+    파티션은 app.services.collection_service 에서 컬렉션 생성 시 만든다.
+    """
     __tablename__ = "document_chunks"
 
-    id = Column(Integer, primary_key=True, index=True)
+    id = Column(Integer, primary_key=True, autoincrement=True, index=True)
+    # 파티션 키는 기본 키에 포함되어야 함
+    collection = Column(
+        String(32), primary_key=True, default=DEFAULT_COLLECTION,
+        server_default=DEFAULT_COLLECTION,
+    )
     document_id = Column(Integer, nullable=False, index=True)
     chunk_index = Column(Integer, nullable=False)
     content = Column(Text, nullable=False)
     embedding = Column(Vector(1536))  # OpenAI embedding dimension
     page_number = Column(Integer)
     created_at = Column(DateTime(timezone=True), server_default=func.now())
+
+    # 문서 메타데이터 사본 (검색 시 documents 조인 없이 필터링)
+    doc_metadata = Column(
+        "metadata", JSONB, nullable=False, default=dict,
+        server_default=text("'{}'::jsonb"),
+    )
+
+    __table_args__ = (
+        Index(
+            "ix_document_chunks_metadata",
+            doc_metadata,
+            postgresql_using="gin",
+            postgresql_ops={"metadata": "jsonb_path_ops"},
+        ),
+        {"postgresql_partition_by": "LIST (collection)"},
+    )
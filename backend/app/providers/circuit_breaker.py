@@ -0,0 +1,167 @@
+"""Provider 서킷 브레이커
+
+연속 실패가 임계값에 도달하거나 최근 호출의 실패율이 기준을 넘으면 열림(open)
+상태가 되어 일정 시간 호출을 막고, 시간이 지나면 반열림(half_open) 상태에서
+한 번의 시도로 복구 여부를 판단한다. 기준보다 느린 호출은 실패로 계산한다.
+헬스 체크 결과와 실제 호출 결과가 같은 브레이커를 공유한다.
+"""
+
+import threading
+import time
+from collections import deque
+from typing import Optional
+
+CLOSED = "closed"
+OPEN = "open"
+HALF_OPEN = "half_open"
+
+
+class CircuitBreaker:
+    """연속 실패 / 실패율 기반 서킷 브레이커 (스레드 안전)"""
+
+    def __init__(
+        self,
+        name: str,
+        failure_threshold: int = 3,
+        reset_timeout: float = 30.0,
+        error_rate_threshold: float = 0.5,
+        window_size: int = 20,
+        min_calls: int = 10,
+        slow_call_seconds: Optional[float] = None,
+    ):
+        self.name = name
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.error_rate_threshold = error_rate_threshold
+        self.min_calls = min_calls
+        self.slow_call_seconds = slow_call_seconds
+        self._window: deque[bool] = deque(maxlen=window_size)  # True = 실패
+        self._lock = threading.Lock()
+        self._state = CLOSED
+        self._consecutive_failures = 0
+        self._opened_at = 0.0
+        self._half_open_probe = False
+        self.last_error: Optional[str] = None
+        self.total_failures = 0
+        self.times_opened = 0
+
+    @property
+    def state(self) -> str:
+        with self._lock:
+            return self._current_state()
+
+    def _current_state(self) -> str:
+        if self._state == OPEN and time.monotonic() - self._opened_at >= self.reset_timeout:
+            self._state = HALF_OPEN
+            self._half_open_probe = False
+        return self._state
+
+    def allow_request(self) -> bool:
+        """호출 허용 여부 (반열림 상태에서는 한 번의 시도만 허용)"""
+        with self._lock:
+            state = self._current_state()
+            if state == CLOSED:
+                return True
+            if state == HALF_OPEN and not self._half_open_probe:
+                self._half_open_probe = True
+                return True
+            return False
+
+    def release_probe(self):
+        """반열림 시도가 결과 없이 취소된 경우 다음 시도를 허용"""
+        with self._lock:
+            if self._state == HALF_OPEN:
+                self._half_open_probe = False
+
+    def retry_after(self) -> float:
+        """열림 상태가 끝날 때까지 남은 시간 (초)"""
+        with self._lock:
+            if self._current_state() != OPEN:
+                return 0.0
+            return max(0.0, self.reset_timeout - (time.monotonic() - self._opened_at))
+
+    def error_rate(self) -> float:
+        with self._lock:
+            return sum(self._window) / len(self._window) if self._window else 0.0
+
+    def record_success(self, latency: Optional[float] = None):
+        """성공 기록 (latency 가 느린 호출 기준을 넘으면 실패로 처리)"""
+        if (
+            latency is not None
+            and self.slow_call_seconds
+            and latency > self.slow_call_seconds
+        ):
+            self.record_failure(f"slow call ({latency:.1f}s)")
+            return
+        with self._lock:
+            self._window.append(False)
+            self._state = CLOSED
+            self._consecutive_failures = 0
+            self._half_open_probe = False
+            self.last_error = None
+
+    def record_failure(self, error: Optional[str] = None):
+        with self._lock:
+            self._window.append(True)
+            self._consecutive_failures += 1
+            self.total_failures += 1
+            self.last_error = error
+            state = self._current_state()
+            error_rate_exceeded = (
+                len(self._window) >= self.min_calls
+                and sum(self._window) / len(self._window) >= self.error_rate_threshold
+            )
+            if state == HALF_OPEN or (
+                state == CLOSED
+                and (self._consecutive_failures >= self.failure_threshold
+                     or error_rate_exceeded)
+            ):
+                self._state = OPEN
+                self._opened_at = time.monotonic()
+                self._half_open_probe = False
+                self._window.clear()
+                self.times_opened += 1
+
+    def snapshot(self) -> dict:
+        with self._lock:
+            return {
+                "name": self.name,
+                "state": self._current_state(),
+                "consecutive_failures": self._consecutive_failures,
+                "error_rate": (sum(self._window) / len(self._window)
+                               if self._window else 0.0),
+                "total_failures": self.total_failures,
+                "times_opened": self.times_opened,
+                "last_error": self.last_error,
+            }
+
+
+# (kind, provider, model) -> CircuitBreaker
+_breakers: dict[tuple[str, str, str], CircuitBreaker] = {}
+_breakers_lock = threading.Lock()
+
+
+def get_breaker(kind: str, provider: str, model: str) -> CircuitBreaker:
+    """Provider + 모델별 브레이커 (없으면 설정값으로 생성)"""
+    key = (kind, provider, model)
+    with _breakers_lock:
+        breaker = _breakers.get(key)
+        if breaker is None:
+            from app.config import get_settings
+            settings = get_settings()
+            breaker = CircuitBreaker(
+                f"{kind}:{provider}:{model}",
+                failure_threshold=settings.circuit_breaker_failure_threshold,
+                reset_timeout=settings.circuit_breaker_reset_timeout,
+                error_rate_threshold=settings.circuit_breaker_error_rate,
+                window_size=settings.circuit_breaker_window_size,
+                min_calls=settings.circuit_breaker_min_calls,
+                slow_call_seconds=settings.circuit_breaker_slow_call_seconds,
+            )
+            _breakers[key] = breaker
+        return breaker
+
+
+def list_breakers() -> list[CircuitBreaker]:
+    with _breakers_lock:
+        return list(_breakers.values())
@@ -0,0 +1,130 @@
+"""로컬 Provider 모델 탐색 - 비동기 조회, TTL 캐시, 백그라운드 갱신
+
+LM Studio / Ollama 처럼 실행 중인 서버에 모델 목록을 물어봐야 하는 Provider 는
+요청 경로에서 직접 조회하지 않고 캐시를 사용한다. TTL 이 지난 항목은 이전 값을
+바로 반환하면서 백그라운드에서 갱신한다 (stale-while-revalidate).
+"""
+
+import asyncio
+import time
+from dataclasses import dataclass
+from typing import Awaitable, Callable, Optional
+
+import httpx
+
+from app.config import get_settings
+
+
+async def _fetch_lmstudio_models(client: httpx.AsyncClient) -> list[str]:
+    """LM Studio에서 로드된 모델 목록 조회"""
+    base_url = get_settings().lmstudio_base_url
+    response = await client.get(f"{base_url}/models")
+    response.raise_for_status()
+    return [m["id"] for m in response.json().get("data", [])]
+
+
+async def _fetch_ollama_models(client: httpx.AsyncClient) -> list[str]:
+    """Ollama에서 설치된 모델 목록 조회"""
+    base_url = get_settings().ollama_base_url
+    response = await client.get(f"{base_url}/api/tags")
+    response.raise_for_status()
+    return [m["name"] for m in response.json().get("models", [])]
+
+
+ModelFetcher = Callable[[httpx.AsyncClient], Awaitable[list[str]]]
+
+FETCHERS: dict[str, ModelFetcher] = {
+    "lmstudio": _fetch_lmstudio_models,
+    "ollama": _fetch_ollama_models,
+}
+
+
+@dataclass
+class DiscoveryEntry:
+    """Provider별 조회 결과"""
+    models: list[str]
+    fetched_at: float
+    error: Optional[str] = None
+
+
+class ModelDiscovery:
+    """모델 목록 캐시"""
+
+    def __init__(self, ttl: float = 30.0, timeout: float = 2.0):
+        self.ttl = ttl
+        self.timeout = timeout
+        self._cache: dict[str, DiscoveryEntry] = {}
+        self._refreshing: dict[str, asyncio.Task] = {}
+
+    def supports(self, provider_name: str) -> bool:
+        return provider_name in FETCHERS
+
+    async def _fetch(self, provider_name: str) -> DiscoveryEntry:
+        try:
+            async with httpx.AsyncClient(timeout=self.timeout) as client:
+                models = await FETCHERS[provider_name](client)
+            entry = DiscoveryEntry(models=models, fetched_at=time.monotonic())
+        except Exception as e:
+            # 서버가 꺼져 있으면 빈 목록 (이전 목록이 있으면 유지)
+            previous = self._cache.get(provider_name)
+            entry = DiscoveryEntry(
+                models=previous.models if previous else [],
+                fetched_at=time.monotonic(),
+                error=str(e) or type(e).__name__,
+            )
+        self._cache[provider_name] = entry
+        return entry
+
+    def _refresh(self, provider_name: str) -> asyncio.Task:
+        """진행 중인 갱신이 있으면 공유, 없으면 새로 시작"""
+        task = self._refreshing.get(provider_name)
+        if task is None:
+            task = asyncio.create_task(self._fetch(provider_name))
+            self._refreshing[provider_name] = task
+            task.add_done_callback(lambda _: self._refreshing.pop(provider_name, None))
+        return task
+
+    async def get_models(self, provider_name: str) -> list[str]:
+        """모델 목록 (캐시가 없을 때만 조회를 기다림)"""
+        entry = self._cache.get(provider_name)
+        if entry is None:
+            entry = await asyncio.shield(self._refresh(provider_name))
+        elif time.monotonic() - entry.fetched_at > self.ttl:
+            self._refresh(provider_name)
+        return entry.models
+
+    async def refresh_all(self):
+        """모든 Provider 동시 갱신"""
+        await asyncio.gather(*[self._refresh(name) for name in FETCHERS])
+
+    async def run_periodic_refresh(self, interval: float):
+        """주기적으로 캐시 갱신 (lifespan 에서 Task 로 실행)"""
+        while True:
+            await self.refresh_all()
+            await asyncio.sleep(interval)
+
+    def snapshot(self) -> dict:
+        now = time.monotonic()
+        return {
+            name: {
+                "models": entry.models,
+                "age_seconds": round(now - entry.fetched_at, 1),
+                "error": entry.error,
+            }
+            for name, entry in self._cache.items()
+        }
+
+
+_discovery: Optional[ModelDiscovery] = None
+
+
+def get_model_discovery() -> ModelDiscovery:
+    """전역 ModelDiscovery (설정값으로 생성)"""
+    global _discovery
+    if _discovery is None:
+        settings = get_settings()
+        _discovery = ModelDiscovery(
+            ttl=settings.provider_discovery_ttl,
+            timeout=settings.provider_discovery_timeout,
+        )
+    return _discovery
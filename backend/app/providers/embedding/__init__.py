@@ -1,13 +1,29 @@
 """Embedding Provider 모듈"""
 
+import importlib
+
 from .base import BaseEmbeddingProvider
-from .openai import OpenAIEmbeddingProvider
-from .huggingface import HuggingFaceEmbeddingProvider
-from .ollama import OllamaEmbeddingProvider
+
+# 구현 클래스는 접근 시점에 import (무거운 SDK 지연 로딩)
+_LAZY_EXPORTS = {
+    "OpenAIEmbeddingProvider": ".openai",
+    "HuggingFaceEmbeddingProvider": ".huggingface",
+    "OllamaEmbeddingProvider": ".ollama",
+    "FakeEmbeddingProvider": ".fake",
+}
+
+
+def __getattr__(name: str):
+    if name in _LAZY_EXPORTS:
+        module = importlib.import_module(_LAZY_EXPORTS[name], __name__)
+        return getattr(module, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
 
 __all__ = [
     "BaseEmbeddingProvider",
     "OpenAIEmbeddingProvider",
     "HuggingFaceEmbeddingProvider",
     "OllamaEmbeddingProvider",
+    "FakeEmbeddingProvider",
 ]
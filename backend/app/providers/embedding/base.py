@@ -34,3 +34,7 @@ class BaseEmbeddingProvider(ABC):
     async def health_check(self) -> bool:
         """Provider 연결 상태 확인"""
         pass
+
+    async def warmup(self) -> None:
+        """시작 시 사전 준비 (로컬 모델 로딩 등, 기본은 아무것도 하지 않음)"""
+        return None
@@ -0,0 +1,60 @@
+"""Fake Embedding Provider - 부하 테스트/벤치마크용 결정적 해시 임베딩"""
+
+import hashlib
+import math
+import re
+
+from app.providers.base import EmbeddingConfig
+from .base import BaseEmbeddingProvider
+
+_TOKEN_RE = re.compile(r"\w+")
+
+
+def hash_embed(text: str, dimension: int) -> list[float]:
+    """단어를 feature hashing 으로 투영한 dimension 차원 단위 벡터
+
+    같은 단어를 공유하는 텍스트는 코사인 유사도가 높아지므로
+    외부 서비스 없이도 의미 있는 검색 결과를 얻을 수 있다.
+    """
+    vector = [0.0] * dimension
+    for token in _TOKEN_RE.findall(text.lower()):
+        digest = hashlib.blake2b(token.encode(), digest_size=8).digest()
+        value = int.from_bytes(digest, "little")
+        index = value % dimension
+        sign = 1.0 if (value >> 63) & 1 else -1.0
+        vector[index] += sign
+    norm = math.sqrt(sum(v * v for v in vector))
+    if norm == 0:
+        vector[0] = 1.0
+        return vector
+    return [v / norm for v in vector]
+
+
+class FakeEmbeddingProvider(BaseEmbeddingProvider):
+    """결정적 해시 임베딩 Provider (네트워크/모델 불필요, 차원은 설정값 사용)"""
+
+    provider_name = "fake"
+
+    MODEL_DIMENSIONS = {
+        "hash": 1536,
+    }
+
+    def __init__(self, config: EmbeddingConfig):
+        super().__init__(config)
+        self.dimension = config.dimension
+
+    async def embed_query(self, text: str) -> list[float]:
+        """단일 쿼리 임베딩"""
+        return hash_embed(text, self.dimension)
+
+    async def embed_documents(self, texts: list[str]) -> list[list[float]]:
+        """다중 문서 임베딩"""
+        return [hash_embed(text, self.dimension) for text in texts]
+
+    def get_available_models(self) -> list[str]:
+        """사용 가능한 모델 목록 반환"""
+        return list(self.MODEL_DIMENSIONS.keys())
+
+    async def health_check(self) -> bool:
+        """항상 정상"""
+        return True
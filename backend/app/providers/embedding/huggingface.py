@@ -84,6 +84,11 @@ class HuggingFaceEmbeddingProvider(BaseEmbeddingProvider):
         )
         return embeddings.tolist()
 
+    async def warmup(self) -> None:
+        """모델 로딩 및 워밍업 인코딩"""
+        await asyncio.to_thread(self._load_model)
+        await self.embed_query("warmup")
+
     def get_available_models(self) -> list[str]:
         """사용 가능한 모델 목록 반환"""
         return list(self.MODEL_DIMENSIONS.keys())
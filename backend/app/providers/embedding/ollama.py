@@ -56,6 +56,10 @@ class OllamaEmbeddingProvider(BaseEmbeddingProvider):
         embeddings = await asyncio.gather(*tasks)
         return list(embeddings)
 
+    async def warmup(self) -> None:
+        """Ollama 서버에 임베딩 모델을 미리 로드"""
+        await self._embed("warmup")
+
     def get_available_models(self) -> list[str]:
         """Ollama에서 사용 가능한 임베딩 모델 목록"""
         try:
@@ -1,10 +1,13 @@
 """OpenAI Embedding Provider"""
 
+import httpx
 from langchain_openai import OpenAIEmbeddings
 
 from app.providers.base import EmbeddingConfig
 from .base import BaseEmbeddingProvider
 
+OPENAI_API_BASE = "https://api.openai.com/v1"
+
 
 class OpenAIEmbeddingProvider(BaseEmbeddingProvider):
     """OpenAI Embedding Provider"""
@@ -38,9 +41,14 @@ class OpenAIEmbeddingProvider(BaseEmbeddingProvider):
         return list(self.MODEL_DIMENSIONS.keys())
 
     async def health_check(self) -> bool:
-        """Provider 연결 상태 확인"""
+        """Provider 연결 상태 확인 (모델 조회 API, 토큰 비용 없음)"""
         try:
-            await self.embed_query("test")
-            return True
+            async with httpx.AsyncClient() as client:
+                response = await client.get(
+                    f"{self.config.base_url or OPENAI_API_BASE}/models/{self.config.model_name}",
+                    headers={"Authorization": f"Bearer {self.config.api_key}"},
+                    timeout=5.0
+                )
+                return response.status_code == 200
         except Exception:
             return False
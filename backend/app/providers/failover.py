@@ -0,0 +1,296 @@
+"""Provider 장애 대응 - 서킷 브레이커 기반 순차 전환 및 헤지 요청
+
+설정된 순서대로 Provider 를 시도하며, 브레이커가 열린 Provider 는 호출하지 않고
+건너뛴다. 모든 브레이커가 열려 있으면 타임아웃을 기다리지 않고 바로 실패한다.
+hedge_delay 가 설정되면 첫 Provider 가 그 시간 안에 응답하지 않을 때 다음
+Provider 에도 요청을 보내 먼저 성공한 응답을 사용한다.
+"""
+
+import asyncio
+import logging
+import time
+from dataclasses import dataclass
+from typing import Any, AsyncIterator, Awaitable, Callable, Union
+
+from app.metrics import PROVIDER_FAILOVERS
+from app.providers.base import LLMMessage, LLMResponse
+from app.providers.circuit_breaker import CircuitBreaker, get_breaker
+from app.providers.governor import ProviderBusyError
+from app.providers.llm.base import BaseLLMProvider
+from app.providers.embedding.base import BaseEmbeddingProvider
+from app.tracing import trace_span
+
+logger = logging.getLogger(__name__)
+
+
+class ProviderUnavailableError(RuntimeError):
+    """사용 가능한 Provider 가 없음 (모두 실패했거나 브레이커가 열림)"""
+
+    def __init__(self, kind: str, errors: list[str], retry_after: float = 0.0):
+        detail = "; ".join(errors) if errors else "all circuit breakers are open"
+        super().__init__(f"No {kind} provider available: {detail}")
+        self.kind = kind
+        self.errors = errors
+        self.retry_after = retry_after
+
+
+@dataclass
+class Candidate:
+    """장애 대응 체인의 Provider"""
+    provider: Union[BaseLLMProvider, BaseEmbeddingProvider]
+    breaker: CircuitBreaker
+
+
+def _describe(candidate: Candidate) -> str:
+    return f"{candidate.provider.provider_name}:{candidate.provider.config.model_name}"
+
+
+def _record_served(kind: str, candidate: Candidate, index: int, span=None) -> None:
+    """실제로 응답한 Provider/모델 기록 (기본 Provider 가 아니면 경고 로그)"""
+    if span is not None:
+        span.set_attribute("failover.served_by", _describe(candidate))
+        span.set_attribute("failover.fallback", index > 0)
+    if index > 0:
+        PROVIDER_FAILOVERS.labels(kind, "served_by_fallback").inc()
+        logger.warning("%s request served by fallback %s", kind, _describe(candidate))
+
+
+async def _call(candidate: Candidate, fn: Callable[[Any], Awaitable[Any]]) -> Any:
+    """호출 결과를 브레이커에 기록 (헤지에서 취소된 호출은 기록하지 않음)"""
+    started = time.perf_counter()
+    try:
+        result = await fn(candidate.provider)
+    except (asyncio.CancelledError, ProviderBusyError):
+        # 취소(헤지 패배)나 로컬 대기열 초과는 Provider 장애가 아님
+        candidate.breaker.release_probe()
+        raise
+    except Exception as e:
+        candidate.breaker.record_failure(str(e) or type(e).__name__)
+        raise
+    candidate.breaker.record_success(time.perf_counter() - started)
+    return result
+
+
+async def run_with_failover(
+    kind: str,
+    candidates: list[Candidate],
+    fn: Callable[[Any], Awaitable[Any]],
+    hedge_delay: float = 0.0,
+) -> Any:
+    """브레이커가 닫힌 Provider 를 순서대로 시도 (hedge_delay 후 다음 Provider 병행)"""
+    remaining = iter(enumerate(candidates))
+    running: dict[asyncio.Task, int] = {}
+    errors: list[str] = []
+    busy_errors: list[ProviderBusyError] = []
+
+    def start_next() -> bool:
+        for index, candidate in remaining:
+            if candidate.breaker.allow_request():
+                running[asyncio.create_task(_call(candidate, fn))] = index
+                return True
+            errors.append(f"{_describe(candidate)}: circuit open")
+        return False
+
+    if not start_next():
+        raise ProviderUnavailableError(
+            kind, errors, min(c.breaker.retry_after() for c in candidates)
+        )
+
+    hedging = hedge_delay > 0
+    with trace_span(f"{kind}.failover") as span:
+        try:
+            while running:
+                done, _ = await asyncio.wait(
+                    set(running),
+                    timeout=hedge_delay if hedging else None,
+                    return_when=asyncio.FIRST_COMPLETED,
+                )
+                if not done:
+                    # 응답 지연 - 다음 Provider 로 헤지 요청
+                    if start_next():
+                        PROVIDER_FAILOVERS.labels(kind, "hedge").inc()
+                    else:
+                        hedging = False
+                    continue
+
+                for task in done:
+                    index = running.pop(task)
+                    error = task.exception()
+                    if error is None:
+                        _record_served(kind, candidates[index], index, span)
+                        return task.result()
+                    if isinstance(error, ProviderBusyError):
+                        busy_errors.append(error)
+                    errors.append(f"{_describe(candidates[index])}: {error}")
+
+                if not running and start_next():
+                    PROVIDER_FAILOVERS.labels(kind, "failover").inc()
+        finally:
+            for task in running:
+                task.cancel()
+
+    if busy_errors and len(busy_errors) == len(errors):
+        # 모든 Provider 가 대기열 초과 → 가장 빨리 재시도 가능한 오류를 429 로 전달
+        raise min(busy_errors, key=lambda e: e.retry_after)
+    raise ProviderUnavailableError(kind, errors)
+
+
+class FailoverLLMProvider(BaseLLMProvider):
+    """여러 LLM Provider 를 장애 대응 체인으로 묶은 Provider (첫 번째가 기본)"""
+
+    def __init__(self, candidates: list[Candidate], hedge_delay: float = 0.0):
+        primary = candidates[0].provider
+        super().__init__(primary.config)
+        self.provider_name = primary.provider_name
+        self.candidates = candidates
+        self.hedge_delay = hedge_delay
+
+    async def generate(
+        self,
+        messages: list[LLMMessage],
+        **kwargs
+    ) -> LLMResponse:
+        return await run_with_failover(
+            "llm",
+            self.candidates,
+            lambda provider: provider.generate(messages, **kwargs),
+            self.hedge_delay,
+        )
+
+    async def generate_stream(
+        self,
+        messages: list[LLMMessage],
+        **kwargs
+    ) -> AsyncIterator[str]:
+        """스트리밍 응답 (첫 청크를 받기 전까지만 다음 Provider 로 전환)"""
+        errors = []
+        busy_errors = []
+        for index, candidate in enumerate(self.candidates):
+            if not candidate.breaker.allow_request():
+                errors.append(f"{_describe(candidate)}: circuit open")
+                continue
+            started = time.perf_counter()
+            stream = candidate.provider.generate_stream(messages, **kwargs)
+            try:
+                first = await stream.__anext__()
+            except StopAsyncIteration:
+                candidate.breaker.record_success(time.perf_counter() - started)
+                return
+            except ProviderBusyError as e:
+                candidate.breaker.release_probe()
+                busy_errors.append(e)
+                errors.append(f"{_describe(candidate)}: {e}")
+                continue
+            except Exception as e:
+                candidate.breaker.record_failure(str(e) or type(e).__name__)
+                errors.append(f"{_describe(candidate)}: {e}")
+                continue
+
+            _record_served("llm", candidate, index)
+            yield first
+            try:
+                async for chunk in stream:
+                    yield chunk
+            except Exception as e:
+                candidate.breaker.record_failure(str(e) or type(e).__name__)
+                raise
+            candidate.breaker.record_success(time.perf_counter() - started)
+            return
+
+        if busy_errors and len(busy_errors) == len(errors):
+            raise min(busy_errors, key=lambda e: e.retry_after)
+        raise ProviderUnavailableError(
+            "llm", errors, min(c.breaker.retry_after() for c in self.candidates)
+        )
+
+    def get_available_models(self) -> list[str]:
+        return self.candidates[0].provider.get_available_models()
+
+    async def health_check(self) -> bool:
+        return await self.candidates[0].provider.health_check()
+
+    async def warmup(self) -> None:
+        await self.candidates[0].provider.warmup()
+
+
+class FailoverEmbeddingProvider(BaseEmbeddingProvider):
+    """같은 모델을 제공하는 Provider 들의 장애 대응 체인 (질의 임베딩에만 적용)"""
+
+    def __init__(self, candidates: list[Candidate], hedge_delay: float = 0.0):
+        primary = candidates[0].provider
+        super().__init__(primary.config)
+        self.provider_name = primary.provider_name
+        self.dimension = primary.dimension
+        self.candidates = candidates
+        self.hedge_delay = hedge_delay
+
+    async def embed_query(self, text: str) -> list[float]:
+        return await run_with_failover(
+            "embedding",
+            self.candidates,
+            lambda provider: provider.embed_query(text),
+            self.hedge_delay,
+        )
+
+    async def embed_documents(self, texts: list[str]) -> list[list[float]]:
+        """문서 임베딩은 기본 Provider 만 사용 (저장되는 벡터와 기록되는 Provider 일치)"""
+        return await run_with_failover(
+            "embedding",
+            self.candidates[:1],
+            lambda provider: provider.embed_documents(texts),
+        )
+
+    def get_available_models(self) -> list[str]:
+        return self.candidates[0].provider.get_available_models()
+
+    async def health_check(self) -> bool:
+        return await self.candidates[0].provider.health_check()
+
+    async def warmup(self) -> None:
+        await self.candidates[0].provider.warmup()
+
+
+def parse_chain_entry(entry: str) -> tuple[str, str]:
+    """"provider:model" 문자열 분리"""
+    provider, _, model = entry.partition(":")
+    if not provider or not model:
+        raise ValueError(f"Invalid failover entry (expected provider:model): {entry}")
+    return provider, model
+
+
+def _breaker(kind: str, provider) -> CircuitBreaker:
+    return get_breaker(kind, provider.provider_name, provider.config.model_name)
+
+
+def build_failover_llm_provider(
+    providers: list[BaseLLMProvider],
+    hedge_delay: float = 0.0,
+) -> BaseLLMProvider:
+    """장애 대응 체인으로 묶음 (단일 Provider 도 브레이커로 빠른 실패 적용)"""
+    return FailoverLLMProvider(
+        [Candidate(p, _breaker("llm", p)) for p in providers],
+        hedge_delay,
+    )
+
+
+def build_failover_embedding_provider(
+    providers: list[BaseEmbeddingProvider],
+    hedge_delay: float = 0.0,
+) -> BaseEmbeddingProvider:
+    """기본 Provider 와 같은 모델(다른 엔드포인트/키)만 장애 대응 체인으로 묶음"""
+    primary = providers[0]
+    compatible = [primary]
+    for p in providers[1:]:
+        if (p.config.model_name != primary.config.model_name
+                or p.dimension != primary.dimension):
+            logger.warning(
+                "Skipping embedding failover %s:%s (model differs from %s:%s)",
+                p.provider_name, p.config.model_name,
+                primary.provider_name, primary.config.model_name,
+            )
+            continue
+        compatible.append(p)
+    return FailoverEmbeddingProvider(
+        [Candidate(p, _breaker("embedding", p)) for p in compatible],
+        hedge_delay,
+    )
@@ -0,0 +1,319 @@
+"""Provider 호출 제한 - 토큰 버킷 속도 제한, 동시성 제한, FIFO 대기열"""
+
+import asyncio
+import time
+from contextlib import asynccontextmanager
+from dataclasses import dataclass
+from typing import AsyncIterator, Optional
+
+from app.config import ProviderLimits
+from app.providers.base import LLMConfig, EmbeddingConfig, LLMMessage, LLMResponse
+from app.providers.llm.base import BaseLLMProvider
+from app.providers.embedding.base import BaseEmbeddingProvider
+from app.providers.wrappers import LLMProviderWrapper, EmbeddingProviderWrapper
+from app.metrics import PROVIDER_QUEUE_WAIT_SECONDS
+
+
+class ProviderBusyError(RuntimeError):
+    """대기열 타임아웃 내에 호출 슬롯을 얻지 못함"""
+
+    def __init__(self, provider: str, waited: float, retry_after: float = 0.0):
+        super().__init__(
+            f"Provider {provider} is busy (waited {waited:.1f}s in queue)"
+        )
+        self.provider = provider
+        self.waited = waited
+        self.retry_after = retry_after
+
+
+class TokenBucket:
+    """분당 용량 기반 토큰 버킷"""
+
+    def __init__(self, per_minute: int):
+        self.capacity = float(per_minute)
+        self.rate = per_minute / 60.0  # 초당 충전량
+        self.tokens = self.capacity
+        self.updated_at = time.monotonic()
+
+    def _refill(self):
+        now = time.monotonic()
+        self.tokens = min(
+            self.capacity,
+            self.tokens + (now - self.updated_at) * self.rate,
+        )
+        self.updated_at = now
+
+    def time_until(self, amount: float) -> float:
+        """amount 만큼 사용 가능해질 때까지 남은 시간 (초)"""
+        self._refill()
+        amount = min(amount, self.capacity)
+        if self.tokens >= amount:
+            return 0.0
+        return (amount - self.tokens) / self.rate
+
+    def consume(self, amount: float):
+        """토큰 차감 (음수 잔량 허용 - 이후 충전으로 상환)"""
+        self._refill()
+        self.tokens -= amount
+
+    def refund(self, amount: float):
+        """예상보다 적게 사용한 토큰 반환"""
+        self._refill()
+        self.tokens = min(self.capacity, self.tokens + amount)
+
+
+@dataclass
+class GovernorStats:
+    """대기 시간 및 호출 통계"""
+    admitted: int = 0
+    rejected: int = 0
+    in_flight: int = 0
+    queued: int = 0
+    wait_seconds_total: float = 0.0
+    wait_seconds_max: float = 0.0
+
+
+class ProviderGovernor:
+    """단일 Provider 호출 제한기
+
+    요청은 FIFO 순서로 입장(admission) 하며, 입장한 요청만 속도 제한과
+    동시성 슬롯을 기다리므로 뒤에 온 작은 요청이 앞지르지 않는다.
+    """
+
+    def __init__(self, name: str, limits: ProviderLimits, queue_timeout: float):
+        self.name = name
+        self.limits = limits
+        self.queue_timeout = queue_timeout
+        self._admission = asyncio.Lock()  # FIFO 대기열
+        self._semaphore = (
+            asyncio.Semaphore(limits.max_concurrency)
+            if limits.max_concurrency else None
+        )
+        self._requests = (
+            TokenBucket(limits.requests_per_minute)
+            if limits.requests_per_minute else None
+        )
+        self._tokens = (
+            TokenBucket(limits.tokens_per_minute)
+            if limits.tokens_per_minute else None
+        )
+        self.stats = GovernorStats()
+
+    async def _admit(self, estimated_tokens: int):
+        async with self._admission:
+            while True:
+                delay = 0.0
+                if self._requests:
+                    delay = max(delay, self._requests.time_until(1))
+                if self._tokens and estimated_tokens:
+                    delay = max(delay, self._tokens.time_until(estimated_tokens))
+                if delay <= 0:
+                    break
+                await asyncio.sleep(delay)
+
+            if self._semaphore:
+                await self._semaphore.acquire()
+
+            if self._requests:
+                self._requests.consume(1)
+            if self._tokens and estimated_tokens:
+                self._tokens.consume(estimated_tokens)
+
+    def retry_after(self, estimated_tokens: int = 0) -> float:
+        """거절된 요청이 다시 시도하기까지 권장 대기 시간 (초)
+
+        속도 제한이 원인이면 버킷 충전 시간, 동시성 슬롯/대기열이 원인이면
+        대기열 타임아웃을 기준으로 한다.
+        """
+        delay = 0.0
+        if self._requests:
+            delay = max(delay, self._requests.time_until(1))
+        if self._tokens and estimated_tokens:
+            delay = max(delay, self._tokens.time_until(estimated_tokens))
+        if delay <= 0 and (
+            self.stats.queued > 1
+            or (self._semaphore is not None and self._semaphore.locked())
+        ):
+            delay = self.queue_timeout
+        return delay
+
+    @asynccontextmanager
+    async def slot(self, estimated_tokens: int = 0):
+        """호출 슬롯 획득 (대기열 타임아웃 초과 시 ProviderBusyError)"""
+        started = time.monotonic()
+        self.stats.queued += 1
+        try:
+            await asyncio.wait_for(
+                self._admit(estimated_tokens),
+                timeout=self.queue_timeout,
+            )
+        except asyncio.TimeoutError:
+            self.stats.rejected += 1
+            raise ProviderBusyError(
+                self.name,
+                time.monotonic() - started,
+                self.retry_after(estimated_tokens),
+            )
+        finally:
+            self.stats.queued -= 1
+
+        waited = time.monotonic() - started
+        PROVIDER_QUEUE_WAIT_SECONDS.labels(governor=self.name).observe(waited)
+        self.stats.admitted += 1
+        self.stats.wait_seconds_total += waited
+        self.stats.wait_seconds_max = max(self.stats.wait_seconds_max, waited)
+        self.stats.in_flight += 1
+        try:
+            yield self
+        finally:
+            self.stats.in_flight -= 1
+            if self._semaphore:
+                self._semaphore.release()
+
+    def settle_tokens(self, estimated: int, actual: Optional[int]):
+        """실제 사용 토큰 수로 버킷 보정"""
+        if not self._tokens or actual is None:
+            return
+        if actual > estimated:
+            self._tokens.consume(actual - estimated)
+        elif actual < estimated:
+            self._tokens.refund(estimated - actual)
+
+    def snapshot(self) -> dict:
+        """현재 통계"""
+        stats = self.stats
+        return {
+            "provider": self.name,
+            "admitted": stats.admitted,
+            "rejected": stats.rejected,
+            "in_flight": stats.in_flight,
+            "queued": stats.queued,
+            "wait_seconds_avg": (
+                stats.wait_seconds_total / stats.admitted
+                if stats.admitted else 0.0
+            ),
+            "wait_seconds_max": stats.wait_seconds_max,
+        }
+
+
+# Provider 인스턴스가 재생성되어도 제한 상태가 유지되도록 전역 보관
+_governors: dict[str, ProviderGovernor] = {}
+
+
+def get_governor(
+    kind: str,
+    provider: str,
+    limits: ProviderLimits,
+    queue_timeout: float,
+) -> ProviderGovernor:
+    """kind("llm"/"embedding") + provider 별 Governor 반환 (설정 변경 시 재생성)"""
+    key = f"{kind}:{provider}"
+    governor = _governors.get(key)
+    if (governor is None or governor.limits != limits
+            or governor.queue_timeout != queue_timeout):
+        governor = ProviderGovernor(key, limits, queue_timeout)
+        _governors[key] = governor
+    return governor
+
+
+def list_governors() -> list[ProviderGovernor]:
+    """등록된 모든 Governor"""
+    return list(_governors.values())
+
+
+def estimate_tokens(text: str) -> int:
+    """대략적인 토큰 수 추정 (영문 기준 4글자 ≈ 1토큰)"""
+    return max(1, len(text) // 4)
+
+
+def _usage_total_tokens(usage: Optional[dict]) -> Optional[int]:
+    """LLMResponse.usage 에서 총 토큰 수 추출"""
+    if not usage:
+        return None
+    if "total_tokens" in usage:
+        return usage["total_tokens"]
+    prompt = usage.get("prompt_tokens", usage.get("input_tokens"))
+    completion = usage.get("completion_tokens", usage.get("output_tokens"))
+    if prompt is None and completion is None:
+        return None
+    return (prompt or 0) + (completion or 0)
+
+
+class GovernedLLMProvider(LLMProviderWrapper):
+    """호출 제한이 적용된 LLM Provider 래퍼"""
+
+    def __init__(self, inner: BaseLLMProvider, governor: ProviderGovernor):
+        super().__init__(inner)
+        self.governor = governor
+
+    def _estimate(self, messages: list[LLMMessage]) -> int:
+        prompt = sum(estimate_tokens(m.content) for m in messages)
+        return prompt + (self.config.max_tokens or 512)
+
+    async def generate(
+        self,
+        messages: list[LLMMessage],
+        **kwargs
+    ) -> LLMResponse:
+        """동기 응답 생성"""
+        estimated = self._estimate(messages)
+        async with self.governor.slot(estimated):
+            response = await self.inner.generate(messages, **kwargs)
+        self.governor.settle_tokens(estimated, _usage_total_tokens(response.usage))
+        return response
+
+    async def generate_stream(
+        self,
+        messages: list[LLMMessage],
+        **kwargs
+    ) -> AsyncIterator[str]:
+        """스트리밍 응답 생성 (스트림 종료 시 슬롯 반환)"""
+        estimated = self._estimate(messages)
+        async with self.governor.slot(estimated):
+            async for chunk in self.inner.generate_stream(messages, **kwargs):
+                yield chunk
+
+
+class GovernedEmbeddingProvider(EmbeddingProviderWrapper):
+    """호출 제한이 적용된 Embedding Provider 래퍼"""
+
+    def __init__(self, inner: BaseEmbeddingProvider, governor: ProviderGovernor):
+        super().__init__(inner)
+        self.governor = governor
+
+    async def embed_query(self, text: str) -> list[float]:
+        """단일 쿼리 임베딩"""
+        async with self.governor.slot(estimate_tokens(text)):
+            return await self.inner.embed_query(text)
+
+    async def embed_documents(self, texts: list[str]) -> list[list[float]]:
+        """다중 문서 임베딩"""
+        estimated = sum(estimate_tokens(t) for t in texts)
+        async with self.governor.slot(estimated):
+            return await self.inner.embed_documents(texts)
+
+
+def govern_llm_provider(
+    provider: BaseLLMProvider,
+    config: LLMConfig,
+    limits: Optional[ProviderLimits],
+    queue_timeout: float,
+) -> BaseLLMProvider:
+    """제한 설정이 있으면 LLM Provider 를 래핑"""
+    if not limits:
+        return provider
+    governor = get_governor("llm", config.provider, limits, queue_timeout)
+    return GovernedLLMProvider(provider, governor)
+
+
+def govern_embedding_provider(
+    provider: BaseEmbeddingProvider,
+    config: EmbeddingConfig,
+    limits: Optional[ProviderLimits],
+    queue_timeout: float,
+) -> BaseEmbeddingProvider:
+    """제한 설정이 있으면 Embedding Provider 를 래핑"""
+    if not limits:
+        return provider
+    governor = get_governor("embedding", config.provider, limits, queue_timeout)
+    return GovernedEmbeddingProvider(provider, governor)
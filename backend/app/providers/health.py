@@ -0,0 +1,126 @@
+"""Provider 헬스 체크 - 백그라운드 주기 점검 및 상태 캐시
+
+/providers/health 는 요청마다 Provider 를 호출하지 않고 마지막 점검 결과를 반환한다.
+점검 결과는 Provider별 서킷 브레이커에 반영되며, 브레이커가 열려 있는 동안에는
+점검을 건너뛰고 재시도 시점(반열림)이 되면 다시 확인한다.
+"""
+
+import asyncio
+import time
+from dataclasses import dataclass, asdict
+from datetime import datetime
+from typing import Optional
+
+from app.config import Settings, get_settings
+from app.providers.circuit_breaker import get_breaker, OPEN
+
+
+@dataclass
+class HealthStatus:
+    """마지막 헬스 체크 결과"""
+    provider: str
+    model: str
+    healthy: bool = False
+    error: Optional[str] = None
+    latency_ms: Optional[float] = None
+    checked_at: Optional[datetime] = None
+    circuit_state: str = "closed"
+
+
+class HealthMonitor:
+    """현재 LLM / Embedding Provider 상태 점검"""
+
+    def __init__(self, timeout: float = 5.0):
+        self.timeout = timeout
+        self._status: dict[str, HealthStatus] = {}  # kind -> 상태
+        self._lock = asyncio.Lock()
+
+    async def _check(self, kind: str, provider) -> HealthStatus:
+        breaker = get_breaker(
+            kind, provider.provider_name, provider.config.model_name
+        )
+        status = HealthStatus(
+            provider=provider.provider_name,
+            model=provider.config.model_name,
+        )
+
+        if breaker.state == OPEN:
+            # 열린 동안은 점검 생략 (재시도 시점 이후 반열림 상태에서 다시 점검)
+            previous = self._status.get(kind)
+            status.error = breaker.last_error or "circuit open"
+            status.checked_at = previous.checked_at if previous else None
+        else:
+            started = time.perf_counter()
+            try:
+                status.healthy = await asyncio.wait_for(
+                    provider.health_check(), timeout=self.timeout
+                )
+                if not status.healthy:
+                    status.error = "health check failed"
+            except asyncio.TimeoutError:
+                status.error = f"health check timed out after {self.timeout}s"
+            except Exception as e:
+                status.error = str(e)
+            status.latency_ms = round((time.perf_counter() - started) * 1000, 1)
+            status.checked_at = datetime.now()
+            if status.healthy:
+                breaker.record_success()
+            else:
+                breaker.record_failure(status.error)
+
+        status.circuit_state = breaker.state
+        self._status[kind] = status
+        return status
+
+    async def check_all(self, settings: Settings):
+        """현재 설정된 Provider 동시 점검"""
+        from app.dependencies import ProviderManager
+
+        async with self._lock:
+            checks = []
+            for kind, getter in (
+                ("llm", ProviderManager.get_llm_provider),
+                ("embedding", ProviderManager.get_embedding_provider),
+            ):
+                try:
+                    checks.append(self._check(kind, getter(settings)))
+                except Exception as e:
+                    # Provider 생성 실패 (패키지 누락, 설정 오류 등)
+                    self._status[kind] = HealthStatus(
+                        provider=getattr(settings, f"{kind}_provider"),
+                        model=getattr(settings, f"{kind}_model"),
+                        error=str(e),
+                        checked_at=datetime.now(),
+                    )
+            await asyncio.gather(*checks)
+
+    async def run_periodic(self, settings: Settings, interval: float):
+        """주기적 점검 (lifespan 에서 Task 로 실행)"""
+        while True:
+            await self.check_all(settings)
+            await asyncio.sleep(interval)
+
+    def _is_current(self, kind: str, settings: Settings) -> bool:
+        status = self._status.get(kind)
+        return (
+            status is not None
+            and status.provider == getattr(settings, f"{kind}_provider")
+            and status.model == getattr(settings, f"{kind}_model")
+        )
+
+    async def get_status(self, settings: Settings, refresh: bool = False) -> dict:
+        """캐시된 상태 반환 (현재 Provider 결과가 없을 때만 점검)"""
+        if refresh or not all(self._is_current(k, settings) for k in ("llm", "embedding")):
+            await self.check_all(settings)
+        return {kind: asdict(status) for kind, status in self._status.items()}
+
+
+_monitor: Optional[HealthMonitor] = None
+
+
+def get_health_monitor() -> HealthMonitor:
+    """전역 HealthMonitor (설정값으로 생성)"""
+    global _monitor
+    if _monitor is None:
+        _monitor = HealthMonitor(timeout=get_settings().provider_health_check_timeout)
+    return _monitor
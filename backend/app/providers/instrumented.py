@@ -0,0 +1,105 @@
+"""Provider 호출 메트릭 및 트레이싱 래퍼"""
+
+import time
+from contextlib import contextmanager
+from typing import AsyncIterator
+
+from app.metrics import (
+    PROVIDER_REQUESTS,
+    PROVIDER_LATENCY_SECONDS,
+    record_token_usage,
+)
+from app.providers.base import LLMMessage, LLMResponse
+from app.providers.llm.base import BaseLLMProvider
+from app.providers.embedding.base import BaseEmbeddingProvider
+from app.providers.wrappers import LLMProviderWrapper, EmbeddingProviderWrapper
+from app.tracing import trace_span
+
+
+@contextmanager
+def _observe(kind: str, provider: str, model: str, operation: str):
+    """호출 횟수/지연/오류 기록"""
+    started = time.perf_counter()
+    status = "success"
+    try:
+        yield
+    except Exception:
+        status = "error"
+        raise
+    finally:
+        PROVIDER_LATENCY_SECONDS.labels(kind, provider, model, operation).observe(
+            time.perf_counter() - started
+        )
+        PROVIDER_REQUESTS.labels(kind, provider, model, operation, status).inc()
+
+
+class InstrumentedLLMProvider(LLMProviderWrapper):
+    """메트릭이 수집되는 LLM Provider 래퍼"""
+
+    async def generate(
+        self,
+        messages: list[LLMMessage],
+        **kwargs
+    ) -> LLMResponse:
+        model = self.config.model_name
+        with trace_span("llm.generate", {
+            "llm.provider": self.provider_name,
+            "llm.model": model,
+            "llm.message_count": len(messages),
+        }) as span:
+            with _observe("llm", self.provider_name, model, "generate"):
+                response = await self.inner.generate(messages, **kwargs)
+            for key, value in (response.usage or {}).items():
+                if isinstance(value, (int, float)):
+                    span.set_attribute(f"llm.usage.{key}", value)
+        record_token_usage(self.provider_name, model, response.usage)
+        return response
+
+    async def generate_stream(
+        self,
+        messages: list[LLMMessage],
+        **kwargs
+    ) -> AsyncIterator[str]:
+        model = self.config.model_name
+        with trace_span("llm.generate_stream", {
+            "llm.provider": self.provider_name,
+            "llm.model": model,
+        }):
+            with _observe("llm", self.provider_name, model, "generate_stream"):
+                async for chunk in self.inner.generate_stream(messages, **kwargs):
+                    yield chunk
+
+
+class InstrumentedEmbeddingProvider(EmbeddingProviderWrapper):
+    """메트릭이 수집되는 Embedding Provider 래퍼"""
+
+    async def embed_query(self, text: str) -> list[float]:
+        model = self.config.model_name
+        with trace_span("embedding.embed_query", {
+            "embedding.provider": self.provider_name,
+            "embedding.model": model,
+        }):
+            with _observe("embedding", self.provider_name, model, "embed_query"):
+                return await self.inner.embed_query(text)
+
+    async def embed_documents(self, texts: list[str]) -> list[list[float]]:
+        model = self.config.model_name
+        with trace_span("embedding.embed_documents", {
+            "embedding.provider": self.provider_name,
+            "embedding.model": model,
+            "embedding.batch_size": len(texts),
+        }):
+            with _observe("embedding", self.provider_name, model, "embed_documents"):
+                return await self.inner.embed_documents(texts)
+
+
+def instrument_llm_provider(provider: BaseLLMProvider) -> BaseLLMProvider:
+    """LLM Provider 에 메트릭 수집 적용"""
+    return InstrumentedLLMProvider(provider)
+
+
+def instrument_embedding_provider(
+    provider: BaseEmbeddingProvider
+) -> BaseEmbeddingProvider:
+    """Embedding Provider 에 메트릭 수집 적용"""
+    return InstrumentedEmbeddingProvider(provider)
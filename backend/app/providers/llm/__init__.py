@@ -1,12 +1,27 @@
 """LLM Provider 모듈"""
 
+import importlib
+
 from .base import BaseLLMProvider
-from .openai import OpenAILLMProvider
-from .ollama import OllamaLLMProvider
-from .lmstudio import LMStudioLLMProvider
-from .huggingface import HuggingFaceLLMProvider
-from .google import GoogleLLMProvider
-from .xai import XAILLMProvider
+
+# 구현 클래스는 접근 시점에 import (무거운 SDK 지연 로딩)
+_LAZY_EXPORTS = {
+    "OpenAILLMProvider": ".openai",
+    "OllamaLLMProvider": ".ollama",
+    "LMStudioLLMProvider": ".lmstudio",
+    "HuggingFaceLLMProvider": ".huggingface",
+    "GoogleLLMProvider": ".google",
+    "XAILLMProvider": ".xai",
+    "FakeLLMProvider": ".fake",
+}
+
+
+def __getattr__(name: str):
+    if name in _LAZY_EXPORTS:
+        module = importlib.import_module(_LAZY_EXPORTS[name], __name__)
+        return getattr(module, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
 
 __all__ = [
     "BaseLLMProvider",
@@ -16,4 +31,5 @@ __all__ = [
     "HuggingFaceLLMProvider",
     "GoogleLLMProvider",
     "XAILLMProvider",
+    "FakeLLMProvider",
 ]
@@ -32,6 +32,18 @@ class BaseLLMProvider(ABC):
         """스트리밍 응답 생성"""
         pass
 
+    def _temperature(self, kwargs: dict) -> float:
+        """호출별 temperature (kwargs 에 없으면 설정값)"""
+        temperature = kwargs.get("temperature")
+        return self.config.temperature if temperature is None else temperature
+
+    def _with_temperature(self, client, kwargs: dict):
+        """LangChain 채팅 모델에 호출별 temperature 적용 (HTTP 클라이언트를 공유하는 얕은 복사본)"""
+        temperature = self._temperature(kwargs)
+        if temperature == self.config.temperature:
+            return client
+        return client.model_copy(update={"temperature": temperature})
+
     @abstractmethod
     def get_available_models(self) -> list[str]:
         """사용 가능한 모델 목록 반환"""
@@ -41,3 +53,7 @@ class BaseLLMProvider(ABC):
     async def health_check(self) -> bool:
         """Provider 연결 상태 확인"""
         pass
+
+    async def warmup(self) -> None:
+        """시작 시 사전 준비 (로컬 모델 로딩 등, 기본은 아무것도 하지 않음)"""
+        return None
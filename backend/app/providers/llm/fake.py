@@ -0,0 +1,82 @@
+"""Fake LLM Provider - 부하 테스트용 고정 응답 스트리밍"""
+
+import asyncio
+from typing import AsyncIterator
+
+from app.providers.base import LLMConfig, LLMMessage, LLMResponse
+from .base import BaseLLMProvider
+
+CANNED_RESPONSE = (
+    "This is a canned answer from the fake LLM provider. "
+    "It is generated locally without contacting any external service, "
+    "so it can be used to load-test the API and measure the overhead of "
+    "retrieval, prompt construction and response streaming."
+)
+
+
+class FakeLLMProvider(BaseLLMProvider):
+    """고정된 토큰을 설정된 지연 시간/속도로 스트리밍하는 LLM Provider"""
+
+    provider_name = "fake"
+
+    AVAILABLE_MODELS = [
+        "fake-echo",
+    ]
+
+    def __init__(self, config: LLMConfig):
+        super().__init__(config)
+        from app.config import get_settings
+        settings = get_settings()
+        self.first_token_latency = settings.fake_llm_latency_ms / 1000
+        self.tokens_per_second = settings.fake_llm_tokens_per_second
+
+    def _tokens(self) -> list[str]:
+        words = CANNED_RESPONSE.split(" ")
+        if self.config.max_tokens:
+            words = words[:self.config.max_tokens]
+        return [w + " " for w in words[:-1]] + words[-1:]
+
+    async def _sleep_per_token(self):
+        if self.tokens_per_second > 0:
+            await asyncio.sleep(1 / self.tokens_per_second)
+
+    async def generate(
+        self,
+        messages: list[LLMMessage],
+        **kwargs
+    ) -> LLMResponse:
+        """동기 응답 생성"""
+        tokens = []
+        async for token in self.generate_stream(messages, **kwargs):
+            tokens.append(token)
+
+        prompt_tokens = sum(len(m.content.split()) for m in messages)
+        return LLMResponse(
+            content="".join(tokens),
+            model=self.config.model_name,
+            usage={
+                "prompt_tokens": prompt_tokens,
+                "completion_tokens": len(tokens),
+                "total_tokens": prompt_tokens + len(tokens),
+            },
+        )
+
+    async def generate_stream(
+        self,
+        messages: list[LLMMessage],
+        **kwargs
+    ) -> AsyncIterator[str]:
+        """스트리밍 응답 생성"""
+        if self.first_token_latency > 0:
+            await asyncio.sleep(self.first_token_latency)
+        for token in self._tokens():
+            await self._sleep_per_token()
+            yield token
+
+    def get_available_models(self) -> list[str]:
+        """사용 가능한 모델 목록 반환"""
+        return self.AVAILABLE_MODELS
+
+    async def health_check(self) -> bool:
+        """항상 정상"""
+        return True
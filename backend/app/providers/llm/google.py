@@ -2,9 +2,13 @@
 
 from typing import AsyncIterator
 
+import httpx
+
 from app.providers.base import LLMConfig, LLMMessage, LLMResponse
 from .base import BaseLLMProvider
 
+GEMINI_API_BASE = "https://generativelanguage.googleapis.com/v1beta"
+
 
 class GoogleLLMProvider(BaseLLMProvider):
     """Google Gemini LLM Provider"""
@@ -49,7 +53,9 @@ class GoogleLLMProvider(BaseLLMProvider):
         langchain_messages = [
             (msg.role, msg.content) for msg in messages
         ]
-        response = await self.client.ainvoke(langchain_messages)
+        response = await self._with_temperature(self.client, kwargs).ainvoke(
+            langchain_messages
+        )
 
         return LLMResponse(
             content=response.content,
@@ -68,7 +74,8 @@ class GoogleLLMProvider(BaseLLMProvider):
         langchain_messages = [
             (msg.role, msg.content) for msg in messages
         ]
-        async for chunk in self.client.astream(langchain_messages):
+        client = self._with_temperature(self.client, kwargs)
+        async for chunk in client.astream(langchain_messages):
             if chunk.content:
                 yield chunk.content
 
@@ -81,8 +88,13 @@ class GoogleLLMProvider(BaseLLMProvider):
         if not self._available:
             return False
         try:
-            test_messages = [LLMMessage(role="user", content="hi")]
-            await self.generate(test_messages)
-            return True
+            # 모델 메타데이터 조회 (토큰 비용 없음)
+            async with httpx.AsyncClient() as client:
+                response = await client.get(
+                    f"{GEMINI_API_BASE}/models/{self.config.model_name}",
+                    params={"key": self.config.api_key},
+                    timeout=5.0
+                )
+                return response.status_code == 200
         except Exception:
             return False
@@ -1,5 +1,6 @@
 """HuggingFace Transformers LLM Provider"""
 
+import asyncio
 from typing import AsyncIterator
 
 from app.providers.base import LLMConfig, LLMMessage, LLMResponse
@@ -67,7 +68,7 @@ class HuggingFaceLLMProvider(BaseLLMProvider):
         outputs = self._pipeline(
             prompt,
             max_new_tokens=self.config.max_tokens or 512,
-            temperature=self.config.temperature,
+            temperature=self._temperature(kwargs),
             do_sample=True,
             return_full_text=False,
         )
@@ -86,6 +87,17 @@ class HuggingFaceLLMProvider(BaseLLMProvider):
         response = await self.generate(messages, **kwargs)
         yield response.content
 
+    async def warmup(self) -> None:
+        """모델 로딩 및 짧은 워밍업 생성"""
+        await asyncio.to_thread(self._load_model)
+        await asyncio.to_thread(
+            self._pipeline,
+            "Hello",
+            max_new_tokens=1,
+            do_sample=False,
+            return_full_text=False,
+        )
+
     def _format_messages(self, messages: list[LLMMessage]) -> str:
         """메시지를 프롬프트 문자열로 변환"""
         formatted = []
@@ -36,7 +36,7 @@ class LMStudioLLMProvider(BaseLLMProvider):
         response = await self.client.chat.completions.create(
             model=self.config.model_name,
             messages=openai_messages,
-            temperature=self.config.temperature,
+            temperature=self._temperature(kwargs),
             max_tokens=self.config.max_tokens,
         )
 
@@ -60,7 +60,7 @@ class LMStudioLLMProvider(BaseLLMProvider):
         stream = await self.client.chat.completions.create(
             model=self.config.model_name,
             messages=openai_messages,
-            temperature=self.config.temperature,
+            temperature=self._temperature(kwargs),
             stream=True,
         )
 
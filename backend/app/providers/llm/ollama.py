@@ -45,7 +45,9 @@ class OllamaLLMProvider(BaseLLMProvider):
         langchain_messages = [
             (msg.role, msg.content) for msg in messages
         ]
-        response = await self.client.ainvoke(langchain_messages)
+        response = await self._with_temperature(self.client, kwargs).ainvoke(
+            langchain_messages
+        )
 
         return LLMResponse(
             content=response.content,
@@ -61,10 +63,21 @@ class OllamaLLMProvider(BaseLLMProvider):
         langchain_messages = [
             (msg.role, msg.content) for msg in messages
         ]
-        async for chunk in self.client.astream(langchain_messages):
+        client = self._with_temperature(self.client, kwargs)
+        async for chunk in client.astream(langchain_messages):
             if chunk.content:
                 yield chunk.content
 
+    async def warmup(self) -> None:
+        """Ollama 서버에 모델을 미리 로드 (빈 프롬프트는 로드만 수행)"""
+        async with httpx.AsyncClient() as client:
+            response = await client.post(
+                f"{self.base_url}/api/generate",
+                json={"model": self.config.model_name},
+                timeout=120.0,
+            )
+            response.raise_for_status()
+
     def get_available_models(self) -> list[str]:
         """Ollama에서 사용 가능한 모델 목록 조회"""
         try:
@@ -2,11 +2,14 @@
 
 from typing import AsyncIterator
 
+import httpx
 from langchain_openai import ChatOpenAI
 
 from app.providers.base import LLMConfig, LLMMessage, LLMResponse
 from .base import BaseLLMProvider
 
+OPENAI_API_BASE = "https://api.openai.com/v1"
+
 
 class OpenAILLMProvider(BaseLLMProvider):
     """OpenAI LLM Provider"""
@@ -39,7 +42,9 @@ class OpenAILLMProvider(BaseLLMProvider):
         langchain_messages = [
             (msg.role, msg.content) for msg in messages
         ]
-        response = await self.client.ainvoke(langchain_messages)
+        response = await self._with_temperature(self.client, kwargs).ainvoke(
+            langchain_messages
+        )
 
         usage = None
         if hasattr(response, 'response_metadata'):
@@ -60,7 +65,8 @@ class OpenAILLMProvider(BaseLLMProvider):
         langchain_messages = [
             (msg.role, msg.content) for msg in messages
         ]
-        async for chunk in self.client.astream(langchain_messages):
+        client = self._with_temperature(self.client, kwargs)
+        async for chunk in client.astream(langchain_messages):
             if chunk.content:
                 yield chunk.content
 
@@ -69,10 +75,14 @@ class OpenAILLMProvider(BaseLLMProvider):
         return self.AVAILABLE_MODELS
 
     async def health_check(self) -> bool:
-        """Provider 연결 상태 확인"""
+        """Provider 연결 상태 확인 (모델 조회 API, 토큰 비용 없음)"""
         try:
-            test_messages = [LLMMessage(role="user", content="hi")]
-            await self.generate(test_messages)
-            return True
+            async with httpx.AsyncClient() as client:
+                response = await client.get(
+                    f"{self.config.base_url or OPENAI_API_BASE}/models/{self.config.model_name}",
+                    headers={"Authorization": f"Bearer {self.config.api_key}"},
+                    timeout=5.0
+                )
+                return response.status_code == 200
         except Exception:
             return False
@@ -40,7 +40,7 @@ class XAILLMProvider(BaseLLMProvider):
         response = await self.client.chat.completions.create(
             model=self.config.model_name,
             messages=openai_messages,
-            temperature=self.config.temperature,
+            temperature=self._temperature(kwargs),
             max_tokens=self.config.max_tokens,
         )
 
@@ -64,7 +64,7 @@ class XAILLMProvider(BaseLLMProvider):
         stream = await self.client.chat.completions.create(
             model=self.config.model_name,
             messages=openai_messages,
-            temperature=self.config.temperature,
+            temperature=self._temperature(kwargs),
             stream=True,
         )
 
@@ -79,8 +79,8 @@ class XAILLMProvider(BaseLLMProvider):
     async def health_check(self) -> bool:
         """Provider 연결 상태 확인"""
         try:
-            test_messages = [LLMMessage(role="user", content="hi")]
-            await self.generate(test_messages)
+            # 모델 조회 API (토큰 비용 없음)
+            await self.client.models.retrieve(self.config.model_name, timeout=5.0)
             return True
         except Exception:
             return False
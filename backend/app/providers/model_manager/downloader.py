@@ -1,12 +1,34 @@
 """HuggingFace 모델 다운로드 및 캐시 관리"""
 
+import asyncio
+import json
 import os
 import shutil
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Optional
-from dataclasses import dataclass, field
+from typing import Callable, Optional
+from dataclasses import dataclass
 from datetime import datetime
 
+import httpx
+
+from app.services.events import EventBus
+from .manifest import CacheManifest
+
+# 다운로드 진행 중 표시 파일 (완료 시 삭제, 재시작 후 이어받기 대상 판별)
+INCOMPLETE_MARKER = ".download-incomplete"
+PART_SUFFIX = ".part"
+CHUNK_SIZE = 1024 * 1024
+# 진행률 이벤트 최소 발행 간격 (초)
+PROGRESS_EVENT_INTERVAL = 0.25
+
+
+def download_topic(model_name: str) -> str:
+    """모델 다운로드 이벤트 토픽"""
+    return f"model-download:{model_name}"
+
 
 @dataclass
 class DownloadStatus:
@@ -17,6 +39,22 @@ class DownloadStatus:
     error: Optional[str] = None
     started_at: Optional[datetime] = None
     completed_at: Optional[datetime] = None
+    downloaded_bytes: int = 0
+    total_bytes: int = 0
+    files_completed: int = 0
+    files_total: int = 0
+
+    def to_dict(self) -> dict:
+        return {
+            "model_name": self.model_name,
+            "status": self.status,
+            "progress": self.progress,
+            "error": self.error,
+            "downloaded_bytes": self.downloaded_bytes,
+            "total_bytes": self.total_bytes,
+            "files_completed": self.files_completed,
+            "files_total": self.files_total,
+        }
 
 
 @dataclass
@@ -76,12 +114,25 @@ class ModelDownloader:
         },
     }
 
-    _download_status: dict[str, DownloadStatus] = field(default_factory=dict)
-
-    def __init__(self, cache_dir: str = "./models"):
+    def __init__(
+        self,
+        cache_dir: str = "./models",
+        max_concurrent_downloads: int = 2,
+        max_file_workers: int = 8,
+        token: Optional[str] = None,
+        events: Optional[EventBus] = None,
+        quota_bytes: int = 0,
+    ):
         self.cache_dir = Path(cache_dir)
         self.cache_dir.mkdir(parents=True, exist_ok=True)
         self._download_status: dict[str, DownloadStatus] = {}
+        self._download_slots = asyncio.Semaphore(max_concurrent_downloads)
+        self._tasks: dict[str, asyncio.Task] = {}  # 모델명 -> 진행 중인 다운로드
+        self.max_file_workers = max_file_workers
+        self.token = token
+        self.events = events
+        self.quota_bytes = quota_bytes  # 0 이면 제한 없음
+        self.manifest = CacheManifest(self.cache_dir)
 
     def _get_model_path(self, model_name: str) -> Path:
         """모델 저장 경로 반환"""
@@ -91,32 +142,87 @@ class ModelDownloader:
     def is_model_cached(self, model_name: str) -> bool:
         """모델이 캐시되어 있는지 확인"""
         model_path = self._get_model_path(model_name)
-        return model_path.exists() and any(model_path.iterdir())
+        return (
+            model_path.exists()
+            and not (model_path / INCOMPLETE_MARKER).exists()
+            and any(model_path.iterdir())
+        )
 
-    def get_cached_models(self) -> list[CachedModel]:
-        """캐시된 모델 목록 반환"""
-        cached = []
+    def get_incomplete_downloads(self) -> dict[str, str]:
+        """중단된 다운로드 목록 (모델명 -> 모델 타입)"""
+        incomplete = {}
         if not self.cache_dir.exists():
-            return cached
-
+            return incomplete
+        for marker in self.cache_dir.glob(f"*/{INCOMPLETE_MARKER}"):
+            try:
+                info = json.loads(marker.read_text())
+                incomplete[info["model_name"]] = info.get("model_type", "llm")
+            except (OSError, ValueError, KeyError):
+                continue
+        return incomplete
+
+    def _iter_model_dirs(self):
+        """다운로드가 완료된 모델 디렉토리"""
+        if not self.cache_dir.exists():
+            return
         for model_dir in self.cache_dir.iterdir():
-            if model_dir.is_dir():
-                name = model_dir.name.replace("--", "/")
-                size = sum(
-                    f.stat().st_size
-                    for f in model_dir.rglob("*")
-                    if f.is_file()
-                )
-                mtime = datetime.fromtimestamp(model_dir.stat().st_mtime)
-                cached.append(CachedModel(
-                    name=name,
-                    path=str(model_dir),
-                    size_bytes=size,
-                    downloaded_at=mtime,
-                ))
+            if (
+                model_dir.is_dir()
+                and not model_dir.name.startswith(".")
+                and not (model_dir / INCOMPLETE_MARKER).exists()
+            ):
+                yield model_dir
 
+    def get_cached_models(self) -> list[CachedModel]:
+        """캐시된 모델 목록 반환 (매니페스트 기반)"""
+        cached = []
+        existing = set()
+        for model_dir in self._iter_model_dirs():
+            entry = self.manifest.get(model_dir)
+            existing.add(model_dir.name)
+            cached.append(CachedModel(
+                name=model_dir.name.replace("--", "/"),
+                path=str(model_dir),
+                size_bytes=entry.size_bytes,
+                downloaded_at=datetime.fromtimestamp(entry.dir_mtime),
+            ))
+        self.manifest.prune(existing)
         return cached
 
+    def mark_model_used(self, model_name: str):
+        """모델 사용 기록 (캐시 축출 시 최근 사용 모델 보존)"""
+        self.manifest.touch(self._get_model_path(model_name).name)
+
+    def evict_to_quota(self, keep: Optional[set[str]] = None) -> list[str]:
+        """디스크 할당량 초과 시 가장 오래 사용하지 않은 모델부터 삭제"""
+        if not self.quota_bytes:
+            return []
+        keep = keep or set()
+        entries = [self.manifest.get(d) for d in self._iter_model_dirs()]
+        total = sum(e.size_bytes for e in entries)
+        evicted = []
+        for entry in sorted(entries, key=lambda e: e.last_used):
+            if total <= self.quota_bytes:
+                break
+            model_name = entry.dir_name.replace("--", "/")
+            status = self._download_status.get(model_name)
+            if model_name in keep or (status and status.status in ("pending", "downloading")):
+                continue
+            if self.delete_model(model_name):
+                total -= entry.size_bytes
+                evicted.append(model_name)
+        return evicted
+
+    def _publish(self, status: DownloadStatus):
+        """상태 변경 이벤트 발행 (워커 스레드에서도 호출됨)"""
+        if self.events is None:
+            return
+        event_type = {
+            "completed": "complete",
+            "failed": "error",
+        }.get(status.status, "progress")
+        self.events.publish(download_topic(status.model_name), event_type, status.to_dict())
+
     def get_download_status(self, model_name: str) -> Optional[DownloadStatus]:
         """다운로드 상태 조회"""
         return self._download_status.get(model_name)
@@ -126,6 +232,10 @@ class ModelDownloader:
         model_path = self._get_model_path(model_name)
         if model_path.exists():
             shutil.rmtree(model_path)
+            self.manifest.remove(model_path.name)
+            self._download_status.pop(model_name, None)
+            if self.events is not None:
+                self.events.clear(download_topic(model_name))
             return True
         return False
 
@@ -140,80 +250,217 @@ class ModelDownloader:
     async def download_embedding_model(
         self,
         model_name: str,
-        progress_callback: Optional[callable] = None
+        progress_callback: Optional[Callable[[DownloadStatus], None]] = None
     ) -> str:
-        """임베딩 모델 다운로드 (sentence-transformers)"""
-        from sentence_transformers import SentenceTransformer
-
-        self._download_status[model_name] = DownloadStatus(
-            model_name=model_name,
-            status="downloading",
-            started_at=datetime.now(),
-        )
-
-        try:
-            model_path = self._get_model_path(model_name)
-
-            # sentence-transformers가 자동으로 다운로드 처리
-            model = SentenceTransformer(
-                model_name,
-                cache_folder=str(self.cache_dir),
-            )
-
-            self._download_status[model_name] = DownloadStatus(
-                model_name=model_name,
-                status="completed",
-                progress=100.0,
-                completed_at=datetime.now(),
-            )
-
-            return str(model_path)
-
-        except Exception as e:
-            self._download_status[model_name] = DownloadStatus(
-                model_name=model_name,
-                status="failed",
-                error=str(e),
-            )
-            raise
+        """임베딩 모델 다운로드 (sentence-transformers 모델 저장소)"""
+        return await asyncio.shield(self.start(model_name, "embedding", progress_callback))
 
     async def download_llm_model(
         self,
         model_name: str,
-        progress_callback: Optional[callable] = None
+        progress_callback: Optional[Callable[[DownloadStatus], None]] = None
     ) -> str:
         """LLM 모델 다운로드 (transformers)"""
-        from huggingface_hub import snapshot_download
+        return await asyncio.shield(self.start(model_name, "llm", progress_callback))
 
-        self._download_status[model_name] = DownloadStatus(
+    def start(
+        self,
+        model_name: str,
+        model_type: str = "llm",
+        progress_callback: Optional[Callable[[DownloadStatus], None]] = None
+    ) -> asyncio.Task:
+        """다운로드 Task 시작 (이미 진행 중이면 기존 Task 반환)
+
+        상태와 Task 를 await 없이 등록하므로 동시에 들어온 요청도 같은
+        다운로드를 공유한다. 이미 진행 중인 경우 progress_callback 은 무시된다.
+        """
+        task = self._tasks.get(model_name)
+        if task is not None and not task.done():
+            return task
+
+        status = DownloadStatus(
             model_name=model_name,
-            status="downloading",
+            status="pending",
             started_at=datetime.now(),
         )
+        self._download_status[model_name] = status
+        self._publish(status)
 
-        try:
-            model_path = self._get_model_path(model_name)
-
-            # huggingface_hub로 모델 다운로드
-            snapshot_download(
-                repo_id=model_name,
-                local_dir=str(model_path),
-                local_dir_use_symlinks=False,
-            )
-
-            self._download_status[model_name] = DownloadStatus(
-                model_name=model_name,
-                status="completed",
-                progress=100.0,
-                completed_at=datetime.now(),
-            )
-
-            return str(model_path)
-
-        except Exception as e:
-            self._download_status[model_name] = DownloadStatus(
-                model_name=model_name,
-                status="failed",
-                error=str(e),
-            )
-            raise
+        task = asyncio.create_task(
+            self._download(model_name, model_type, status, progress_callback)
+        )
+        self._tasks[model_name] = task
+        task.add_done_callback(self._on_task_done)
+        return task
+
+    def _on_task_done(self, task: asyncio.Task):
+        for model_name, current in list(self._tasks.items()):
+            if current is task:
+                del self._tasks[model_name]
+        if not task.cancelled():
+            task.exception()  # 실패 상태는 DownloadStatus 에 기록됨
+
+    async def resume_incomplete_downloads(self) -> list[str]:
+        """재시작 전에 중단된 다운로드 이어받기 (백그라운드 Task 생성)"""
+        resumed = []
+        for model_name, model_type in self.get_incomplete_downloads().items():
+            if model_name in self._tasks:
+                continue
+            self.start(model_name, model_type)
+            resumed.append(model_name)
+        return resumed
+
+    async def _download(
+        self,
+        model_name: str,
+        model_type: str,
+        status: DownloadStatus,
+        progress_callback: Optional[Callable[[DownloadStatus], None]] = None
+    ) -> str:
+        """동시 다운로드 수 제한 후 워커 스레드에서 저장소 스냅샷 다운로드"""
+        async with self._download_slots:
+            status.status = "downloading"
+            self._publish(status)
+            try:
+                model_path = await asyncio.to_thread(
+                    self._download_snapshot,
+                    model_name,
+                    model_type,
+                    status,
+                    progress_callback,
+                )
+            except Exception as e:
+                status.status = "failed"
+                status.error = str(e)
+                status.completed_at = datetime.now()
+                self._publish(status)
+                raise
+
+        status.status = "completed"
+        status.progress = 100.0
+        status.completed_at = datetime.now()
+        self._publish(status)
+        return str(model_path)
+
+    def _list_repo_files(self, model_name: str) -> list[tuple[str, int]]:
+        """저장소 파일 목록과 크기"""
+        from huggingface_hub import HfApi
+
+        info = HfApi(token=self.token).model_info(model_name, files_metadata=True)
+        return [
+            (sibling.rfilename, sibling.size or 0)
+            for sibling in info.siblings
+        ]
+
+    def _download_snapshot(
+        self,
+        model_name: str,
+        model_type: str,
+        status: DownloadStatus,
+        progress_callback: Optional[Callable[[DownloadStatus], None]] = None
+    ) -> Path:
+        """저장소 파일을 병렬로 다운로드 (워커 스레드에서 실행)"""
+        model_path = self._get_model_path(model_name)
+        model_path.mkdir(parents=True, exist_ok=True)
+        (model_path / INCOMPLETE_MARKER).write_text(json.dumps({
+            "model_name": model_name,
+            "model_type": model_type,
+        }))
+
+        files = self._list_repo_files(model_name)
+        status.files_total = len(files)
+        status.total_bytes = sum(size for _, size in files)
+        self._publish(status)
+
+        lock = threading.Lock()
+        last_published = time.monotonic()
+
+        def on_bytes(count: int):
+            nonlocal last_published
+            with lock:
+                status.downloaded_bytes += count
+                if status.total_bytes:
+                    status.progress = min(
+                        99.9, status.downloaded_bytes / status.total_bytes * 100
+                    )
+                now = time.monotonic()
+                publish = now - last_published >= PROGRESS_EVENT_INTERVAL
+                if publish:
+                    last_published = now
+            if publish:
+                self._publish(status)
+            if progress_callback:
+                progress_callback(status)
+
+        def on_file_done():
+            with lock:
+                status.files_completed += 1
+            self._publish(status)
+
+        with ThreadPoolExecutor(max_workers=self.max_file_workers) as pool:
+            futures = [
+                pool.submit(
+                    self._download_file,
+                    model_name, filename, size, model_path, on_bytes,
+                )
+                for filename, size in files
+            ]
+            for future in futures:
+                future.result()
+                on_file_done()
+
+        (model_path / INCOMPLETE_MARKER).unlink(missing_ok=True)
+        self.manifest.refresh(model_path)
+        self.manifest.touch(model_path.name)
+        self.evict_to_quota(keep={model_name})
+        return model_path
+
+    def _download_file(
+        self,
+        model_name: str,
+        filename: str,
+        size: int,
+        model_path: Path,
+        on_bytes: Callable[[int], None],
+    ):
+        """단일 파일 다운로드 (.part 파일에서 Range 요청으로 이어받기)"""
+        from huggingface_hub import hf_hub_url
+
+        target = model_path / filename
+        if target.exists() and (not size or target.stat().st_size == size):
+            on_bytes(target.stat().st_size)
+            return
+
+        target.parent.mkdir(parents=True, exist_ok=True)
+        part = target.with_name(target.name + PART_SUFFIX)
+        offset = part.stat().st_size if part.exists() else 0
+        if size and offset > size:
+            part.unlink()
+            offset = 0
+        on_bytes(offset)
+
+        headers = {}
+        if self.token:
+            headers["Authorization"] = f"Bearer {self.token}"
+        if offset:
+            headers["Range"] = f"bytes={offset}-"
+
+        if not size or offset < size:
+            with httpx.stream(
+                "GET",
+                hf_hub_url(model_name, filename),
+                headers=headers,
+                follow_redirects=True,
+                timeout=httpx.Timeout(60.0, connect=10.0),
+            ) as response:
+                if offset and response.status_code == 200:
+                    # 서버가 Range 를 무시하면 처음부터 다시 받음
+                    on_bytes(-offset)
+                    offset = 0
+                response.raise_for_status()
+                with open(part, "ab" if offset else "wb") as f:
+                    for chunk in response.iter_bytes(CHUNK_SIZE):
+                        f.write(chunk)
+                        on_bytes(len(chunk))
+
+        os.replace(part, target)
@@ -0,0 +1,122 @@
+"""모델 캐시 매니페스트 - 모델 디렉토리별 크기/파일 수/체크섬 기록
+
+모델 목록 조회 시 모든 파일을 stat 하지 않도록 스캔 결과를 캐시 디렉토리의
+JSON 파일에 저장한다. 모델 디렉토리의 mtime 이 기록과 다를 때만 다시 스캔한다.
+"""
+
+import hashlib
+import json
+import os
+import threading
+import time
+from dataclasses import dataclass, asdict
+from pathlib import Path
+
+MANIFEST_FILENAME = ".manifest.json"
+
+
+@dataclass
+class ManifestEntry:
+    """모델 디렉토리 스캔 결과"""
+    dir_name: str
+    size_bytes: int
+    file_count: int
+    dir_mtime: float
+    checksum: str  # 파일 경로/크기/mtime 기반 지문
+    scanned_at: float
+    last_used: float
+
+
+def scan_model_dir(model_dir: Path) -> tuple[int, int, str]:
+    """디렉토리 전체 스캔 (크기, 파일 수, 체크섬)
+
+    체크섬은 파일 내용이 아닌 (상대 경로, 크기, mtime) 목록의 SHA-256 으로,
+    수 GB 모델을 다시 읽지 않고도 변경 여부를 판별한다.
+    """
+    size = 0
+    entries = []
+    for path in model_dir.rglob("*"):
+        if not path.is_file():
+            continue
+        stat = path.stat()
+        size += stat.st_size
+        entries.append(f"{path.relative_to(model_dir)}:{stat.st_size}:{stat.st_mtime_ns}")
+    digest = hashlib.sha256("\n".join(sorted(entries)).encode()).hexdigest()
+    return size, len(entries), digest
+
+
+class CacheManifest:
+    """모델 캐시 매니페스트 (스레드 안전)"""
+
+    def __init__(self, cache_dir: Path):
+        self.cache_dir = cache_dir
+        self.path = cache_dir / MANIFEST_FILENAME
+        self._lock = threading.Lock()
+        self._entries: dict[str, ManifestEntry] = self._load()
+
+    def _load(self) -> dict[str, ManifestEntry]:
+        try:
+            data = json.loads(self.path.read_text())
+            return {name: ManifestEntry(**entry) for name, entry in data.items()}
+        except (OSError, ValueError, TypeError):
+            return {}
+
+    def _save(self):
+        # 임시 파일에 쓴 뒤 교체하여 중간 상태가 남지 않도록 함
+        tmp = self.path.with_suffix(".tmp")
+        tmp.write_text(json.dumps(
+            {name: asdict(entry) for name, entry in self._entries.items()},
+            indent=2,
+        ))
+        os.replace(tmp, self.path)
+
+    def get(self, model_dir: Path) -> ManifestEntry:
+        """매니페스트 항목 조회 (디렉토리 mtime 이 바뀌었으면 재스캔)"""
+        dir_mtime = model_dir.stat().st_mtime
+        with self._lock:
+            entry = self._entries.get(model_dir.name)
+            if entry is not None and entry.dir_mtime == dir_mtime:
+                return entry
+        return self.refresh(model_dir)
+
+    def refresh(self, model_dir: Path) -> ManifestEntry:
+        """디렉토리를 스캔하여 항목 갱신"""
+        size, file_count, checksum = scan_model_dir(model_dir)
+        now = time.time()
+        with self._lock:
+            previous = self._entries.get(model_dir.name)
+            entry = ManifestEntry(
+                dir_name=model_dir.name,
+                size_bytes=size,
+                file_count=file_count,
+                dir_mtime=model_dir.stat().st_mtime,
+                checksum=checksum,
+                scanned_at=now,
+                last_used=previous.last_used if previous else now,
+            )
+            self._entries[model_dir.name] = entry
+            self._save()
+        return entry
+
+    def touch(self, dir_name: str):
+        """모델 사용 시각 갱신 (LRU 기준)"""
+        with self._lock:
+            entry = self._entries.get(dir_name)
+            if entry is None:
+                return
+            entry.last_used = time.time()
+            self._save()
+
+    def remove(self, dir_name: str):
+        with self._lock:
+            if self._entries.pop(dir_name, None) is not None:
+                self._save()
+
+    def prune(self, existing: set[str]):
+        """디스크에 없는 모델 항목 제거"""
+        with self._lock:
+            stale = set(self._entries) - existing
+            for dir_name in stale:
+                del self._entries[dir_name]
+            if stale:
+                self._save()
@@ -0,0 +1,152 @@
+"""Provider 인스턴스 풀 - 설정(키)별 인스턴스 공유
+
+같은 설정의 Provider 는 한 번만 생성한다. 키별 생성 잠금으로 동시 요청이
+무거운 Provider (로컬 HuggingFace 모델 등)를 중복 생성하지 않도록 하고,
+사용 중인 요청 수(참조 수)가 0 인 인스턴스는 최근 사용 순으로 정리한다.
+"""
+
+import threading
+import time
+from collections import OrderedDict
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from typing import Any, Callable, Hashable, Iterator, Optional
+
+
+@dataclass
+class PoolEntry:
+    """풀에 보관된 Provider"""
+    provider: Any
+    refcount: int = 0
+    pinned_as: Optional[str] = None  # 현재 기본 Provider 그룹 (정리 대상 아님)
+    created_at: float = field(default_factory=time.time)
+    last_used: float = field(default_factory=time.time)
+
+
+class ProviderPool:
+    """키별 Provider 인스턴스 풀 (스레드 안전)"""
+
+    def __init__(self, max_idle: int = 4):
+        self.max_idle = max_idle
+        self._lock = threading.Lock()
+        self._entries: "OrderedDict[Hashable, PoolEntry]" = OrderedDict()
+        self._build_locks: dict[Hashable, threading.Lock] = {}
+        self.created = 0
+        self.evicted = 0
+
+    def _acquire(self, key: Hashable, entry: PoolEntry, pin_as: Optional[str], lease: bool):
+        """사용 기록, 참조 수 증가, 기본 그룹 고정 (잠금 보유 상태)"""
+        self._entries.move_to_end(key)
+        entry.last_used = time.time()
+        if lease:
+            entry.refcount += 1
+        if pin_as is not None and entry.pinned_as != pin_as:
+            self._unpin(pin_as)
+            entry.pinned_as = pin_as
+
+    def _checkout(
+        self,
+        key: Hashable,
+        factory: Callable[[], Any],
+        pin_as: Optional[str],
+        lease: bool,
+    ) -> tuple[PoolEntry, bool]:
+        """조회/생성과 참조 획득을 같은 잠금 구간에서 수행 (그 사이 정리되지 않도록)"""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._acquire(key, entry, pin_as, lease)
+                self._evict_idle()
+                return entry, True
+            build_lock = self._build_locks.setdefault(key, threading.Lock())
+
+        # 생성은 키별 잠금 안에서 (다른 키의 조회/생성은 막지 않음)
+        with build_lock:
+            with self._lock:
+                entry = self._entries.get(key)
+                if entry is not None:
+                    self._acquire(key, entry, pin_as, lease)
+                    self._evict_idle()
+                    return entry, True
+            provider = factory()
+            with self._lock:
+                entry = PoolEntry(provider=provider)
+                self._entries[key] = entry
+                self._build_locks.pop(key, None)
+                self.created += 1
+                self._acquire(key, entry, pin_as, lease)
+                self._evict_idle()
+            return entry, False
+
+    def get(
+        self,
+        key: Hashable,
+        factory: Callable[[], Any],
+        pin_as: Optional[str] = None,
+    ) -> tuple[Any, bool]:
+        """Provider 조회 (없으면 생성), (provider, 캐시 적중 여부) 반환
+
+        pin_as 를 주면 해당 그룹의 기본 Provider 로 고정한다 (그룹당 하나).
+        """
+        entry, hit = self._checkout(key, factory, pin_as, lease=False)
+        return entry.provider, hit
+
+    @contextmanager
+    def lease(
+        self,
+        key: Hashable,
+        factory: Callable[[], Any],
+        pin_as: Optional[str] = None,
+    ) -> Iterator[tuple[Any, bool]]:
+        """with 블록 동안 참조 수를 올려 정리되지 않도록 사용"""
+        entry, hit = self._checkout(key, factory, pin_as, lease=True)
+        try:
+            yield entry.provider, hit
+        finally:
+            with self._lock:
+                entry.refcount -= 1
+                entry.last_used = time.time()
+                self._evict_idle()
+
+    def _unpin(self, group: str):
+        for entry in self._entries.values():
+            if entry.pinned_as == group:
+                entry.pinned_as = None
+
+    def unpin(self, group: str):
+        """그룹의 기본 Provider 고정 해제 (다음 정리 대상이 될 수 있음)"""
+        with self._lock:
+            self._unpin(group)
+            self._evict_idle()
+
+    def _evict_idle(self):
+        """사용 중이 아닌 인스턴스가 max_idle 을 넘으면 오래된 것부터 제거 (잠금 보유 상태)"""
+        idle = [
+            key for key, entry in self._entries.items()
+            if entry.refcount == 0 and entry.pinned_as is None
+        ]
+        for key in idle[:max(0, len(idle) - self.max_idle)]:
+            del self._entries[key]
+            self.evicted += 1
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+    def snapshot(self) -> dict:
+        with self._lock:
+            return {
+                "size": len(self._entries),
+                "max_idle": self.max_idle,
+                "created": self.created,
+                "evicted": self.evicted,
+                "entries": [
+                    {
+                        "key": str(key[:3]) if isinstance(key, tuple) else str(key),
+                        "refcount": entry.refcount,
+                        "pinned_as": entry.pinned_as,
+                        "idle_seconds": round(time.time() - entry.last_used, 1),
+                    }
+                    for key, entry in self._entries.items()
+                ],
+            }
@@ -1,72 +1,97 @@
 """Provider Registry - Provider 등록 및 팩토리"""
 
-from typing import Type
-import httpx
+import importlib
+from typing import Type, Union
 
 from app.providers.base import LLMConfig, EmbeddingConfig
 from app.providers.llm.base import BaseLLMProvider
 from app.providers.embedding.base import BaseEmbeddingProvider
 
-# LLM Providers
-from app.providers.llm.openai import OpenAILLMProvider
-from app.providers.llm.ollama import OllamaLLMProvider
-from app.providers.llm.lmstudio import LMStudioLLMProvider
-from app.providers.llm.huggingface import HuggingFaceLLMProvider
-from app.providers.llm.google import GoogleLLMProvider
-from app.providers.llm.xai import XAILLMProvider
+# Provider 클래스는 "모듈경로:클래스명" 형태로 등록하고 처음 사용할 때 import
+# (langchain_openai 등 무거운 SDK를 사용하지 않는 Provider 때문에 로딩하지 않도록)
+LLMProviderSpec = Union[str, Type[BaseLLMProvider]]
+EmbeddingProviderSpec = Union[str, Type[BaseEmbeddingProvider]]
 
-# Embedding Providers
-from app.providers.embedding.openai import OpenAIEmbeddingProvider
-from app.providers.embedding.huggingface import HuggingFaceEmbeddingProvider
-from app.providers.embedding.ollama import OllamaEmbeddingProvider
+
+def _import_provider_class(path: str) -> type:
+    """"모듈경로:클래스명" 문자열에서 클래스 import"""
+    module_path, _, class_name = path.partition(":")
+    if not class_name:
+        module_path, _, class_name = path.rpartition(".")
+    module = importlib.import_module(module_path)
+    return getattr(module, class_name)
 
 
 class ProviderRegistry:
     """Provider 등록 및 생성을 위한 Registry"""
 
-    _llm_providers: dict[str, Type[BaseLLMProvider]] = {
-        "openai": OpenAILLMProvider,
-        "ollama": OllamaLLMProvider,
-        "lmstudio": LMStudioLLMProvider,
-        "huggingface": HuggingFaceLLMProvider,
-        "google": GoogleLLMProvider,
-        "xai": XAILLMProvider,
+    _llm_providers: dict[str, LLMProviderSpec] = {
+        "openai": "app.providers.llm.openai:OpenAILLMProvider",
+        "ollama": "app.providers.llm.ollama:OllamaLLMProvider",
+        "lmstudio": "app.providers.llm.lmstudio:LMStudioLLMProvider",
+        "huggingface": "app.providers.llm.huggingface:HuggingFaceLLMProvider",
+        "google": "app.providers.llm.google:GoogleLLMProvider",
+        "xai": "app.providers.llm.xai:XAILLMProvider",
+        "fake": "app.providers.llm.fake:FakeLLMProvider",
     }
 
-    _embedding_providers: dict[str, Type[BaseEmbeddingProvider]] = {
-        "openai": OpenAIEmbeddingProvider,
-        "huggingface": HuggingFaceEmbeddingProvider,
-        "ollama": OllamaEmbeddingProvider,
+    _embedding_providers: dict[str, EmbeddingProviderSpec] = {
+        "openai": "app.providers.embedding.openai:OpenAIEmbeddingProvider",
+        "huggingface": "app.providers.embedding.huggingface:HuggingFaceEmbeddingProvider",
+        "ollama": "app.providers.embedding.ollama:OllamaEmbeddingProvider",
+        "fake": "app.providers.embedding.fake:FakeEmbeddingProvider",
     }
 
     @classmethod
     def register_llm_provider(
         cls,
         name: str,
-        provider_class: Type[BaseLLMProvider]
+        provider_class: LLMProviderSpec
     ):
-        """LLM Provider 등록"""
+        """LLM Provider 등록 (클래스 또는 "모듈경로:클래스명")"""
         cls._llm_providers[name] = provider_class
 
     @classmethod
     def register_embedding_provider(
         cls,
         name: str,
-        provider_class: Type[BaseEmbeddingProvider]
+        provider_class: EmbeddingProviderSpec
     ):
-        """Embedding Provider 등록"""
+        """Embedding Provider 등록 (클래스 또는 "모듈경로:클래스명")"""
         cls._embedding_providers[name] = provider_class
 
+    @classmethod
+    def get_llm_provider_class(cls, provider_name: str) -> Type[BaseLLMProvider]:
+        """LLM Provider 클래스 반환 (필요 시 import)"""
+        if provider_name not in cls._llm_providers:
+            raise ValueError(f"Unknown LLM provider: {provider_name}")
+        spec = cls._llm_providers[provider_name]
+        if isinstance(spec, str):
+            spec = _import_provider_class(spec)
+            cls._llm_providers[provider_name] = spec
+        return spec
+
+    @classmethod
+    def get_embedding_provider_class(
+        cls,
+        provider_name: str
+    ) -> Type[BaseEmbeddingProvider]:
+        """Embedding Provider 클래스 반환 (필요 시 import)"""
+        if provider_name not in cls._embedding_providers:
+            raise ValueError(f"Unknown embedding provider: {provider_name}")
+        spec = cls._embedding_providers[provider_name]
+        if isinstance(spec, str):
+            spec = _import_provider_class(spec)
+            cls._embedding_providers[provider_name] = spec
+        return spec
+
     @classmethod
     def get_llm_provider(
         cls,
         config: LLMConfig
     ) -> BaseLLMProvider:
         """LLM Provider 인스턴스 생성"""
-        provider_name = config.provider
-        if provider_name not in cls._llm_providers:
-            raise ValueError(f"Unknown LLM provider: {provider_name}")
-        return cls._llm_providers[provider_name](config)
+        return cls.get_llm_provider_class(config.provider)(config)
 
     @classmethod
     def get_embedding_provider(
@@ -74,10 +99,7 @@ class ProviderRegistry:
         config: EmbeddingConfig
     ) -> BaseEmbeddingProvider:
         """Embedding Provider 인스턴스 생성"""
-        provider_name = config.provider
-        if provider_name not in cls._embedding_providers:
-            raise ValueError(f"Unknown embedding provider: {provider_name}")
-        return cls._embedding_providers[provider_name](config)
+        return cls.get_embedding_provider_class(config.provider)(config)
 
     @classmethod
     def list_llm_providers(cls) -> list[str]:
@@ -90,74 +112,38 @@ class ProviderRegistry:
         return list(cls._embedding_providers.keys())
 
     @classmethod
-    def get_llm_provider_info(cls, provider_name: str) -> dict:
+    async def get_llm_provider_info(cls, provider_name: str) -> dict:
         """LLM Provider 정보 조회"""
         if provider_name not in cls._llm_providers:
             raise ValueError(f"Unknown LLM provider: {provider_name}")
 
-        provider_class = cls._llm_providers[provider_name]
-
-        # LM Studio / Ollama는 실시간으로 로드된 모델 목록 조회
-        models = []
-        if provider_name == "lmstudio":
-            models = cls._fetch_lmstudio_models()
-        elif provider_name == "ollama":
-            models = cls._fetch_ollama_models()
+        # LM Studio / Ollama는 실행 중인 서버의 모델 목록 사용 (캐시)
+        # (Provider 모듈 import 없이 처리)
+        from app.providers.discovery import get_model_discovery
+        discovery = get_model_discovery()
+        if discovery.supports(provider_name):
+            models = await discovery.get_models(provider_name)
         else:
+            provider_class = cls.get_llm_provider_class(provider_name)
             models = (getattr(provider_class, "AVAILABLE_MODELS", [])
                       or getattr(provider_class, "DEFAULT_MODELS", []))
 
         return {
             "name": provider_name,
             "models": models,
-            "is_local": provider_name in ["ollama", "lmstudio", "huggingface"],
+            "is_local": provider_name in ["ollama", "lmstudio", "huggingface", "fake"],
             "requires_api_key": provider_name in ["openai", "google", "xai"],
         }
 
-    @classmethod
-    def _fetch_lmstudio_models(cls) -> list[str]:
-        """LM Studio에서 로드된 모델 목록 조회"""
-        from app.config import get_settings
-        settings = get_settings()
-        base_url = settings.lmstudio_base_url
-
-        try:
-            response = httpx.get(f"{base_url}/models", timeout=5.0)
-            if response.status_code == 200:
-                data = response.json()
-                return [m["id"] for m in data.get("data", [])]
-        except Exception:
-            pass
-        return []
-
-    @classmethod
-    def _fetch_ollama_models(cls) -> list[str]:
-        """Ollama에서 설치된 모델 목록 조회"""
-        from app.config import get_settings
-        settings = get_settings()
-        base_url = settings.ollama_base_url
-
-        try:
-            response = httpx.get(f"{base_url}/api/tags", timeout=5.0)
-            if response.status_code == 200:
-                data = response.json()
-                return [m["name"] for m in data.get("models", [])]
-        except Exception:
-            pass
-        return []
-
     @classmethod
     def get_embedding_provider_info(cls, provider_name: str) -> dict:
         """Embedding Provider 정보 조회"""
-        if provider_name not in cls._embedding_providers:
-            raise ValueError(f"Unknown embedding provider: {provider_name}")
-
-        provider_class = cls._embedding_providers[provider_name]
+        provider_class = cls.get_embedding_provider_class(provider_name)
         model_dimensions = getattr(provider_class, "MODEL_DIMENSIONS", {})
         return {
             "name": provider_name,
             "models": list(model_dimensions.keys()),
             "dimensions": model_dimensions,
-            "is_local": provider_name in ["huggingface", "ollama"],
+            "is_local": provider_name in ["huggingface", "ollama", "fake"],
             "requires_api_key": provider_name == "openai",
         }
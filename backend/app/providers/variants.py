@@ -0,0 +1,166 @@
+"""요청별 LLM 선택 - 요청 단위 설정 변경 및 가중치 기반 트래픽 분할
+
+전역 설정을 바꾸지 않고 채팅 요청마다 LLM Provider/모델/temperature 를 고른다.
+요청에 직접 지정한 값이 가장 우선이고, 다음으로 요청이 지정한 변형(variant),
+마지막으로 LLM_TRAFFIC_SPLIT 의 가중치에 따른 무작위 선택을 사용한다.
+
+요청에서 지정할 수 있는 Provider/모델은 허용 목록으로 제한하고, temperature 는
+Provider 인스턴스가 아니라 호출마다 전달한다 (값마다 Provider 를 새로 만들지 않도록).
+"""
+
+import random
+import time
+from typing import AsyncIterator, Optional
+
+from app.config import Settings, LLMVariant
+from app.metrics import (
+    LLM_VARIANT_REQUESTS,
+    LLM_VARIANT_LATENCY_SECONDS,
+    LLM_VARIANT_TOKENS,
+)
+from app.providers.base import LLMConfig, LLMMessage, LLMResponse
+from app.providers.failover import parse_chain_entry
+from app.providers.llm.base import BaseLLMProvider
+from app.providers.registry import ProviderRegistry
+from app.providers.wrappers import LLMProviderWrapper
+
+# 요청에 직접 Provider/모델/temperature 를 지정한 경우의 변형 이름
+OVERRIDE_VARIANT = "override"
+
+_rng = random.Random()
+
+
+def choose_variant(variants: list[LLMVariant]) -> Optional[LLMVariant]:
+    """가중치에 따라 변형 선택"""
+    weighted = [v for v in variants if v.weight > 0]
+    if not weighted:
+        return None
+    return _rng.choices(weighted, weights=[v.weight for v in weighted])[0]
+
+
+def allowed_llm_models(settings: Settings) -> set[tuple[str, str]]:
+    """요청에서 지정할 수 있는 (provider, model)
+
+    기본 LLM, LLM_TRAFFIC_SPLIT 변형, LLM_FAILOVER_CHAIN, LLM_ALLOWED_MODELS 의 모델.
+    """
+    allowed = {(settings.llm_provider, settings.llm_model)}
+    for v in settings.llm_traffic_split:
+        allowed.add((v.provider or settings.llm_provider, v.model or settings.llm_model))
+    for entry in settings.llm_failover_chain + settings.llm_allowed_models:
+        try:
+            allowed.add(parse_chain_entry(entry))
+        except ValueError:
+            continue
+    return allowed
+
+
+def _check_override(settings: Settings, config: LLMConfig):
+    """요청에서 지정한 Provider/모델 검증 (허용 목록 밖이면 ValueError → 400)"""
+    if config.provider not in ProviderRegistry.list_llm_providers():
+        raise ValueError(f"Unknown LLM provider: {config.provider}")
+    if (config.provider, config.model_name) not in allowed_llm_models(settings):
+        raise ValueError(
+            f"LLM model not allowed: {config.provider}:{config.model_name}"
+        )
+
+
+def select_llm_config(
+    settings: Settings,
+    provider: Optional[str] = None,
+    model: Optional[str] = None,
+    temperature: Optional[float] = None,
+    variant: Optional[str] = None,
+) -> tuple[Optional[str], Optional[LLMConfig], Optional[float]]:
+    """(변형 이름, LLMConfig, 호출별 temperature) 반환
+
+    LLMConfig 가 None 이면 기본 Provider 사용. LLMConfig 의 temperature 는 항상
+    기본값이며 (풀의 Provider 인스턴스 공유), 요청/변형의 temperature 는 따로 반환한다.
+    """
+    from app.dependencies import ProviderManager
+
+    if provider or model or temperature is not None:
+        config = ProviderManager.get_llm_config(settings, provider, model)
+        _check_override(settings, config)
+        return OVERRIDE_VARIANT, config, temperature
+
+    if variant is not None:
+        chosen = next((v for v in settings.llm_traffic_split if v.name == variant), None)
+        if chosen is None:
+            raise ValueError(f"Unknown LLM variant: {variant}")
+    else:
+        chosen = choose_variant(settings.llm_traffic_split)
+
+    if chosen is None:
+        return None, None, None
+    if not (chosen.provider or chosen.model):
+        return chosen.name, None, chosen.temperature
+    return chosen.name, ProviderManager.get_llm_config(
+        settings, chosen.provider, chosen.model
+    ), chosen.temperature
+
+
+class VariantLLMProvider(LLMProviderWrapper):
+    """변형별 지연 시간/토큰 수를 기록하는 LLM Provider 래퍼 (요청마다 생성)
+
+    temperature 가 주어지면 호출마다 kwargs 로 전달한다.
+    """
+
+    def __init__(
+        self,
+        inner: BaseLLMProvider,
+        variant: str,
+        temperature: Optional[float] = None,
+    ):
+        super().__init__(inner)
+        self.variant = variant
+        self.temperature = temperature
+        if temperature is not None:
+            self.config = inner.config.model_copy(update={"temperature": temperature})
+
+    def _call_kwargs(self, kwargs: dict) -> dict:
+        if self.temperature is not None:
+            kwargs.setdefault("temperature", self.temperature)
+        return kwargs
+
+    async def generate(
+        self,
+        messages: list[LLMMessage],
+        **kwargs
+    ) -> LLMResponse:
+        kwargs = self._call_kwargs(kwargs)
+        started = time.perf_counter()
+        try:
+            response = await self.inner.generate(messages, **kwargs)
+        except Exception:
+            LLM_VARIANT_REQUESTS.labels(self.variant, "error").inc()
+            raise
+        LLM_VARIANT_LATENCY_SECONDS.labels(self.variant).observe(
+            time.perf_counter() - started
+        )
+        LLM_VARIANT_REQUESTS.labels(self.variant, "success").inc()
+        usage = response.usage or {}
+        prompt = usage.get("prompt_tokens", usage.get("input_tokens"))
+        completion = usage.get("completion_tokens", usage.get("output_tokens"))
+        if prompt:
+            LLM_VARIANT_TOKENS.labels(self.variant, "prompt").inc(prompt)
+        if completion:
+            LLM_VARIANT_TOKENS.labels(self.variant, "completion").inc(completion)
+        return response
+
+    async def generate_stream(
+        self,
+        messages: list[LLMMessage],
+        **kwargs
+    ) -> AsyncIterator[str]:
+        kwargs = self._call_kwargs(kwargs)
+        started = time.perf_counter()
+        try:
+            async for chunk in self.inner.generate_stream(messages, **kwargs):
+                yield chunk
+        except Exception:
+            LLM_VARIANT_REQUESTS.labels(self.variant, "error").inc()
+            raise
+        LLM_VARIANT_LATENCY_SECONDS.labels(self.variant).observe(
+            time.perf_counter() - started
+        )
+        LLM_VARIANT_REQUESTS.labels(self.variant, "success").inc()
@@ -0,0 +1,65 @@
+"""Provider 래퍼 기본 클래스 - 다른 Provider 에 호출을 위임"""
+
+from typing import AsyncIterator
+
+from app.providers.base import LLMMessage, LLMResponse
+from app.providers.llm.base import BaseLLMProvider
+from app.providers.embedding.base import BaseEmbeddingProvider
+
+
+class LLMProviderWrapper(BaseLLMProvider):
+    """LLM Provider 위임 래퍼"""
+
+    def __init__(self, inner: BaseLLMProvider):
+        super().__init__(inner.config)
+        self.inner = inner
+        self.provider_name = inner.provider_name
+
+    async def generate(
+        self,
+        messages: list[LLMMessage],
+        **kwargs
+    ) -> LLMResponse:
+        return await self.inner.generate(messages, **kwargs)
+
+    async def generate_stream(
+        self,
+        messages: list[LLMMessage],
+        **kwargs
+    ) -> AsyncIterator[str]:
+        async for chunk in self.inner.generate_stream(messages, **kwargs):
+            yield chunk
+
+    def get_available_models(self) -> list[str]:
+        return self.inner.get_available_models()
+
+    async def health_check(self) -> bool:
+        return await self.inner.health_check()
+
+    async def warmup(self) -> None:
+        await self.inner.warmup()
+
+
+class EmbeddingProviderWrapper(BaseEmbeddingProvider):
+    """Embedding Provider 위임 래퍼"""
+
+    def __init__(self, inner: BaseEmbeddingProvider):
+        super().__init__(inner.config)
+        self.inner = inner
+        self.provider_name = inner.provider_name
+        self.dimension = inner.dimension
+
+    async def embed_query(self, text: str) -> list[float]:
+        return await self.inner.embed_query(text)
+
+    async def embed_documents(self, texts: list[str]) -> list[list[float]]:
+        return await self.inner.embed_documents(texts)
+
+    def get_available_models(self) -> list[str]:
+        return self.inner.get_available_models()
+
+    async def health_check(self) -> bool:
+        return await self.inner.health_check()
+
+    async def warmup(self) -> None:
+        await self.inner.warmup()
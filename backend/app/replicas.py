@@ -0,0 +1,134 @@
+"""읽기 전용 복제본(read replica) 라우팅
+
+검색/목록 같은 읽기 요청은 복제본에 라운드 로빈으로 보내고, 쓰기는 항상 primary 로
+보낸다. 백그라운드 점검으로 복제본의 접속 가능 여부와 복제 지연(lag)을 확인하며,
+점검 전이거나 모든 복제본이 비정상 또는 지연 한도를 넘으면 primary 로 읽는다.
+"""
+
+import asyncio
+import itertools
+import logging
+import threading
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Optional
+
+from sqlalchemy import text
+from sqlalchemy.engine import Engine
+
+from app.metrics import DB_READ_ROUTES
+
+logger = logging.getLogger(__name__)
+
+# WAL 수신이 멈춘 복제본은 받은 WAL 을 다 적용해도 지연 0 으로 보이므로, 먼저
+# WAL receiver 가 streaming 상태이고 최근에 primary 메시지를 받았는지 확인한다.
+# primary 는 유휴 상태에서도 wal_sender_timeout(기본 60초)의 절반마다 keepalive 를 보낸다.
+RECEIVER_SILENCE_SECONDS = 60
+
+# 수신 중이 아니면 NULL (사용 불가), 받은 WAL 을 모두 적용했으면 지연 0,
+# 아니면 마지막 적용 트랜잭션 이후 경과 시간
+# (primary 가 유휴 상태일 때 replay 시각이 오래되어 지연으로 오인하지 않도록)
+LAG_QUERY = text("""
+    SELECT CASE
+        WHEN NOT pg_is_in_recovery() THEN 0
+        WHEN NOT EXISTS (
+            SELECT 1 FROM pg_stat_wal_receiver
+            WHERE status = 'streaming'
+              AND last_msg_receipt_time > now() - make_interval(secs => :silence)
+        ) THEN NULL
+        WHEN pg_last_wal_receive_lsn() = pg_last_wal_replay_lsn() THEN 0
+        ELSE COALESCE(EXTRACT(EPOCH FROM now() - pg_last_xact_replay_timestamp()), 0)
+    END
+""")
+
+
+@dataclass
+class ReplicaState:
+    """복제본 점검 결과"""
+    name: str
+    engine: Engine
+    healthy: bool = False  # 첫 점검 전에는 사용하지 않음
+    lag_seconds: Optional[float] = None
+    error: Optional[str] = None
+    checked_at: Optional[datetime] = None
+
+
+class ReplicaRouter:
+    """읽기 요청 대상 엔진 선택 (스레드 안전)"""
+
+    def __init__(self, primary: Engine, replicas: list[Engine], max_lag_seconds: float = 5.0):
+        self.primary = primary
+        self.max_lag_seconds = max_lag_seconds
+        self.replicas = [
+            ReplicaState(name=f"replica-{i}", engine=engine)
+            for i, engine in enumerate(replicas)
+        ]
+        self._cycle = itertools.cycle(range(len(self.replicas))) if self.replicas else None
+        self._lock = threading.Lock()
+
+    def _usable(self, replica: ReplicaState) -> bool:
+        return (
+            replica.healthy
+            and replica.lag_seconds is not None
+            and replica.lag_seconds <= self.max_lag_seconds
+        )
+
+    def choose(self) -> Engine:
+        """사용 가능한 다음 복제본 (없으면 primary)"""
+        if not self.replicas:
+            return self.primary
+        with self._lock:
+            for _ in range(len(self.replicas)):
+                replica = self.replicas[next(self._cycle)]
+                if self._usable(replica):
+                    DB_READ_ROUTES.labels(replica.name).inc()
+                    return replica.engine
+        DB_READ_ROUTES.labels("primary_fallback").inc()
+        return self.primary
+
+    def _check(self, replica: ReplicaState, timeout: float):
+        try:
+            with replica.engine.connect() as conn:
+                conn.execute(text(f"SET statement_timeout = {int(timeout * 1000)}"))
+                lag = conn.execute(LAG_QUERY, {"silence": RECEIVER_SILENCE_SECONDS}).scalar()
+                conn.rollback()
+            if lag is None:
+                # 복제 연결이 끊겼거나 멈춤 (pg_stat_wal_receiver 조회 권한이 없어도 해당)
+                raise RuntimeError("WAL receiver is not streaming")
+            replica.lag_seconds = float(lag)
+            replica.healthy = True
+            replica.error = None
+        except Exception as e:
+            if replica.healthy:
+                logger.warning("Read replica %s unavailable: %s", replica.name, e)
+            replica.healthy = False
+            replica.lag_seconds = None
+            replica.error = str(e) or type(e).__name__
+        replica.checked_at = datetime.now()
+
+    def check_all(self, timeout: float = 2.0):
+        """모든 복제본 점검 (동기, 스레드에서 호출)"""
+        for replica in self.replicas:
+            self._check(replica, timeout)
+
+    async def run_periodic(self, interval: float, timeout: float = 2.0):
+        """주기적 점검 (lifespan 에서 Task 로 실행)"""
+        while True:
+            await asyncio.to_thread(self.check_all, timeout)
+            await asyncio.sleep(interval)
+
+    def snapshot(self) -> dict:
+        return {
+            "max_lag_seconds": self.max_lag_seconds,
+            "replicas": [
+                {
+                    "name": replica.name,
+                    "healthy": replica.healthy,
+                    "usable": self._usable(replica),
+                    "lag_seconds": replica.lag_seconds,
+                    "error": replica.error,
+                    "checked_at": replica.checked_at.isoformat() if replica.checked_at else None,
+                }
+                for replica in self.replicas
+            ],
+        }
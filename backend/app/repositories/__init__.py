@@ -0,0 +1,8 @@
+"""저장소 모듈 - DB 접근 계층"""
+
+from .search_repository import SearchRepository, SearchRow
+
+__all__ = [
+    "SearchRepository",
+    "SearchRow",
+]
@@ -0,0 +1,231 @@
+"""벡터 검색 저장소 - 서버 측 prepared statement 와 커넥션 단위 설정
+
+검색 SQL 은 필터 조합마다 고정된 문자열이라 psycopg 가 커넥션별로 한 번 PREPARE 한
+뒤 같은 계획을 재사용한다 (prepare=True). pgvector GUC (ef_search, probes,
+iterative_scan)는 커넥션을 열 때 한 번만 설정하고, 시작 시 풀 커넥션을 미리 열어
+자주 쓰는 검색 쿼리를 준비해 둔다.
+"""
+
+import logging
+from dataclasses import dataclass
+from typing import Any, Optional
+
+import numpy as np
+from psycopg.types.json import Jsonb
+from sqlalchemy.orm import Session
+
+from app.config import get_settings
+
+logger = logging.getLogger(__name__)
+
+settings = get_settings()
+
+# 파티션 키 조건 (해당 컬렉션 파티션과 그 ANN 인덱스만 사용)
+COLLECTION_CONDITION = "dc.collection = %(collection)s"
+
+
+@dataclass
+class SearchRow:
+    """검색 결과 행"""
+    chunk_id: int
+    document_id: int
+    content: Optional[str]
+    page_number: Optional[int]
+    distance: float
+
+
+def _session_gucs() -> list[tuple[str, str]]:
+    """커넥션 단위로 설정할 pgvector GUC"""
+    gucs = []
+    if settings.search_hnsw_ef_search:
+        gucs.append(("hnsw.ef_search", str(settings.search_hnsw_ef_search)))
+    if settings.search_ivfflat_probes:
+        gucs.append(("ivfflat.probes", str(settings.search_ivfflat_probes)))
+    if settings.search_iterative_scan != "off":
+        # 넓은 필터에서 인덱스를 더 읽어 top_k 를 채움 (pgvector >= 0.8)
+        gucs.append(("hnsw.iterative_scan", settings.search_iterative_scan))
+        gucs.append(("ivfflat.iterative_scan", "relaxed_order"))  # relaxed_order 만 지원
+    return gucs
+
+
+def configure_search_session(dbapi_connection):
+    """새 커넥션에 검색 GUC 설정 (세션 수준, 풀 반환 후에도 유지)"""
+    autocommit = dbapi_connection.autocommit
+    dbapi_connection.autocommit = True
+    try:
+        for name, value in _session_gucs():
+            try:
+                dbapi_connection.execute(
+                    "SELECT set_config(%s, %s, false)", (name, value)
+                )
+            except Exception as e:
+                # 해당 GUC 를 지원하지 않는 pgvector 버전
+                logger.debug("Could not set %s: %s", name, e)
+    finally:
+        dbapi_connection.autocommit = autocommit
+
+
+class SearchRepository:
+    """document_chunks 벡터 검색 (Session 의 커넥션/트랜잭션 사용)"""
+
+    def __init__(self, db: Session):
+        self.db = db
+        # prepare_threshold 를 끈 환경 (PgBouncer transaction 모드 등)에서는 준비하지 않음
+        self.prepare = settings.database_prepare_threshold >= 0
+
+    def _driver_connection(self):
+        return self.db.connection().connection.driver_connection
+
+    def _execute(self, sql: str, params: dict, prepare: bool) -> list:
+        cursor = self._driver_connection().cursor()
+        try:
+            cursor.execute(sql, params, prepare=prepare)
+            return cursor.fetchall()
+        finally:
+            cursor.close()
+
+    @staticmethod
+    def build_filter(
+        document_ids: list[int] | None,
+        filters: dict | None
+    ) -> tuple[list[str], dict]:
+        """청크 필터 조건 (WHERE 절 목록, 파라미터)"""
+        conditions = []
+        params: dict[str, Any] = {}
+        if document_ids:
+            conditions.append("dc.document_id = ANY(%(doc_ids)s)")
+            params["doc_ids"] = list(document_ids)
+        if filters:
+            # GIN (jsonb_path_ops) 인덱스를 사용하는 포함 조건
+            conditions.append("dc.metadata @> %(filters)s")
+            params["filters"] = Jsonb(filters)
+        return conditions, params
+
+    def estimate_rows(self, collection: str, conditions: list[str], params: dict) -> int:
+        """필터 조건의 예상 행 수 (플래너 통계 기반, 실제 스캔 없음)"""
+        where = " AND ".join([COLLECTION_CONDITION] + conditions)
+        rows = self._execute(
+            f"EXPLAIN (FORMAT JSON) SELECT 1 FROM document_chunks dc WHERE {where}",
+            {**params, "collection": collection},
+            prepare=False,
+        )
+        return int(rows[0][0][0]["Plan"]["Plan Rows"])
+
+    def choose_strategy(self, collection: str, conditions: list[str], params: dict) -> str:
+        """필터 선택도에 따른 검색 전략
+
+        - index: 필터 없음, 컬렉션 파티션의 ANN 인덱스 그대로 사용
+        - exact: 필터 결과가 작으면 필터 후 전체 거리 계산 (정확, 인덱스 미사용)
+        - iterative: 필터 결과가 크면 인덱스 반복 스캔 (커넥션 GUC) 후 재정렬
+        """
+        if not conditions:
+            return "index"
+        estimate = self.estimate_rows(collection, conditions, params)
+        if estimate <= settings.search_exact_scan_max_rows:
+            return "exact"
+        return "iterative"
+
+    @staticmethod
+    def build_query(strategy: str, conditions: list[str], with_content: bool) -> str:
+        """검색 SQL (같은 인자면 같은 문자열 → 커넥션별 prepared statement 재사용)"""
+        where = " AND ".join([COLLECTION_CONDITION] + conditions)
+        # 청크 본문은 필요한 경우에만 읽음
+        content = "dc.content" if with_content else "NULL::text"
+        if strategy == "exact":
+            # MATERIALIZED 로 필터를 먼저 적용 (ANN 인덱스 후필터링 방지)
+            return f"""
+                WITH candidates AS MATERIALIZED (
+                    SELECT dc.id, dc.document_id, {content} as content,
+                           dc.page_number, dc.embedding
+                    FROM document_chunks dc
+                    WHERE {where}
+                )
+                SELECT
+                    c.id as chunk_id,
+                    c.document_id,
+                    c.content,
+                    c.page_number,
+                    c.embedding <=> %(embedding)s as distance
+                FROM candidates c
+                ORDER BY distance
+                LIMIT %(limit)s
+            """
+        # 반복 스캔(relaxed_order)은 순서가 약간 어긋날 수 있어 바깥에서 재정렬
+        # 거리는 서브쿼리에서 한 번만 계산 (ORDER BY 는 별칭 참조, 인덱스 사용 가능)
+        return f"""
+            SELECT chunk_id, document_id, content, page_number, distance
+            FROM (
+                SELECT
+                    dc.id as chunk_id,
+                    dc.document_id,
+                    {content} as content,
+                    dc.page_number,
+                    dc.embedding <=> %(embedding)s as distance
+                FROM document_chunks dc
+                WHERE {where}
+                ORDER BY distance
+                LIMIT %(limit)s
+            ) nearest
+            ORDER BY distance
+        """
+
+    def search(
+        self,
+        collection: str,
+        embedding: list[float],
+        top_k: int,
+        strategy: str,
+        conditions: list[str],
+        params: dict,
+        with_content: bool = True,
+    ) -> list[SearchRow]:
+        """벡터 검색 실행"""
+        params = {
+            **params,
+            "collection": collection,
+            # pgvector 어댑터가 float4 배열을 binary 로 전송 (문자열 변환/파싱 없음)
+            "embedding": np.asarray(embedding, dtype=np.float32),
+            "limit": top_k,
+        }
+        rows = self._execute(
+            self.build_query(strategy, conditions, with_content),
+            params,
+            prepare=self.prepare,
+        )
+        return [SearchRow(*row) for row in rows]
+
+
+def warm_search_connections(count: int) -> int:
+    """풀 커넥션을 동시에 열고 필터 없는 검색 쿼리를 미리 PREPARE
+
+    닫은 커넥션은 풀로 반환되어 이후 요청에서 준비된 계획을 그대로 사용한다.
+    준비한 커넥션 수 반환.
+    """
+    from app.database import engine
+    from app.models import DocumentChunk
+
+    prepare = settings.database_prepare_threshold >= 0
+    dimension = DocumentChunk.embedding.type.dim
+    params = {
+        "collection": settings.collection_name,
+        "embedding": np.zeros(dimension, dtype=np.float32),
+        "limit": 0,
+    }
+    connections = []
+    try:
+        for _ in range(count):
+            conn = engine.connect()
+            connections.append(conn)
+            driver = conn.connection.driver_connection
+            if prepare:
+                for with_content in (True, False):
+                    driver.execute(
+                        SearchRepository.build_query("index", [], with_content),
+                        params,
+                        prepare=True,
+                    )
+            conn.rollback()
+        return len(connections)
+    finally:
+        for conn in connections:
+            conn.close()
@@ -0,0 +1,49 @@
+from fastapi import APIRouter, Depends, HTTPException
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import Session
+
+from app.database import get_db, get_read_db
+from app.schemas import CollectionCreate, CollectionResponse
+from app.services.collection_service import CollectionService
+
+router = APIRouter(prefix="/collections", tags=["collections"])
+collection_service = CollectionService()
+
+
+@router.get("", response_model=list[CollectionResponse])
+async def list_collections(db: Session = Depends(get_read_db)):
+    """컬렉션 목록 (문서 수 포함)"""
+    return [
+        CollectionResponse(
+            name=collection.name,
+            created_at=collection.created_at,
+            document_count=count,
+        )
+        for collection, count in collection_service.list_collections(db)
+    ]
+
+
+@router.post("", response_model=CollectionResponse, status_code=201)
+async def create_collection(body: CollectionCreate, db: Session = Depends(get_db)):
+    """컬렉션 생성 (청크 파티션과 ANN 인덱스 생성)"""
+    try:
+        collection = collection_service.create_collection(db, body.name)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    except IntegrityError:
+        db.rollback()
+        raise HTTPException(status_code=409, detail="Collection already exists")
+    return CollectionResponse(name=collection.name, created_at=collection.created_at)
+
+
+@router.delete("/{name}")
+async def delete_collection(name: str, db: Session = Depends(get_db)):
+    """빈 컬렉션 삭제"""
+    collection = collection_service.get_collection(db, name)
+    if not collection:
+        raise HTTPException(status_code=404, detail="Collection not found")
+    try:
+        collection_service.delete_collection(db, collection)
+    except ValueError as e:
+        raise HTTPException(status_code=409, detail=str(e))
+    return {"message": "Collection deleted successfully"}
@@ -1,10 +1,17 @@
-from fastapi import APIRouter, Depends, UploadFile, File, HTTPException
-from sqlalchemy.orm import Session
+import base64
+import json
+from datetime import datetime
+from typing import Any, Optional
 
-from app.database import get_db
+from fastapi import APIRouter, Body, Depends, UploadFile, File, Form, HTTPException, Query
+from sqlalchemy import func, text, tuple_
+from sqlalchemy.orm import Session, load_only
+
+from app.database import get_db, get_read_db
 from app.models import Document
 from app.schemas import DocumentResponse, DocumentListResponse, UploadResponse
 from app.services.pdf_service import PDFService
+from app.services.collection_service import CollectionService
 from app.config import get_settings
 from app.dependencies import get_embedding_provider
 from app.providers.embedding.base import BaseEmbeddingProvider
@@ -23,6 +30,8 @@ def get_pdf_service(
 @router.post("/upload", response_model=UploadResponse)
 async def upload_document(
     file: UploadFile = File(...),
+    metadata: Optional[str] = Form(None),
+    collection: Optional[str] = Form(None),
     db: Session = Depends(get_db),
     pdf_service: PDFService = Depends(get_pdf_service)
 ):
@@ -30,6 +39,11 @@ async def upload_document(
     if not file.filename.lower().endswith(".pdf"):
         raise HTTPException(status_code=400, detail="Only PDF files are allowed")
 
+    doc_metadata = _parse_metadata(metadata)
+    collection = collection or settings.collection_name
+    if not CollectionService().get_collection(db, collection):
+        raise HTTPException(status_code=404, detail="Collection not found")
+
     # Read file content
     content = await file.read()
 
@@ -44,7 +58,9 @@ async def upload_document(
     document = await pdf_service.process_pdf(
         file_content=content,
         original_filename=file.filename,
-        db=db
+        db=db,
+        metadata=doc_metadata,
+        collection=collection
     )
 
     return UploadResponse(
@@ -53,23 +69,155 @@ async def upload_document(
     )
 
 
+def _parse_metadata(raw: Optional[str]) -> dict[str, Any]:
+    """업로드 폼의 메타데이터 JSON 문자열 파싱"""
+    if not raw:
+        return {}
+    try:
+        metadata = json.loads(raw)
+    except json.JSONDecodeError:
+        raise HTTPException(status_code=400, detail="Invalid metadata JSON")
+    if not isinstance(metadata, dict):
+        raise HTTPException(status_code=400, detail="Metadata must be a JSON object")
+    return metadata
+
+
+def _encode_cursor(document: Document) -> str:
+    """(created_at, id) 를 불투명 커서 문자열로 인코딩"""
+    payload = json.dumps({"c": document.created_at.isoformat(), "i": document.id})
+    return base64.urlsafe_b64encode(payload.encode()).decode()
+
+
+def _decode_cursor(cursor: str) -> tuple[datetime, int]:
+    """커서 문자열을 (created_at, id) 로 디코딩"""
+    try:
+        payload = json.loads(base64.urlsafe_b64decode(cursor.encode()))
+        return datetime.fromisoformat(payload["c"]), int(payload["i"])
+    except Exception:
+        raise HTTPException(status_code=400, detail="Invalid cursor")
+
+
+def _count_documents(db: Session, query, filtered: bool) -> tuple[int, bool]:
+    """문서 수 조회 - 큰 테이블은 통계 기반 추정치 반환 (count, is_estimate)"""
+    threshold = settings.document_count_exact_threshold
+
+    if not filtered:
+        estimate = db.execute(text(
+            "SELECT reltuples::bigint FROM pg_class WHERE relname = 'documents'"
+        )).scalar()
+    else:
+        # 필터 조건은 플래너의 예상 행 수 사용 (필터 값은 바인드 파라미터로 전달)
+        compiled = query.statement.compile(dialect=db.get_bind().dialect)
+        plan = db.connection().exec_driver_sql(
+            f"EXPLAIN (FORMAT JSON) {compiled}", compiled.params
+        ).scalar()
+        estimate = int(plan[0]["Plan"]["Plan Rows"])
+
+    if estimate is not None and estimate > threshold:
+        return int(estimate), True
+
+    count = query.order_by(None).with_entities(func.count(Document.id)).scalar()
+    return count, False
+
+
 @router.get("", response_model=DocumentListResponse)
-async def list_documents(db: Session = Depends(get_db)):
-    documents = db.query(Document).order_by(Document.created_at.desc()).all()
+async def list_documents(
+    limit: Optional[int] = Query(None, ge=1),
+    cursor: Optional[str] = None,
+    collection: Optional[str] = None,
+    filename_prefix: Optional[str] = None,
+    embedding_provider: Optional[str] = None,
+    embedding_model: Optional[str] = None,
+    db: Session = Depends(get_read_db),
+):
+    """문서 목록 조회 (created_at, id 기준 keyset 페이지네이션)"""
+    limit = min(
+        limit or settings.document_list_default_limit,
+        settings.document_list_max_limit,
+    )
+
+    # 응답에 필요한 컬럼만 로드
+    query = db.query(Document).options(load_only(
+        Document.id,
+        Document.filename,
+        Document.original_filename,
+        Document.file_size,
+        Document.page_count,
+        Document.created_at,
+        Document.collection,
+        Document.doc_metadata,
+    ))
+
+    filtered = False
+    if collection:
+        query = query.filter(Document.collection == collection)
+        filtered = True
+    if filename_prefix:
+        escaped = (filename_prefix.replace("\\", "\\\\")
+                   .replace("%", "\\%").replace("_", "\\_"))
+        query = query.filter(
+            Document.original_filename.like(f"{escaped}%", escape="\\")
+        )
+        filtered = True
+    if embedding_provider:
+        query = query.filter(Document.embedding_provider == embedding_provider)
+        filtered = True
+    if embedding_model:
+        query = query.filter(Document.embedding_model == embedding_model)
+        filtered = True
+
+    total, total_is_estimate = _count_documents(db, query, filtered)
+
+    if cursor:
+        cursor_created_at, cursor_id = _decode_cursor(cursor)
+        query = query.filter(
+            tuple_(Document.created_at, Document.id)
+            < tuple_(cursor_created_at, cursor_id)
+        )
+
+    # 다음 페이지 존재 여부 확인을 위해 1개 더 조회
+    documents = (
+        query.order_by(Document.created_at.desc(), Document.id.desc())
+        .limit(limit + 1)
+        .all()
+    )
+    next_cursor = None
+    if len(documents) > limit:
+        documents = documents[:limit]
+        next_cursor = _encode_cursor(documents[-1])
+
     return DocumentListResponse(
         documents=[DocumentResponse.model_validate(doc) for doc in documents],
-        total=len(documents)
+        total=total,
+        total_is_estimate=total_is_estimate,
+        next_cursor=next_cursor,
     )
 
 
 @router.get("/{document_id}", response_model=DocumentResponse)
-async def get_document(document_id: int, db: Session = Depends(get_db)):
+async def get_document(document_id: int, db: Session = Depends(get_read_db)):
     document = db.query(Document).filter(Document.id == document_id).first()
     if not document:
         raise HTTPException(status_code=404, detail="Document not found")
     return DocumentResponse.model_validate(document)
 
 
+@router.patch("/{document_id}/metadata", response_model=DocumentResponse)
+async def update_document_metadata(
+    document_id: int,
+    metadata: dict[str, Any] = Body(...),
+    db: Session = Depends(get_db),
+    pdf_service: PDFService = Depends(get_pdf_service)
+):
+    """문서 메타데이터 교체 (검색 필터에 바로 반영)"""
+    document = db.query(Document).filter(Document.id == document_id).first()
+    if not document:
+        raise HTTPException(status_code=404, detail="Document not found")
+
+    updated = pdf_service.update_metadata(document, metadata, db)
+    return DocumentResponse.model_validate(updated)
+
+
 @router.delete("/{document_id}")
 async def delete_document(
     document_id: int,
@@ -1,23 +1,30 @@
 """모델 다운로드 및 관리 API"""
 
-import asyncio
+import json
 from typing import Optional
-from fastapi import APIRouter, HTTPException, BackgroundTasks
+from fastapi import APIRouter, HTTPException
 from pydantic import BaseModel
 from sse_starlette.sse import EventSourceResponse
 
 from app.config import get_settings
-from app.providers.model_manager.downloader import ModelDownloader, DownloadStatus
+from app.providers.model_manager.downloader import (
+    ModelDownloader,
+    download_topic,
+)
+from app.services.events import event_bus, TERMINAL_EVENTS
 
 router = APIRouter(prefix="/models", tags=["models"])
 settings = get_settings()
 
 # 전역 다운로더 인스턴스
-downloader = ModelDownloader(cache_dir=settings.huggingface_cache_dir)
-
-# 다운로드 작업 상태 저장
-download_tasks: dict[str, DownloadStatus] = {}
-
+downloader = ModelDownloader(
+    cache_dir=settings.huggingface_cache_dir,
+    max_concurrent_downloads=settings.model_download_max_concurrent,
+    max_file_workers=settings.model_download_file_workers,
+    token=settings.huggingface_api_key,
+    events=event_bus,
+    quota_bytes=int(settings.model_cache_quota_gb * 1024 ** 3),
+)
 
 # === 스키마 ===
 
@@ -95,10 +102,7 @@ async def get_cached_models():
 
 
 @router.post("/download")
-async def start_download(
-    request: DownloadRequest,
-    background_tasks: BackgroundTasks
-):
+async def start_download(request: DownloadRequest):
     """모델 다운로드 시작 (백그라운드)"""
     model_name = request.model_name
 
@@ -111,27 +115,17 @@ async def start_download(
 
     # 이미 다운로드 중인 경우
     status = downloader.get_download_status(model_name)
-    if status and status.status == "downloading":
+    if status and status.status in ("pending", "downloading"):
         return {
-            "status": "downloading",
+            "status": status.status,
             "message": f"Model {model_name} is already being downloaded",
         }
 
-    # 백그라운드로 다운로드 시작
-    async def download_task():
-        try:
-            if request.model_type == "embedding":
-                await downloader.download_embedding_model(model_name)
-            else:
-                await downloader.download_llm_model(model_name)
-        except Exception as e:
-            download_tasks[model_name] = DownloadStatus(
-                model_name=model_name,
-                status="failed",
-                error=str(e),
-            )
+    # 이전 시도의 종료 이벤트가 새 스트림에 재생되지 않도록 초기화
+    event_bus.clear(download_topic(model_name))
 
-    background_tasks.add_task(asyncio.create_task, download_task())
+    # 상태를 즉시 등록한 뒤 백그라운드로 다운로드 시작
+    downloader.start(model_name, request.model_type)
 
     return {
         "status": "started",
@@ -159,6 +153,10 @@ async def get_download_status(model_name: str):
             "status": status.status,
             "progress": status.progress,
             "error": status.error,
+            "downloaded_bytes": status.downloaded_bytes,
+            "total_bytes": status.total_bytes,
+            "files_completed": status.files_completed,
+            "files_total": status.files_total,
         }
 
     return {
@@ -170,39 +168,22 @@ async def get_download_status(model_name: str):
 
 @router.get("/download/{model_name}/stream")
 async def stream_download_status(model_name: str):
-    """다운로드 상태 SSE 스트리밍"""
+    """다운로드 상태 SSE 스트리밍 (상태 변경 시 즉시 전달)"""
     async def event_generator():
-        while True:
-            # 캐시 확인
-            if downloader.is_model_cached(model_name):
-                yield {
-                    "event": "complete",
-                    "data": '{"status": "completed", "progress": 100}'
-                }
-                break
-
-            # 다운로드 상태 확인
-            status = downloader.get_download_status(model_name)
-            if status:
-                if status.status == "failed":
-                    yield {
-                        "event": "error",
-                        "data": f'{{"status": "failed", "error": "{status.error}"}}'
-                    }
-                    break
-                elif status.status == "completed":
-                    yield {
-                        "event": "complete",
-                        "data": '{"status": "completed", "progress": 100}'
-                    }
+        # 이미 다운로드된 경우 (디스크 확인은 연결 시 한 번만)
+        status = downloader.get_download_status(model_name)
+        if status is None and downloader.is_model_cached(model_name):
+            yield {
+                "event": "complete",
+                "data": json.dumps({"status": "completed", "progress": 100}),
+            }
+            return
+
+        with event_bus.subscribe(download_topic(model_name)) as subscription:
+            async for event in subscription:
+                yield {"event": event["event"], "data": json.dumps(event["data"])}
+                if event["event"] in TERMINAL_EVENTS:
                     break
-                else:
-                    yield {
-                        "event": "progress",
-                        "data": f'{{"status": "{status.status}", "progress": {status.progress}}}'
-                    }
-
-            await asyncio.sleep(1)
 
     return EventSourceResponse(event_generator())
 
@@ -236,6 +217,8 @@ async def check_model(model_name: str):
     model_name = model_name.replace("--", "/")
 
     is_cached = downloader.is_model_cached(model_name)
+    if is_cached:
+        downloader.mark_model_used(model_name)
     return {
         "model_name": model_name,
         "is_cached": is_cached,
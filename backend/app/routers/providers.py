@@ -1,5 +1,6 @@
 """Provider 관리 API"""
 
+import asyncio
 from fastapi import APIRouter, Depends, HTTPException
 from pydantic import BaseModel
 from typing import Optional
@@ -7,6 +8,10 @@ from typing import Optional
 from app.config import get_settings, Settings
 from app.providers.registry import ProviderRegistry
 from app.dependencies import ProviderManager
+from app.providers.governor import list_governors
+from app.providers.discovery import get_model_discovery
+from app.providers.health import get_health_monitor
+from app.providers.circuit_breaker import list_breakers
 
 router = APIRouter(prefix="/providers", tags=["providers"])
 
@@ -59,12 +64,15 @@ async def list_providers():
     llm_providers = []
     embedding_providers = []
 
-    for name in ProviderRegistry.list_llm_providers():
-        try:
-            info = ProviderRegistry.get_llm_provider_info(name)
+    # 로컬 서버 모델 조회는 동시에 실행 (캐시가 없을 때만 대기)
+    llm_infos = await asyncio.gather(
+        *[ProviderRegistry.get_llm_provider_info(name)
+          for name in ProviderRegistry.list_llm_providers()],
+        return_exceptions=True,
+    )
+    for info in llm_infos:
+        if not isinstance(info, Exception):
             llm_providers.append(ProviderInfo(**info))
-        except Exception:
-            pass
 
     for name in ProviderRegistry.list_embedding_providers():
         try:
@@ -154,46 +162,45 @@ async def update_provider(
     }
 
 
-@router.get("/health")
-async def check_provider_health(settings: Settings = Depends(get_settings)):
-    """현재 Provider 연결 상태 확인"""
-    llm_status = {
-        "provider": settings.llm_provider,
-        "model": settings.llm_model,
-        "healthy": False,
-        "error": None,
-    }
+@router.get("/health", response_model=ProviderHealthResponse)
+async def check_provider_health(
+    refresh: bool = False,
+    settings: Settings = Depends(get_settings)
+):
+    """현재 Provider 연결 상태 (백그라운드 점검 결과, refresh=true 면 즉시 점검)"""
+    status = await get_health_monitor().get_status(settings, refresh=refresh)
+    return ProviderHealthResponse(llm=status["llm"], embedding=status["embedding"])
 
-    embedding_status = {
-        "provider": settings.embedding_provider,
-        "model": settings.embedding_model,
-        "healthy": False,
-        "error": None,
-    }
 
-    try:
-        llm = ProviderManager.get_llm_provider(settings)
-        llm_status["healthy"] = await llm.health_check()
-    except Exception as e:
-        llm_status["error"] = str(e)
+@router.get("/limits")
+async def get_provider_limits():
+    """Provider별 호출 제한 상태 (대기/처리 중 요청 수, 대기 시간)"""
+    return {"governors": [g.snapshot() for g in list_governors()]}
 
-    try:
-        embedding = ProviderManager.get_embedding_provider(settings)
-        embedding_status["healthy"] = await embedding.health_check()
-    except Exception as e:
-        embedding_status["error"] = str(e)
-
-    return ProviderHealthResponse(
-        llm=llm_status,
-        embedding=embedding_status
-    )
+
+@router.get("/pool")
+async def get_provider_pool():
+    """Provider 인스턴스 풀 상태"""
+    return ProviderManager.pool().snapshot()
+
+
+@router.get("/circuits")
+async def get_circuit_breakers():
+    """Provider별 서킷 브레이커 상태"""
+    return {"breakers": [b.snapshot() for b in list_breakers()]}
+
+
+@router.get("/discovery")
+async def get_discovery_status():
+    """로컬 Provider 모델 탐색 캐시 상태"""
+    return {"providers": get_model_discovery().snapshot()}
 
 
 @router.get("/llm/{provider_name}/models")
 async def get_llm_models(provider_name: str):
     """특정 LLM Provider의 사용 가능한 모델 목록"""
     try:
-        info = ProviderRegistry.get_llm_provider_info(provider_name)
+        info = await ProviderRegistry.get_llm_provider_info(provider_name)
         return {"provider": provider_name, "models": info["models"]}
     except ValueError as e:
         raise HTTPException(status_code=404, detail=str(e))
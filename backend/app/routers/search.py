@@ -1,10 +1,12 @@
 from fastapi import APIRouter, Depends
-from sqlalchemy.orm import Session
 
-from app.database import get_db
 from app.schemas import SearchQuery, SearchResponse, ChatQuery, ChatResponse
-from app.services.rag_service import RAGService
-from app.dependencies import get_llm_provider, get_embedding_provider
+from app.services.rag_service import RAGService, search_flight, chat_flight
+from app.dependencies import (
+    get_llm_provider,
+    get_embedding_provider,
+    get_chat_llm_provider,
+)
 from app.providers.llm.base import BaseLLMProvider
 from app.providers.embedding.base import BaseEmbeddingProvider
 
@@ -22,14 +24,15 @@ def get_rag_service(
 @router.post("", response_model=SearchResponse)
 async def search_documents(
     query: SearchQuery,
-    db: Session = Depends(get_db),
     rag_service: RAGService = Depends(get_rag_service)
 ):
     results = await rag_service.search(
         query=query.query,
-        db=db,
         top_k=query.top_k,
-        document_ids=query.document_ids
+        document_ids=query.document_ids,
+        filters=query.filters,
+        collection=query.collection,
+        fields=query.fields
     )
 
     return SearchResponse(
@@ -38,20 +41,39 @@ async def search_documents(
     )
 
 
+def get_chat_rag_service(
+    llm_provider: BaseLLMProvider = Depends(get_chat_llm_provider),
+    embedding_provider: BaseEmbeddingProvider = Depends(get_embedding_provider)
+) -> RAGService:
+    """채팅용 RAGService 의존성 (요청별 LLM 선택)"""
+    return RAGService(llm_provider, embedding_provider)
+
+
 @router.post("/chat", response_model=ChatResponse)
 async def chat_with_documents(
     query: ChatQuery,
-    db: Session = Depends(get_db),
-    rag_service: RAGService = Depends(get_rag_service)
+    rag_service: RAGService = Depends(get_chat_rag_service)
 ):
     answer, sources = await rag_service.chat(
         query=query.query,
-        db=db,
         top_k=query.top_k,
-        document_ids=query.document_ids
+        document_ids=query.document_ids,
+        filters=query.filters,
+        collection=query.collection
     )
 
     return ChatResponse(
         answer=answer,
-        sources=sources
+        sources=sources,
+        llm_provider=rag_service.llm.provider_name,
+        llm_model=rag_service.llm.config.model_name,
+        variant=getattr(rag_service.llm, "variant", None),
     )
+
+
+@router.get("/stats")
+async def get_search_stats():
+    """동시 요청 병합(single-flight) 통계"""
+    return {
+        "coalescing": [search_flight.snapshot(), chat_flight.snapshot()],
+    }
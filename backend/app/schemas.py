@@ -1,6 +1,6 @@
-from pydantic import BaseModel
+from pydantic import BaseModel, Field
 from datetime import datetime
-from typing import Optional
+from typing import Any, Literal, Optional
 
 
 class DocumentBase(BaseModel):
@@ -19,6 +19,8 @@ class DocumentResponse(DocumentBase):
     file_size: int
     page_count: Optional[int]
     created_at: datetime
+    collection: str
+    metadata: dict[str, Any] = Field(default_factory=dict, validation_alias="doc_metadata")
 
     class Config:
         from_attributes = True
@@ -27,19 +29,40 @@ class DocumentResponse(DocumentBase):
 class DocumentListResponse(BaseModel):
     documents: list[DocumentResponse]
     total: int
+    total_is_estimate: bool = False
+    next_cursor: Optional[str] = None
+
+
+class CollectionCreate(BaseModel):
+    name: str
+
+
+class CollectionResponse(BaseModel):
+    name: str
+    created_at: datetime
+    document_count: int = 0
+
+
+# 검색 결과 본문 범위: ID와 점수만 / 질의어 주변 발췌 / 청크 전체
+SearchFields = Literal["ids", "snippet", "content"]
 
 
 class SearchQuery(BaseModel):
     query: str
     top_k: int = 5
+    collection: Optional[str] = None  # 미지정 시 기본 컬렉션
     document_ids: Optional[list[int]] = None
+    # 메타데이터 포함 조건 (예: {"department": "hr", "tags": ["policy"]})
+    filters: Optional[dict[str, Any]] = None
+    fields: SearchFields = "content"
 
 
 class SearchResult(BaseModel):
     chunk_id: int
     document_id: int
     filename: str
-    content: str
+    content: Optional[str] = None
+    snippet: Optional[str] = None
     page_number: Optional[int]
     score: float
 
@@ -51,13 +74,23 @@ class SearchResponse(BaseModel):
 
 class ChatQuery(BaseModel):
     query: str
+    collection: Optional[str] = None
     document_ids: Optional[list[int]] = None
+    filters: Optional[dict[str, Any]] = None
     top_k: int = 5
+    # 요청 단위 LLM 선택 (전역 설정은 바뀌지 않음)
+    llm_provider: Optional[str] = None
+    llm_model: Optional[str] = None
+    temperature: Optional[float] = Field(default=None, ge=0.0, le=2.0)
+    variant: Optional[str] = None  # LLM_TRAFFIC_SPLIT 의 변형 이름
 
 
 class ChatResponse(BaseModel):
     answer: str
     sources: list[SearchResult]
+    llm_provider: Optional[str] = None
+    llm_model: Optional[str] = None
+    variant: Optional[str] = None
 
 
 class UploadResponse(BaseModel):
@@ -0,0 +1,105 @@
+"""컬렉션 관리 - 컬렉션별 청크 파티션 및 ANN 인덱스
+
+document_chunks 는 collection 기준 LIST 파티션 테이블이다. 컬렉션을 만들면
+chunks_<name> 파티션과 그 파티션 전용 HNSW 인덱스를 함께 만들어, 검색이
+해당 컬렉션의 파티션과 인덱스만 읽도록 한다.
+"""
+
+import re
+
+from sqlalchemy import func, text
+from sqlalchemy.engine import Connection
+from sqlalchemy.orm import Session
+
+from app.config import get_settings
+from app.models import Collection, Document, DEFAULT_COLLECTION
+from app.vectorstores import get_vector_store
+
+# 파티션/인덱스 이름에 그대로 쓰이므로 식별자로 안전한 문자만 허용
+COLLECTION_NAME_PATTERN = re.compile(r"^[a-z0-9][a-z0-9_]{0,31}$")
+
+
+def validate_collection_name(name: str) -> str:
+    if not COLLECTION_NAME_PATTERN.match(name):
+        raise ValueError(
+            "Collection name must be 1-32 characters of lowercase letters, "
+            "digits or underscores"
+        )
+    return name
+
+
+def partition_name(collection: str) -> str:
+    return f"chunks_{validate_collection_name(collection)}"
+
+
+def create_partition(conn: Connection, collection: str):
+    """컬렉션 파티션과 파티션 전용 ANN 인덱스 생성 (이미 있으면 무시)"""
+    settings = get_settings()
+    partition = partition_name(collection)
+    conn.execute(text(
+        f"CREATE TABLE IF NOT EXISTS {partition} "
+        f"PARTITION OF document_chunks FOR VALUES IN ('{collection}')"
+    ))
+    conn.execute(text(
+        f"CREATE INDEX IF NOT EXISTS {partition}_embedding_hnsw ON {partition} "
+        f"USING hnsw (embedding vector_cosine_ops) "
+        f"WITH (m = {int(settings.collection_hnsw_m)}, "
+        f"ef_construction = {int(settings.collection_hnsw_ef_construction)})"
+    ))
+
+
+def drop_partition(conn: Connection, collection: str):
+    conn.execute(text(f"DROP TABLE IF EXISTS {partition_name(collection)}"))
+
+
+def ensure_default_collections(conn: Connection):
+    """기본 컬렉션과 문서가 참조하는 컬렉션의 행/파티션 생성 (시작 시 호출)"""
+    names = {DEFAULT_COLLECTION}
+    names.update(conn.execute(text("SELECT DISTINCT collection FROM documents")).scalars())
+    names.update(conn.execute(text("SELECT name FROM collections")).scalars())
+    for name in sorted(names):
+        conn.execute(
+            text("INSERT INTO collections (name) VALUES (:name) ON CONFLICT (name) DO NOTHING"),
+            {"name": name},
+        )
+        create_partition(conn, name)
+
+
+class CollectionService:
+    """컬렉션 생성 / 조회 / 삭제"""
+
+    def list_collections(self, db: Session) -> list[tuple[Collection, int]]:
+        """컬렉션 목록과 컬렉션별 문서 수"""
+        counts = dict(
+            db.query(Document.collection, func.count(Document.id))
+            .group_by(Document.collection)
+            .all()
+        )
+        collections = db.query(Collection).order_by(Collection.name).all()
+        return [(c, counts.get(c.name, 0)) for c in collections]
+
+    def get_collection(self, db: Session, name: str) -> Collection | None:
+        return db.query(Collection).filter(Collection.name == name).first()
+
+    def create_collection(self, db: Session, name: str) -> Collection:
+        """컬렉션 행과 청크 파티션 생성"""
+        validate_collection_name(name)
+        collection = Collection(name=name)
+        db.add(collection)
+        db.flush()
+        create_partition(db.connection(), name)
+        db.commit()
+        db.refresh(collection)
+        return collection
+
+    def delete_collection(self, db: Session, collection: Collection):
+        """빈 컬렉션 삭제 (파티션 제거)"""
+        if collection.name == DEFAULT_COLLECTION:
+            raise ValueError("The default collection cannot be deleted")
+        if db.query(Document.id).filter(Document.collection == collection.name).first():
+            raise ValueError("Collection still has documents")
+        name = collection.name
+        drop_partition(db.connection(), name)
+        db.delete(collection)
+        db.commit()
+        get_vector_store().drop_collection(name)
@@ -0,0 +1,78 @@
+"""문서 정보 캐시 - 검색 결과에 붙일 문서 정보를 조인 없이 조회
+
+검색 쿼리는 document_chunks 만 읽고, 파일명 등 문서 정보는 이 캐시에서 채운다.
+캐시에 없는 문서만 한 번의 쿼리로 조회하며, 문서 삭제/재인덱싱/메타데이터
+변경 시 PDFService 가 해당 항목을 무효화한다 (프로세스 단위 캐시).
+"""
+
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass
+
+from sqlalchemy import text
+from sqlalchemy.orm import Session
+
+from app.config import get_settings
+from app.metrics import CACHE_REQUESTS
+
+
+@dataclass(frozen=True)
+class DocumentInfo:
+    """검색 결과에 필요한 문서 정보"""
+    id: int
+    original_filename: str
+    collection: str
+
+
+class DocumentInfoCache:
+    """문서 ID -> DocumentInfo LRU 캐시 (스레드 안전)"""
+
+    def __init__(self, max_entries: int = 10000):
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[int, DocumentInfo]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get_many(self, db: Session, document_ids: set[int]) -> dict[int, DocumentInfo]:
+        """문서 정보 조회 (없는 문서는 결과에서 빠짐)"""
+        found: dict[int, DocumentInfo] = {}
+        with self._lock:
+            for document_id in document_ids:
+                info = self._entries.get(document_id)
+                if info is not None:
+                    self._entries.move_to_end(document_id)
+                    found[document_id] = info
+        missing = document_ids - found.keys()
+        CACHE_REQUESTS.labels(cache="document_info", result="hit").inc(len(found))
+        if not missing:
+            return found
+
+        CACHE_REQUESTS.labels(cache="document_info", result="miss").inc(len(missing))
+        rows = db.execute(
+            text(
+                "SELECT id, original_filename, collection FROM documents "
+                "WHERE id = ANY(:ids)"
+            ),
+            {"ids": list(missing)},
+        ).fetchall()
+        with self._lock:
+            for row in rows:
+                info = DocumentInfo(row.id, row.original_filename, row.collection)
+                self._entries[row.id] = info
+                found[row.id] = info
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+        return found
+
+    def invalidate(self, document_id: int):
+        with self._lock:
+            self._entries.pop(document_id, None)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+document_cache = DocumentInfoCache(get_settings().document_cache_max_entries)
@@ -0,0 +1,110 @@
+"""프로세스 내 이벤트 버스 - 토픽별 pub/sub
+
+모델 다운로드, 문서 처리 등 진행 상황을 SSE 스트림으로 바로 전달하기 위해 사용한다.
+구독자는 자신의 이벤트 루프에서 큐로 이벤트를 받으며, 워커 스레드에서 발행해도
+안전하다. 구독하지 않는 토픽의 발행은 마지막 이벤트 기록만 남기므로 비용이 거의 없다.
+"""
+
+import asyncio
+import threading
+from contextlib import contextmanager
+from typing import Any, Iterator, Optional
+
+# 종료 이벤트 (수신 후 스트림 종료)
+TERMINAL_EVENTS = {"complete", "error"}
+
+
+class Subscription:
+    """토픽 구독 - 크기 제한 큐 (가득 차면 오래된 이벤트부터 버림)"""
+
+    def __init__(self, topic: str, max_queue: int):
+        self.topic = topic
+        self._loop = asyncio.get_running_loop()
+        self._queue: asyncio.Queue[dict] = asyncio.Queue(maxsize=max_queue)
+
+    def _put(self, event: dict):
+        if self._queue.full():
+            # 진행률 이벤트는 최신 값만 의미가 있으므로 가장 오래된 것을 버림
+            self._queue.get_nowait()
+        self._queue.put_nowait(event)
+
+    def deliver(self, event: dict):
+        """이벤트 전달 (다른 스레드에서 호출 가능)"""
+        try:
+            running = asyncio.get_running_loop()
+        except RuntimeError:
+            running = None
+        if running is self._loop:
+            self._put(event)
+        else:
+            self._loop.call_soon_threadsafe(self._put, event)
+
+    async def get(self) -> dict:
+        return await self._queue.get()
+
+    def __aiter__(self):
+        return self
+
+    async def __anext__(self) -> dict:
+        return await self.get()
+
+
+class EventBus:
+    """토픽별 구독자 관리 및 이벤트 발행"""
+
+    def __init__(self, max_queue: int = 100):
+        self.max_queue = max_queue
+        self._lock = threading.Lock()
+        self._subscribers: dict[str, set[Subscription]] = {}
+        self._last: dict[str, dict] = {}
+
+    def publish(self, topic: str, event_type: str, data: dict[str, Any]):
+        """이벤트 발행 (스레드 안전)"""
+        event = {"event": event_type, "data": data}
+        with self._lock:
+            self._last[topic] = event
+            subscribers = list(self._subscribers.get(topic, ()))
+        for subscription in subscribers:
+            subscription.deliver(event)
+
+    def last_event(self, topic: str) -> Optional[dict]:
+        """토픽의 마지막 이벤트"""
+        with self._lock:
+            return self._last.get(topic)
+
+    def clear(self, topic: str):
+        """마지막 이벤트 기록 삭제"""
+        with self._lock:
+            self._last.pop(topic, None)
+
+    @contextmanager
+    def subscribe(self, topic: str, replay_last: bool = True) -> Iterator[Subscription]:
+        """토픽 구독 (with 블록 동안 유지)
+
+        replay_last 가 True 면 마지막 이벤트를 먼저 받아 현재 상태에서 시작한다.
+        """
+        subscription = Subscription(topic, self.max_queue)
+        with self._lock:
+            self._subscribers.setdefault(topic, set()).add(subscription)
+            last = self._last.get(topic)
+        if replay_last and last is not None:
+            subscription._put(last)
+        try:
+            yield subscription
+        finally:
+            with self._lock:
+                subscribers = self._subscribers.get(topic)
+                if subscribers is not None:
+                    subscribers.discard(subscription)
+                    if not subscribers:
+                        del self._subscribers[topic]
+
+    def subscriber_count(self, topic: Optional[str] = None) -> int:
+        with self._lock:
+            if topic is not None:
+                return len(self._subscribers.get(topic, ()))
+            return sum(len(s) for s in self._subscribers.values())
+
+
+# 애플리케이션 전역 이벤트 버스
+event_bus = EventBus()
@@ -1,16 +1,24 @@
 import os
 import uuid
 from pathlib import Path
+from typing import Optional
 from pypdf import PdfReader
 from langchain.text_splitter import RecursiveCharacterTextSplitter
 from sqlalchemy.orm import Session
 
 from app.config import get_settings
 from app.models import Document, DocumentChunk
+from app.services.document_cache import document_cache
+from app.vectorstores import get_vector_store
 from app.providers.embedding.base import BaseEmbeddingProvider
+from app.metrics import track_stage
+from app.tracing import trace_span
 
 settings = get_settings()
 
+# 트레이싱 span 하나가 담당하는 페이지 수
+PAGES_PER_SPAN = 10
+
 
 class PDFService:
     """PDF 처리 서비스 - Embedding Provider를 주입받아 사용"""
@@ -25,11 +33,57 @@ class PDFService:
         self.upload_dir = Path(settings.upload_dir)
         self.upload_dir.mkdir(parents=True, exist_ok=True)
 
+    def _extract_chunks(self, reader: PdfReader) -> list[dict]:
+        """페이지별 텍스트 추출 및 청크 분할"""
+        all_chunks = []
+        page_count = len(reader.pages)
+        with track_stage("pdf", "extract"):
+            for start in range(0, page_count, PAGES_PER_SPAN):
+                end = min(start + PAGES_PER_SPAN, page_count)
+                with trace_span("pdf.extract_pages", {
+                    "pdf.page_start": start + 1,
+                    "pdf.page_end": end,
+                }) as span:
+                    chunk_count = len(all_chunks)
+                    for page_num in range(start, end):
+                        text = reader.pages[page_num].extract_text()
+                        if text.strip():
+                            chunks = self.text_splitter.split_text(text)
+                            for chunk_text in chunks:
+                                all_chunks.append({
+                                    "text": chunk_text,
+                                    "page_number": page_num + 1
+                                })
+                    span.set_attribute("pdf.chunk_count", len(all_chunks) - chunk_count)
+        return all_chunks
+
+    def _add_chunks(
+        self,
+        document: Document,
+        chunks: list[dict],
+        embeddings: list[list[float]],
+        db: Session
+    ):
+        """청크 레코드 추가 (commit 은 호출자가 수행)"""
+        for idx, (chunk, embedding) in enumerate(zip(chunks, embeddings)):
+            chunk_record = DocumentChunk(
+                document_id=document.id,
+                collection=document.collection,
+                chunk_index=idx,
+                content=chunk["text"],
+                embedding=embedding,
+                page_number=chunk["page_number"],
+                doc_metadata=dict(document.doc_metadata or {}),
+            )
+            db.add(chunk_record)
+
     async def process_pdf(
         self,
         file_content: bytes,
         original_filename: str,
-        db: Session
+        db: Session,
+        metadata: Optional[dict] = None,
+        collection: Optional[str] = None
     ) -> Document:
         """PDF 파일 처리 및 임베딩 생성"""
         # Generate unique filename
@@ -38,8 +92,9 @@ class PDFService:
         file_path = self.upload_dir / filename
 
         # Save file
-        with open(file_path, "wb") as f:
-            f.write(file_content)
+        with track_stage("pdf", "save_file"):
+            with open(file_path, "wb") as f:
+                f.write(file_content)
 
         # Read PDF
         reader = PdfReader(file_path)
@@ -55,40 +110,40 @@ class PDFService:
             embedding_provider=self.embeddings.provider_name,
             embedding_model=self.embeddings.config.model_name,
             embedding_dimension=self.embeddings.dimension,
+            doc_metadata=metadata or {},
+            collection=collection or settings.collection_name,
         )
         db.add(document)
         db.flush()
 
         # Extract text and create chunks
-        all_chunks = []
-        for page_num, page in enumerate(reader.pages):
-            text = page.extract_text()
-            if text.strip():
-                chunks = self.text_splitter.split_text(text)
-                for chunk_text in chunks:
-                    all_chunks.append({
-                        "text": chunk_text,
-                        "page_number": page_num + 1
-                    })
+        all_chunks = self._extract_chunks(reader)
 
         # Generate embeddings using Provider abstraction
         texts = [chunk["text"] for chunk in all_chunks]
-        embeddings = await self.embeddings.embed_documents(texts)
+        with track_stage("pdf", "embed"):
+            embeddings = await self.embeddings.embed_documents(texts)
 
         # Store chunks with embeddings
-        for idx, (chunk, embedding) in enumerate(zip(all_chunks, embeddings)):
-            chunk_record = DocumentChunk(
-                document_id=document.id,
-                chunk_index=idx,
-                content=chunk["text"],
-                embedding=embedding,
-                page_number=chunk["page_number"]
-            )
-            db.add(chunk_record)
+        with track_stage("pdf", "insert"), \
+                trace_span("pdf.insert_chunks", {"pdf.chunk_count": len(all_chunks)}):
+            self._add_chunks(document, all_chunks, embeddings, db)
+            db.commit()
+        get_vector_store().sync_document(db, document.collection, document.id)
+        db.refresh(document)
+
+        return document
 
+    def update_metadata(self, document: Document, metadata: dict, db: Session) -> Document:
+        """문서 메타데이터 교체 (검색 필터용 청크 사본도 함께 갱신)"""
+        document.doc_metadata = metadata
+        db.query(DocumentChunk).filter(
+            DocumentChunk.collection == document.collection,
+            DocumentChunk.document_id == document.id,
+        ).update({DocumentChunk.doc_metadata: metadata}, synchronize_session=False)
         db.commit()
+        document_cache.invalidate(document.id)
         db.refresh(document)
-
         return document
 
     def delete_document(self, document: Document, db: Session):
@@ -99,12 +154,16 @@ class PDFService:
 
         # Delete chunks
         db.query(DocumentChunk).filter(
-            DocumentChunk.document_id == document.id
+            DocumentChunk.collection == document.collection,
+            DocumentChunk.document_id == document.id,
         ).delete()
 
         # Delete document
+        collection, document_id = document.collection, document.id
         db.delete(document)
         db.commit()
+        document_cache.invalidate(document_id)
+        get_vector_store().remove_document(collection, document_id)
 
     async def reindex_document(
         self,
@@ -117,42 +176,31 @@ class PDFService:
 
         # Delete existing chunks
         db.query(DocumentChunk).filter(
-            DocumentChunk.document_id == document.id
+            DocumentChunk.collection == document.collection,
+            DocumentChunk.document_id == document.id,
         ).delete()
 
         # Extract text and create chunks
-        all_chunks = []
-        for page_num, page in enumerate(reader.pages):
-            text = page.extract_text()
-            if text.strip():
-                chunks = self.text_splitter.split_text(text)
-                for chunk_text in chunks:
-                    all_chunks.append({
-                        "text": chunk_text,
-                        "page_number": page_num + 1
-                    })
+        all_chunks = self._extract_chunks(reader)
 
         # Generate new embeddings
         texts = [chunk["text"] for chunk in all_chunks]
-        embeddings = await self.embeddings.embed_documents(texts)
+        with track_stage("pdf", "embed"):
+            embeddings = await self.embeddings.embed_documents(texts)
 
         # Store chunks with new embeddings
-        for idx, (chunk, embedding) in enumerate(zip(all_chunks, embeddings)):
-            chunk_record = DocumentChunk(
-                document_id=document.id,
-                chunk_index=idx,
-                content=chunk["text"],
-                embedding=embedding,
-                page_number=chunk["page_number"]
-            )
-            db.add(chunk_record)
-
-        # Update document embedding metadata
-        document.embedding_provider = self.embeddings.provider_name
-        document.embedding_model = self.embeddings.config.model_name
-        document.embedding_dimension = self.embeddings.dimension
-
-        db.commit()
+        with track_stage("pdf", "insert"), \
+                trace_span("pdf.insert_chunks", {"pdf.chunk_count": len(all_chunks)}):
+            self._add_chunks(document, all_chunks, embeddings, db)
+
+            # Update document embedding metadata
+            document.embedding_provider = self.embeddings.provider_name
+            document.embedding_model = self.embeddings.config.model_name
+            document.embedding_dimension = self.embeddings.dimension
+
+            db.commit()
+        document_cache.invalidate(document.id)
+        get_vector_store().sync_document(db, document.collection, document.id)
         db.refresh(document)
 
         return document
@@ -1,10 +1,46 @@
+import json
+import re
+
 from sqlalchemy.orm import Session
-from sqlalchemy import text
 
+from app.config import get_settings
+from app.database import SessionLocal
 from app.providers.llm.base import BaseLLMProvider
 from app.providers.embedding.base import BaseEmbeddingProvider
 from app.providers.base import LLMMessage
-from app.schemas import SearchResult
+from app.schemas import SearchResult, SearchFields
+from app.services.document_cache import document_cache
+from app.services.singleflight import SingleFlight
+from app.metrics import track_stage, SEARCH_STRATEGY
+from app.tracing import trace_span
+from app.vectorstores import get_vector_store
+
+# 동일한 동시 요청 병합 (RAGService 는 요청마다 생성되므로 모듈 단위로 공유)
+search_flight = SingleFlight("search")
+chat_flight = SingleFlight("chat")
+
+settings = get_settings()
+
+
+def make_snippet(content: str, query: str, max_chars: int) -> str:
+    """질의어가 처음 등장하는 위치 주변 max_chars 글자 발췌"""
+    if len(content) <= max_chars:
+        return content
+    lowered = content.lower()
+    positions = [
+        lowered.find(term)
+        for term in re.findall(r"\w{2,}", query.lower())
+    ]
+    positions = [p for p in positions if p >= 0]
+    center = min(positions) if positions else 0
+    start = max(0, min(center - max_chars // 3, len(content) - max_chars))
+    end = start + max_chars
+    snippet = content[start:end].strip()
+    if start > 0:
+        snippet = "…" + snippet
+    if end < len(content):
+        snippet += "…"
+    return snippet
 
 
 class RAGService:
@@ -18,76 +54,175 @@ class RAGService:
         self.llm = llm_provider
         self.embeddings = embedding_provider
 
+    def _search_key(
+        self,
+        query: str,
+        top_k: int,
+        document_ids: list[int] | None,
+        filters: dict | None = None,
+        collection: str | None = None,
+        fields: SearchFields = "content"
+    ) -> tuple:
+        """검색 병합 키"""
+        return (
+            collection or settings.collection_name,
+            fields,
+            query,
+            top_k,
+            tuple(sorted(document_ids)) if document_ids else None,
+            json.dumps(filters, sort_keys=True) if filters else None,
+            self.embeddings.provider_name,
+            self.embeddings.config.model_name,
+        )
+
     async def search(
         self,
         query: str,
-        db: Session,
         top_k: int = 5,
-        document_ids: list[int] | None = None
+        document_ids: list[int] | None = None,
+        filters: dict | None = None,
+        collection: str | None = None,
+        fields: SearchFields = "content"
     ) -> list[SearchResult]:
-        """벡터 검색 수행"""
-        # Generate query embedding
-        query_embedding = await self.embeddings.embed_query(query)
-
-        # Build search query with cosine similarity
-        base_query = """
-            SELECT
-                dc.id as chunk_id,
-                dc.document_id,
-                d.original_filename as filename,
-                dc.content,
-                dc.page_number,
-                1 - (dc.embedding <=> :embedding::vector) as score
-            FROM document_chunks dc
-            JOIN documents d ON dc.document_id = d.id
+        """벡터 검색 수행 (동일한 동시 요청은 한 번만 실행)
+
+        fields: "ids" (ID와 점수만), "snippet" (질의어 주변 발췌), "content" (청크 전체)
         """
+        results = await search_flight.do(
+            self._search_key(query, top_k, document_ids, filters, collection, fields),
+            lambda: self._search_in_session(
+                query, top_k, document_ids, filters, collection, fields
+            ),
+        )
+        return list(results)
 
-        if document_ids:
-            base_query += " WHERE dc.document_id = ANY(:doc_ids)"
+    async def _search_in_session(
+        self,
+        query: str,
+        top_k: int,
+        document_ids: list[int] | None,
+        filters: dict | None,
+        collection: str | None,
+        fields: SearchFields
+    ) -> list[SearchResult]:
+        """병합된 검색 실행 - 요청 세션 대신 자체 읽기 세션 사용
 
-        base_query += """
-            ORDER BY dc.embedding <=> :embedding::vector
-            LIMIT :limit
+        최초 요청이 끝나거나 취소되어 그 요청의 세션이 닫혀도 합류한 요청은 영향이 없다.
         """
+        with SessionLocal(info={"read_only": True}) as db:
+            return await self._search(
+                query, db, top_k, document_ids, filters, collection, fields
+            )
 
-        params = {
-            "embedding": str(query_embedding),
-            "limit": top_k
-        }
-        if document_ids:
-            params["doc_ids"] = document_ids
-
-        result = db.execute(text(base_query), params)
-        rows = result.fetchall()
+    async def _search(
+        self,
+        query: str,
+        db: Session,
+        top_k: int,
+        document_ids: list[int] | None,
+        filters: dict | None = None,
+        collection: str | None = None,
+        fields: SearchFields = "content"
+    ) -> list[SearchResult]:
+        """벡터 검색 실행 (컬렉션 단위, 벡터 저장소 백엔드 사용)"""
+        collection = collection or settings.collection_name
+        store = get_vector_store()
+        with trace_span("rag.search", {
+            "rag.collection": collection,
+            "rag.top_k": top_k,
+            "rag.query_length": len(query),
+            "rag.document_filter": len(document_ids or []),
+            "rag.metadata_filter": bool(filters),
+            "rag.fields": fields,
+            "rag.vector_store": store.name,
+        }) as search_span:
+            # Generate query embedding
+            with track_stage("rag", "embed_query"):
+                query_embedding = await self.embeddings.embed_query(query)
 
-        return [
-            SearchResult(
-                chunk_id=row.chunk_id,
-                document_id=row.document_id,
-                filename=row.filename,
-                content=row.content,
-                page_number=row.page_number,
-                score=float(row.score)
+            strategy, rows = store.search(
+                db,
+                collection,
+                query_embedding,
+                top_k,
+                document_ids,
+                filters,
+                with_content=fields != "ids",
             )
-            for row in rows
-        ]
+            search_span.set_attribute("rag.search_strategy", strategy)
+            SEARCH_STRATEGY.labels(strategy).inc()
+
+            # 파일명은 documents 조인 대신 캐시에서 (삭제된 문서의 청크는 제외)
+            documents = document_cache.get_many(db, {row.document_id for row in rows})
+
+            return [
+                SearchResult(
+                    chunk_id=row.chunk_id,
+                    document_id=row.document_id,
+                    filename=documents[row.document_id].original_filename,
+                    content=row.content if fields == "content" else None,
+                    snippet=(make_snippet(row.content, query, settings.search_snippet_chars)
+                             if fields == "snippet" else None),
+                    page_number=row.page_number,
+                    score=1 - float(row.distance)
+                )
+                for row in rows
+                if row.document_id in documents
+            ]
 
     async def chat(
         self,
         query: str,
-        db: Session,
         top_k: int = 5,
-        document_ids: list[int] | None = None
+        document_ids: list[int] | None = None,
+        filters: dict | None = None,
+        collection: str | None = None
     ) -> tuple[str, list[SearchResult]]:
-        """RAG 기반 채팅"""
-        # Search for relevant documents
-        search_results = await self.search(
-            query=query,
-            db=db,
-            top_k=top_k,
-            document_ids=document_ids
+        """RAG 기반 채팅 (동일한 동시 요청은 한 번만 실행)"""
+        key = self._search_key(query, top_k, document_ids, filters, collection) + (
+            self.llm.provider_name,
+            self.llm.config.model_name,
+            self.llm.config.temperature,
+        )
+        answer, sources = await chat_flight.do(
+            key,
+            lambda: self._chat(query, top_k, document_ids, filters, collection),
         )
+        return answer, list(sources)
+
+    async def _chat(
+        self,
+        query: str,
+        top_k: int,
+        document_ids: list[int] | None,
+        filters: dict | None = None,
+        collection: str | None = None
+    ) -> tuple[str, list[SearchResult]]:
+        """RAG 기반 채팅 실행"""
+        with trace_span("rag.chat", {"rag.top_k": top_k}):
+            # Search for relevant documents
+            search_results = await self.search(
+                query=query,
+                top_k=top_k,
+                document_ids=document_ids,
+                filters=filters,
+                collection=collection
+            )
+
+            messages = self._build_messages(query, search_results)
+
+            # Generate response using LLM Provider
+            with track_stage("rag", "llm_generate"):
+                response = await self.llm.generate(messages)
+
+            return response.content, search_results
 
+    def _build_messages(
+        self,
+        query: str,
+        search_results: list[SearchResult]
+    ) -> list[LLMMessage]:
+        """검색 결과로 컨텍스트를 구성하여 LLM 메시지 생성"""
         # Build context from search results
         context_parts = []
         for result in search_results:
@@ -100,7 +235,7 @@ class RAGService:
         context = "\n\n---\n\n".join(context_parts)
 
         # Create messages using Provider abstraction
-        messages = [
+        return [
             LLMMessage(
                 role="system",
                 content="""당신은 문서 검색 도우미입니다. 제공된 문서 내용을 기반으로 사용자의 질문에 답변해주세요.
@@ -121,8 +256,3 @@ class RAGService:
 위 문서 내용을 기반으로 질문에 답변해주세요."""
             )
         ]
-
-        # Generate response using LLM Provider
-        response = await self.llm.generate(messages)
-
-        return response.content, search_results
@@ -0,0 +1,48 @@
+"""Single-flight - 동일한 동시 요청을 하나의 실행으로 병합"""
+
+import asyncio
+from dataclasses import dataclass
+from typing import Any, Awaitable, Callable, Hashable
+
+
+@dataclass
+class SingleFlightStats:
+    """병합 통계"""
+    executed: int = 0  # 실제 실행 횟수
+    coalesced: int = 0  # 진행 중인 실행에 합류한 요청 수
+
+
+class SingleFlight:
+    """키별로 진행 중인 실행을 공유
+
+    첫 요청이 실행을 시작하고, 같은 키로 들어온 요청들은 그 결과(또는 예외)를
+    함께 받는다. 실행은 별도 Task 로 돌기 때문에 최초 요청이 취소되어도
+    나머지 대기자에게는 영향이 없다. 따라서 fn 은 최초 요청에 묶인 자원(요청
+    스코프 DB 세션 등)을 쓰지 말고 필요한 자원을 직접 열고 닫아야 한다.
+    """
+
+    def __init__(self, name: str):
+        self.name = name
+        self._in_flight: dict[Hashable, asyncio.Task] = {}
+        self.stats = SingleFlightStats()
+
+    async def do(self, key: Hashable, fn: Callable[[], Awaitable[Any]]) -> Any:
+        """key 에 대해 fn 을 한 번만 실행하고 결과 공유"""
+        task = self._in_flight.get(key)
+        if task is None:
+            task = asyncio.create_task(fn())
+            self._in_flight[key] = task
+            task.add_done_callback(lambda _: self._in_flight.pop(key, None))
+            self.stats.executed += 1
+        else:
+            self.stats.coalesced += 1
+        return await asyncio.shield(task)
+
+    def snapshot(self) -> dict:
+        """현재 통계"""
+        return {
+            "name": self.name,
+            "executed": self.stats.executed,
+            "coalesced": self.stats.coalesced,
+            "in_flight": len(self._in_flight),
+        }
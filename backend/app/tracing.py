@@ -0,0 +1,99 @@
+"""OpenTelemetry 분산 트레이싱
+
+`TRACING_EXPORTER=none`(기본) 이면 opentelemetry 를 import 하지 않으며
+`trace_span()` 은 공유 no-op 객체를 반환한다.
+"""
+
+from typing import Any, Optional
+
+from app.config import Settings
+
+_tracer = None
+_memory_exporter = None
+
+
+class _NoopSpan:
+    """트레이싱 비활성화 시 사용하는 빈 span"""
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+    def set_attribute(self, key: str, value: Any):
+        pass
+
+    def set_attributes(self, attributes: dict):
+        pass
+
+
+_NOOP_SPAN = _NoopSpan()
+
+
+def setup_tracing(app, settings: Settings):
+    """Tracer Provider 설정 및 FastAPI 요청 span 활성화"""
+    global _tracer, _memory_exporter
+
+    if settings.tracing_exporter == "none":
+        return
+
+    try:
+        from opentelemetry import trace
+        from opentelemetry.sdk.resources import Resource
+        from opentelemetry.sdk.trace import TracerProvider
+        from opentelemetry.sdk.trace.export import (
+            BatchSpanProcessor,
+            SimpleSpanProcessor,
+            ConsoleSpanExporter,
+        )
+        from opentelemetry.instrumentation.fastapi import FastAPIInstrumentor
+    except ImportError:
+        raise RuntimeError(
+            "opentelemetry not installed. "
+            "Run: pip install opentelemetry-sdk opentelemetry-instrumentation-fastapi"
+        )
+
+    provider = TracerProvider(
+        resource=Resource.create({"service.name": settings.tracing_service_name})
+    )
+
+    if settings.tracing_exporter == "otlp":
+        try:
+            from opentelemetry.exporter.otlp.proto.http.trace_exporter import (
+                OTLPSpanExporter,
+            )
+        except ImportError:
+            raise RuntimeError(
+                "OTLP exporter not installed. "
+                "Run: pip install opentelemetry-exporter-otlp-proto-http"
+            )
+        provider.add_span_processor(BatchSpanProcessor(
+            OTLPSpanExporter(endpoint=settings.otlp_endpoint)
+        ))
+    elif settings.tracing_exporter == "console":
+        provider.add_span_processor(SimpleSpanProcessor(ConsoleSpanExporter()))
+    elif settings.tracing_exporter == "memory":
+        from opentelemetry.sdk.trace.export.in_memory_span_exporter import (
+            InMemorySpanExporter,
+        )
+        _memory_exporter = InMemorySpanExporter()
+        provider.add_span_processor(SimpleSpanProcessor(_memory_exporter))
+
+    trace.set_tracer_provider(provider)
+    _tracer = trace.get_tracer("ragdocsearch")
+    FastAPIInstrumentor.instrument_app(app, tracer_provider=provider)
+
+
+def trace_span(name: str, attributes: Optional[dict] = None):
+    """child span 생성 (with 문으로 사용, 비활성화 시 no-op)"""
+    if _tracer is None:
+        return _NOOP_SPAN
+    return _tracer.start_as_current_span(name, attributes=attributes)
+
+
+def get_finished_spans() -> list:
+    """in-memory exporter 에 기록된 span 목록 (테스트용)"""
+    if _memory_exporter is None:
+        return []
+    return list(_memory_exporter.get_finished_spans())
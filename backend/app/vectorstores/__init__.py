@@ -0,0 +1,28 @@
+"""벡터 저장소 모듈 - 검색 백엔드 (pgvector / 프로세스 내장 인덱스)"""
+
+from typing import Optional
+
+from app.config import get_settings
+from .base import BaseVectorStore
+from .postgres import PgVectorStore
+
+__all__ = [
+    "BaseVectorStore",
+    "PgVectorStore",
+    "get_vector_store",
+]
+
+_store: Optional[BaseVectorStore] = None
+
+
+def get_vector_store() -> BaseVectorStore:
+    """설정(VECTOR_STORE)에 따른 프로세스 공용 벡터 저장소"""
+    global _store
+    if _store is None:
+        settings = get_settings()
+        if settings.vector_store == "hnswlib":
+            from .hnsw import HnswVectorStore
+            _store = HnswVectorStore(settings.vector_index_dir)
+        else:
+            _store = PgVectorStore()
+    return _store
@@ -0,0 +1,46 @@
+"""벡터 저장소 인터페이스
+
+벡터 저장소는 질의 벡터에 가까운 청크의 ID/문서/페이지/거리만 책임진다.
+청크 본문과 문서 정보는 백엔드와 관계없이 항상 Postgres 가 기준이다.
+"""
+
+from abc import ABC, abstractmethod
+
+from sqlalchemy.orm import Session
+
+from app.repositories.search_repository import SearchRow
+
+
+class BaseVectorStore(ABC):
+    """벡터 검색 백엔드 추상 클래스"""
+
+    name: str = "base"
+
+    @abstractmethod
+    def search(
+        self,
+        db: Session,
+        collection: str,
+        embedding: list[float],
+        top_k: int,
+        document_ids: list[int] | None = None,
+        filters: dict | None = None,
+        with_content: bool = True,
+    ) -> tuple[str, list[SearchRow]]:
+        """가까운 청크 검색 - (검색 전략, 거리 오름차순 결과)"""
+        pass
+
+    async def run(self, sync_interval: float):
+        """시작 시 준비 및 주기적 동기화 (lifespan 에서 Task 로 실행)"""
+
+    def close(self):
+        """종료 시 정리"""
+
+    def sync_document(self, db: Session, collection: str, document_id: int):
+        """문서 청크 추가/재인덱싱 반영 (commit 이후 호출)"""
+
+    def remove_document(self, collection: str, document_id: int):
+        """문서 삭제 반영"""
+
+    def drop_collection(self, collection: str):
+        """컬렉션 삭제 반영"""
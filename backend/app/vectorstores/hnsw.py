@@ -0,0 +1,448 @@
+"""프로세스 내장 ANN 인덱스 (hnswlib) 벡터 저장소
+
+검색마다 Postgres 로 벡터 검색을 보내지 않고 프로세스 메모리의 HNSW 그래프에서 가까운
+청크를 찾는다. 컬렉션마다 인덱스 하나를 VECTOR_INDEX_DIR 에 저장하고, 시작 시 저장된
+인덱스를 읽은 뒤 document_chunks 와 청크 ID 를 비교해 달라진 청크만 추가/삭제한다.
+같은 프로세스의 업로드/삭제/재인덱싱은 바로 반영하고, 다른 워커나 노드의 변경은
+주기적 동기화로 따라잡는다. 청크 본문과 문서 정보는 항상 Postgres 에서 읽는다.
+"""
+
+import asyncio
+import json
+import logging
+import os
+import tempfile
+import threading
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Optional
+
+import numpy as np
+from sqlalchemy import text
+from sqlalchemy.orm import Session
+
+from app.config import get_settings
+from app.metrics import track_stage
+from app.repositories.search_repository import SearchRow
+from app.tracing import trace_span
+from .base import BaseVectorStore
+from .postgres import PgVectorStore
+
+try:
+    import fcntl
+except ImportError:  # Windows - 프로세스 간 잠금 없이 임시 파일 이름만 분리
+    fcntl = None
+
+logger = logging.getLogger(__name__)
+
+settings = get_settings()
+
+INITIAL_CAPACITY = 1024
+SYNC_BATCH_SIZE = 1000  # 동기화 시 한 번에 읽어 추가할 청크 수 (배치 사이에 검색 가능)
+
+CHUNK_ROWS_SQL = """
+    SELECT id, document_id, page_number, embedding
+    FROM document_chunks
+    WHERE collection = :collection AND {condition}
+"""
+
+
+class _CollectionIndex:
+    """컬렉션 하나의 HNSW 인덱스와 청크 ID -> (문서 ID, 페이지) 매핑
+
+    hnswlib 은 삭제 표시(mark_deleted)한 자리를 새 청크로 재사용하므로
+    재인덱싱이 반복되어도 인덱스 크기는 살아 있는 청크 수를 따라간다.
+    """
+
+    def __init__(self, collection: str, index, chunks: dict[int, tuple[int, Optional[int]]]):
+        self.collection = collection
+        self.index = index
+        self.chunks = chunks
+        self.documents: dict[int, set[int]] = {}
+        for chunk_id, (document_id, _) in chunks.items():
+            self.documents.setdefault(document_id, set()).add(chunk_id)
+        self.lock = threading.RLock()
+        self.ready = False  # 첫 동기화 전에는 pgvector 로 검색
+        self.dirty = False
+
+    def add(self, rows):
+        """청크 추가 (rows: id, document_id, page_number, embedding)"""
+        rows = [row for row in rows if row[0] not in self.chunks]
+        if not rows:
+            return
+        needed = len(self.chunks) + len(rows)
+        capacity = self.index.get_max_elements()
+        if needed > capacity:
+            self.index.resize_index(max(needed, capacity * 2))
+        self.index.add_items(
+            np.asarray([row[3] for row in rows], dtype=np.float32),
+            np.asarray([row[0] for row in rows], dtype=np.uint64),
+            replace_deleted=True,
+        )
+        for chunk_id, document_id, page_number, _ in rows:
+            self.chunks[chunk_id] = (document_id, page_number)
+            self.documents.setdefault(document_id, set()).add(chunk_id)
+        self.dirty = True
+
+    def remove(self, chunk_ids):
+        for chunk_id in list(chunk_ids):
+            entry = self.chunks.pop(chunk_id, None)
+            if entry is None:
+                continue
+            self.index.mark_deleted(chunk_id)
+            document_chunks = self.documents[entry[0]]
+            document_chunks.discard(chunk_id)
+            if not document_chunks:
+                del self.documents[entry[0]]
+            self.dirty = True
+
+    def _exact(self, candidates: list[int], query: np.ndarray, k: int):
+        """후보 청크 전체 코사인 거리 계산 (인덱스에는 정규화된 벡터가 저장됨)"""
+        vectors = self.index.get_items(candidates, return_type="numpy")
+        distances = 1 - vectors @ (query / (np.linalg.norm(query) or 1.0))
+        order = np.argsort(distances)[:k]
+        return [candidates[i] for i in order], distances[order]
+
+    def search(
+        self,
+        query: np.ndarray,
+        top_k: int,
+        document_ids: Optional[set[int]],
+        exact_max_rows: int,
+        ef_search: int,
+    ) -> tuple[str, list[SearchRow]]:
+        """가까운 청크 검색 (문서 필터가 작으면 정확 검색, 크면 필터 적용 ANN)"""
+        with self.lock:
+            candidates = None
+            if document_ids is not None:
+                candidates = [
+                    chunk_id
+                    for document_id in document_ids
+                    for chunk_id in self.documents.get(document_id, ())
+                ]
+            k = min(top_k, len(self.chunks) if candidates is None else len(candidates))
+            if k == 0:
+                return "embedded", []
+
+            if candidates is not None and len(candidates) <= exact_max_rows:
+                strategy = "embedded_exact"
+                labels, distances = self._exact(candidates, query, k)
+            else:
+                strategy = "embedded"
+                allowed = set(candidates).__contains__ if candidates is not None else None
+                self.index.set_ef(max(ef_search, k))
+                try:
+                    labels, distances = self.index.knn_query(
+                        query, k=k, num_threads=1, filter=allowed
+                    )
+                    labels, distances = labels[0], distances[0]
+                except RuntimeError:
+                    # 필터를 통과한 이웃을 k 개 찾지 못함 → 후보 전체 정확 검색
+                    strategy = "embedded_exact"
+                    labels, distances = self._exact(
+                        candidates if candidates is not None else list(self.chunks), query, k
+                    )
+
+            rows = []
+            for label, distance in zip(labels, distances):
+                document_id, page_number = self.chunks[int(label)]
+                rows.append(SearchRow(int(label), document_id, None, page_number, float(distance)))
+            return strategy, rows
+
+
+class HnswVectorStore(BaseVectorStore):
+    """hnswlib 컬렉션별 인덱스 (선택 설치: pip install hnswlib)"""
+
+    name = "hnswlib"
+
+    def __init__(self, index_dir: str):
+        try:
+            import hnswlib
+        except ImportError:
+            raise RuntimeError(
+                "hnswlib not installed. Run: pip install hnswlib"
+            )
+        from app.models import DocumentChunk
+
+        self._hnswlib = hnswlib
+        self.index_dir = Path(index_dir)
+        self.index_dir.mkdir(parents=True, exist_ok=True)
+        self.dimension = DocumentChunk.embedding.type.dim
+        self.fallback = PgVectorStore()
+        self._indexes: dict[str, _CollectionIndex] = {}
+        self._lock = threading.Lock()
+
+    def _paths(self, collection: str) -> tuple[Path, Path]:
+        """(HNSW 그래프 파일, 청크 매핑 파일)"""
+        return (
+            self.index_dir / f"{collection}.hnsw",
+            self.index_dir / f"{collection}.chunks.npz",
+        )
+
+    @contextmanager
+    def _file_lock(self, collection: str, exclusive: bool):
+        """컬렉션 인덱스 파일 잠금 (같은 VECTOR_INDEX_DIR 를 쓰는 워커/노드 간)
+
+        저장은 배타 잠금, 읽기는 공유 잠금으로 매핑과 그래프를 같은 저장본으로 맞춘다.
+        잠금은 파일을 닫을 때 풀린다.
+        """
+        with open(self.index_dir / f"{collection}.lock", "a") as f:
+            if fcntl is not None:
+                fcntl.flock(f, fcntl.LOCK_EX if exclusive else fcntl.LOCK_SH)
+            yield
+
+    def _replace(self, target: Path, write):
+        """프로세스별 임시 파일에 쓴 뒤 target 으로 교체"""
+        fd, name = tempfile.mkstemp(
+            dir=self.index_dir, prefix=f".{target.name}.", suffix=".tmp"
+        )
+        os.close(fd)
+        try:
+            write(name)
+            os.replace(name, target)
+        except BaseException:
+            Path(name).unlink(missing_ok=True)
+            raise
+
+    def _new_index(self, capacity: int = INITIAL_CAPACITY):
+        index = self._hnswlib.Index(space="cosine", dim=self.dimension)
+        index.init_index(
+            max_elements=capacity,
+            ef_construction=settings.collection_hnsw_ef_construction,
+            M=settings.collection_hnsw_m,
+            allow_replace_deleted=True,
+        )
+        return index
+
+    def _load(self, collection: str) -> _CollectionIndex:
+        """저장된 인덱스 읽기 (없거나 차원이 다르면 빈 인덱스)"""
+        index_path, chunks_path = self._paths(collection)
+        if index_path.exists() and chunks_path.exists():
+            try:
+                # 다른 프로세스가 저장 중이면 매핑/그래프 교체가 끝난 뒤 읽음
+                with self._file_lock(collection, exclusive=False):
+                    with np.load(chunks_path) as saved:
+                        dimension = int(saved["dimension"])
+                        table = saved["chunks"]
+                    if dimension != self.dimension:
+                        raise ValueError(f"dimension {dimension} != {self.dimension}")
+                    index = self._hnswlib.Index(space="cosine", dim=self.dimension)
+                    index.load_index(str(index_path), allow_replace_deleted=True)
+                # 매핑 저장 후 그래프 저장 전에 중단된 경우: 양쪽에 있는 청크만 사용
+                # (빠진 청크는 동기화에서 다시 추가)
+                labels = set(index.get_ids_list())
+                chunks = {
+                    int(chunk_id): (int(document_id), None if page_number < 0 else int(page_number))
+                    for chunk_id, document_id, page_number in table
+                    if int(chunk_id) in labels
+                }
+                for label in labels - chunks.keys():
+                    try:
+                        index.mark_deleted(label)
+                    except RuntimeError:
+                        pass  # 이미 삭제 표시됨
+                logger.info("Loaded vector index %s (%d chunks)", collection, len(chunks))
+                return _CollectionIndex(collection, index, chunks)
+            except Exception as e:
+                logger.warning("Discarding vector index for %s: %s", collection, e)
+        return _CollectionIndex(collection, self._new_index(), {})
+
+    def _get(self, collection: str) -> _CollectionIndex:
+        with self._lock:
+            entry = self._indexes.get(collection)
+            if entry is None:
+                entry = self._load(collection)
+                self._indexes[collection] = entry
+            return entry
+
+    @staticmethod
+    def _fetch_chunks(db: Session, collection: str, condition: str, params: dict) -> list:
+        # pgvector 어댑터가 embedding 을 numpy 배열로 반환 (binary)
+        return db.execute(
+            text(CHUNK_ROWS_SQL.format(condition=condition)),
+            {**params, "collection": collection},
+        ).all()
+
+    def sync_collection(self, db: Session, collection: str) -> tuple[int, int]:
+        """document_chunks 와 인덱스 비교 후 차이만 반영 - (추가 수, 삭제 수)"""
+        entry = self._get(collection)
+        # DB 조회 전 스냅샷 (조회 중 이 프로세스가 추가한 청크를 삭제로 오인하지 않도록)
+        with entry.lock:
+            indexed = set(entry.chunks)
+        stored = set(db.execute(
+            text("SELECT id FROM document_chunks WHERE collection = :collection"),
+            {"collection": collection},
+        ).scalars())
+
+        stale = indexed - stored
+        if stale:
+            with entry.lock:
+                entry.remove(stale)
+        missing = sorted(stored - indexed)
+        for start in range(0, len(missing), SYNC_BATCH_SIZE):
+            rows = self._fetch_chunks(
+                db, collection, "id = ANY(:ids)",
+                {"ids": missing[start:start + SYNC_BATCH_SIZE]},
+            )
+            with entry.lock:
+                entry.add(rows)
+        entry.ready = True
+        return len(missing), len(stale)
+
+    def sync_all(self):
+        """모든 컬렉션 동기화 후 변경된 인덱스 저장"""
+        from app.database import SessionLocal
+
+        # 복제 지연으로 방금 추가한 청크를 삭제로 오인하지 않도록 primary 에서 읽음
+        db = SessionLocal()
+        try:
+            names = set(db.execute(text("SELECT name FROM collections")).scalars())
+            for name in sorted(names):
+                added, removed = self.sync_collection(db, name)
+                if added or removed:
+                    logger.info(
+                        "Synced vector index %s (+%d, -%d)", name, added, removed
+                    )
+                db.rollback()
+        finally:
+            db.close()
+        for name in set(self._indexes) - names:
+            self.drop_collection(name)
+        self.save_all()
+
+    def save_all(self):
+        for entry in list(self._indexes.values()):
+            self._save(entry)
+
+    def _save(self, entry: _CollectionIndex):
+        """임시 파일에 쓴 뒤 교체 (매핑 → 그래프 순서, 배타 잠금)"""
+        index_path, chunks_path = self._paths(entry.collection)
+        with entry.lock:
+            if not entry.dirty:
+                return
+            table = np.array(
+                [
+                    (chunk_id, document_id, -1 if page_number is None else page_number)
+                    for chunk_id, (document_id, page_number) in entry.chunks.items()
+                ],
+                dtype=np.int64,
+            ).reshape(-1, 3)
+
+            def write_chunks(path: str):
+                with open(path, "wb") as f:
+                    np.savez(f, chunks=table, dimension=self.dimension)
+
+            with self._file_lock(entry.collection, exclusive=True):
+                self._replace(chunks_path, write_chunks)
+                self._replace(index_path, entry.index.save_index)
+            entry.dirty = False
+
+    async def run(self, sync_interval: float):
+        """시작 시 증분 재구성, 이후 sync_interval 마다 동기화 (0 이면 시작 시 한 번)"""
+        while True:
+            try:
+                await asyncio.to_thread(self.sync_all)
+            except Exception:
+                logger.exception("Vector index sync failed")
+            if sync_interval <= 0:
+                return
+            await asyncio.sleep(sync_interval)
+
+    def close(self):
+        self.save_all()
+
+    def sync_document(self, db: Session, collection: str, document_id: int):
+        entry = self._indexes.get(collection)
+        if entry is None:
+            return  # 아직 읽지 않은 컬렉션은 동기화에서 반영
+        try:
+            rows = self._fetch_chunks(
+                db, collection, "document_id = :document_id", {"document_id": document_id}
+            )
+            with entry.lock:
+                # 재인덱싱: 새 청크 ID 로 교체되므로 이전 청크 삭제 후 추가
+                current = {row[0] for row in rows}
+                entry.remove(entry.documents.get(document_id, set()) - current)
+                entry.add(rows)
+        except Exception as e:
+            # Postgres 에는 이미 반영됨, 다음 동기화에서 맞춰짐
+            logger.warning("Vector index update failed for document %s: %s", document_id, e)
+
+    def remove_document(self, collection: str, document_id: int):
+        entry = self._indexes.get(collection)
+        if entry is None:
+            return
+        with entry.lock:
+            entry.remove(entry.documents.get(document_id, set()))
+
+    def drop_collection(self, collection: str):
+        with self._lock:
+            self._indexes.pop(collection, None)
+        with self._file_lock(collection, exclusive=True):
+            for path in self._paths(collection):
+                path.unlink(missing_ok=True)
+
+    def _filter_documents(self, db: Session, collection: str, filters: dict) -> set[int]:
+        """메타데이터 필터에 맞는 문서 ID (청크 메타데이터는 문서 메타데이터 사본)"""
+        return set(db.execute(
+            text(
+                "SELECT id FROM documents "
+                "WHERE collection = :collection AND metadata @> CAST(:filters AS jsonb)"
+            ),
+            {"collection": collection, "filters": json.dumps(filters)},
+        ).scalars())
+
+    def search(
+        self,
+        db: Session,
+        collection: str,
+        embedding: list[float],
+        top_k: int,
+        document_ids: list[int] | None = None,
+        filters: dict | None = None,
+        with_content: bool = True,
+    ) -> tuple[str, list[SearchRow]]:
+        entry = self._indexes.get(collection)
+        if entry is None or not entry.ready:
+            # 첫 동기화 전이거나 새로 만든 컬렉션
+            return self.fallback.search(
+                db, collection, embedding, top_k, document_ids, filters, with_content
+            )
+
+        allowed = None
+        if filters:
+            with track_stage("rag", "plan_search"):
+                allowed = self._filter_documents(db, collection, filters)
+        if document_ids:
+            allowed = set(document_ids) if allowed is None else allowed & set(document_ids)
+
+        with track_stage("rag", "vector_search"), \
+                trace_span("vector_index.search", {
+                    "vector_index.collection": collection,
+                    "vector_index.size": len(entry.chunks),
+                }) as span:
+            strategy, rows = entry.search(
+                np.asarray(embedding, dtype=np.float32),
+                top_k,
+                allowed,
+                settings.search_exact_scan_max_rows,
+                settings.search_hnsw_ef_search or 40,
+            )
+            span.set_attribute("vector_index.row_count", len(rows))
+
+        if not with_content or not rows:
+            return strategy, rows
+
+        # 본문은 Postgres 기준 (동기화 전에 삭제된 청크는 제외)
+        with track_stage("rag", "fetch_content"), \
+                trace_span("db.fetch_chunks", {"db.system": "postgresql"}):
+            contents = dict(db.execute(
+                text(
+                    "SELECT id, content FROM document_chunks "
+                    "WHERE collection = :collection AND id = ANY(:ids)"
+                ),
+                {"collection": collection, "ids": [row.chunk_id for row in rows]},
+            ).all())
+        for row in rows:
+            row.content = contents.get(row.chunk_id)
+        return strategy, [row for row in rows if row.content is not None]
@@ -0,0 +1,44 @@
+"""pgvector 벡터 저장소 - 컬렉션 파티션 SQL 검색"""
+
+from sqlalchemy.orm import Session
+
+from app.metrics import track_stage
+from app.repositories.search_repository import SearchRepository, SearchRow
+from app.tracing import trace_span
+from .base import BaseVectorStore
+
+
+class PgVectorStore(BaseVectorStore):
+    """pgvector 검색 (필터 선택도에 따라 ANN 인덱스 / 정확 검색 / 반복 스캔)"""
+
+    name = "pgvector"
+
+    def search(
+        self,
+        db: Session,
+        collection: str,
+        embedding: list[float],
+        top_k: int,
+        document_ids: list[int] | None = None,
+        filters: dict | None = None,
+        with_content: bool = True,
+    ) -> tuple[str, list[SearchRow]]:
+        repository = SearchRepository(db)
+        conditions, params = repository.build_filter(document_ids, filters)
+
+        with track_stage("rag", "plan_search"):
+            strategy = repository.choose_strategy(collection, conditions, params)
+
+        with track_stage("rag", "vector_search"), \
+                trace_span("db.vector_search", {"db.system": "postgresql"}) as span:
+            rows = repository.search(
+                collection,
+                embedding,
+                top_k,
+                strategy,
+                conditions,
+                params,
+                with_content=with_content,
+            )
+            span.set_attribute("db.row_count", len(rows))
+        return strategy, rows
@@ -0,0 +1,110 @@
+"""시작 시 워밍업 및 준비 상태(readiness) 관리"""
+
+import asyncio
+import logging
+import time
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Awaitable, Callable, Optional
+
+from app.config import Settings
+from app.dependencies import ProviderManager
+from app.repositories.search_repository import warm_search_connections
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class ReadinessState:
+    """서버 준비 상태"""
+    ready: bool = False
+    status: str = "starting"  # "starting", "warming_up", "retrying", "ready", "failed"
+    steps: dict[str, str] = field(default_factory=dict)
+    error: Optional[str] = None
+    attempts: int = 0
+    started_at: Optional[datetime] = None
+    completed_at: Optional[datetime] = None
+
+
+readiness = ReadinessState()
+
+
+async def _warm_database(settings: Settings):
+    # 풀 커넥션을 열고 검색 쿼리를 커넥션별로 미리 PREPARE
+    await asyncio.to_thread(warm_search_connections, settings.warmup_db_connections)
+
+
+async def _warm_embedding(settings: Settings):
+    embedding = await asyncio.to_thread(
+        ProviderManager.get_embedding_provider, settings
+    )
+    await embedding.warmup()
+
+
+async def _warm_llm(settings: Settings):
+    llm = await asyncio.to_thread(ProviderManager.get_llm_provider, settings)
+    await llm.warmup()
+
+
+def _warmup_steps(settings: Settings) -> list[tuple[str, Callable[[Settings], Awaitable[None]]]]:
+    steps = []
+    if settings.warmup_db_connections > 0:
+        steps.append(("database", _warm_database))
+    steps.append(("embedding", _warm_embedding))
+    steps.append(("llm", _warm_llm))
+    return steps
+
+
+async def warmup(settings: Settings) -> ReadinessState:
+    """Provider 생성, 로컬 모델 로딩, DB 풀 준비
+
+    실패한 단계는 지수 백오프로 다시 시도한다 (시작 시점에 아직 뜨지 않은 로컬
+    LLM 서버/DB 가 나중에 올라오면 준비 완료). 성공한 단계는 다시 실행하지 않으며,
+    WARMUP_RETRY_DEADLINE 초가 지나도 실패하면 "failed" 로 멈춘다 (0 이면 계속 재시도).
+    """
+    readiness.status = "warming_up"
+    readiness.started_at = datetime.now()
+    started = time.monotonic()
+    delay = settings.warmup_retry_initial_delay
+
+    while True:
+        readiness.attempts += 1
+        try:
+            for name, step in _warmup_steps(settings):
+                if readiness.steps.get(name) == "ok":
+                    continue
+                try:
+                    await step(settings)
+                except Exception:
+                    readiness.steps[name] = "error"
+                    raise
+                readiness.steps[name] = "ok"
+
+            readiness.ready = True
+            readiness.status = "ready"
+            readiness.error = None
+            readiness.completed_at = datetime.now()
+            return readiness
+        except Exception as e:
+            readiness.error = str(e) or type(e).__name__
+            deadline = settings.warmup_retry_deadline
+            if deadline > 0 and time.monotonic() - started + delay > deadline:
+                logger.exception("Warmup failed after %d attempts", readiness.attempts)
+                readiness.status = "failed"
+                readiness.completed_at = datetime.now()
+                return readiness
+            logger.warning(
+                "Warmup attempt %d failed, retrying in %.0fs: %s",
+                readiness.attempts, delay, readiness.error,
+            )
+            readiness.status = "retrying"
+
+        await asyncio.sleep(delay)
+        delay = min(delay * 2, settings.warmup_retry_max_delay)
+
+
+def mark_ready():
+    """워밍업 없이 바로 준비 완료 처리"""
+    readiness.ready = True
+    readiness.status = "ready"
+    readiness.completed_at = datetime.now()
@@ -0,0 +1,51 @@
+"""벤치마크 공통 유틸리티"""
+
+import json
+import math
+from typing import Iterable
+
+
+def percentile(values: list[float], p: float) -> float:
+    """선형 보간 백분위수 (p: 0~100)"""
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    rank = (len(ordered) - 1) * p / 100
+    low, high = math.floor(rank), math.ceil(rank)
+    if low == high:
+        return ordered[int(rank)]
+    return ordered[low] + (ordered[high] - ordered[low]) * (rank - low)
+
+
+def latency_summary(seconds: list[float]) -> dict:
+    """지연 시간 요약 (ms)"""
+    return {
+        "count": len(seconds),
+        "p50_ms": percentile(seconds, 50) * 1000,
+        "p90_ms": percentile(seconds, 90) * 1000,
+        "p99_ms": percentile(seconds, 99) * 1000,
+        "max_ms": max(seconds) * 1000 if seconds else 0.0,
+    }
+
+
+def print_table(rows: Iterable[dict], columns: list[str]):
+    """dict 목록을 고정폭 표로 출력"""
+    rows = list(rows)
+    widths = {
+        col: max(len(col), *(len(_fmt(row.get(col))) for row in rows))
+        for col in columns
+    }
+    print("  ".join(col.rjust(widths[col]) for col in columns))
+    for row in rows:
+        print("  ".join(_fmt(row.get(col)).rjust(widths[col]) for col in columns))
+
+
+def _fmt(value) -> str:
+    if isinstance(value, float):
+        return f"{value:.2f}"
+    return "" if value is None else str(value)
+
+
+def dump_json(report: dict):
+    """보고서를 JSON 으로 출력"""
+    print(json.dumps(report, indent=2, ensure_ascii=False, default=str))
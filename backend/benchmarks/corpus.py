@@ -0,0 +1,193 @@
+"""결정적(seed 기반) 합성 PDF 코퍼스 생성기
+
+외부 라이브러리 없이 최소한의 PDF(Helvetica 텍스트)를 직접 작성하며,
+pypdf 로 텍스트 추출이 가능하다.
+"""
+
+import random
+from dataclasses import dataclass, field
+
+# 주제별 어휘 - 같은 주제 문서끼리 어휘가 겹치도록 구성
+TOPICS = {
+    "finance": [
+        "revenue", "margin", "quarter", "forecast", "budget", "invoice",
+        "audit", "ledger", "capital", "dividend", "expense", "liquidity",
+    ],
+    "medical": [
+        "patient", "dosage", "clinical", "symptom", "diagnosis", "therapy",
+        "trial", "vaccine", "surgery", "cardiac", "protocol", "pathology",
+    ],
+    "legal": [
+        "contract", "clause", "liability", "plaintiff", "statute", "tribunal",
+        "warranty", "indemnity", "arbitration", "jurisdiction", "breach", "counsel",
+    ],
+    "engineering": [
+        "latency", "throughput", "cluster", "replica", "kernel", "compiler",
+        "pipeline", "cache", "scheduler", "firmware", "protocol", "bandwidth",
+    ],
+    "hr": [
+        "onboarding", "benefits", "payroll", "recruiting", "promotion", "leave",
+        "training", "policy", "compliance", "performance", "retention", "handbook",
+    ],
+}
+
+COMMON_WORDS = [
+    "the", "a", "of", "and", "to", "in", "for", "with", "on", "by",
+    "report", "section", "team", "review", "update", "process", "result",
+    "summary", "plan", "data", "system", "project", "analysis", "record",
+]
+
+LINES_PER_PAGE = 55
+CHARS_PER_LINE = 90
+
+
+@dataclass
+class SyntheticDocument:
+    """생성된 문서"""
+    filename: str
+    topic: str
+    pages: list[str]
+    content: bytes = b""
+
+
+@dataclass
+class SyntheticQuery:
+    """정답(문서/페이지)이 알려진 질의"""
+    query: str
+    filename: str
+    page_number: int
+    topic: str = ""
+    extra: dict = field(default_factory=dict)
+
+
+def _sentence(rng: random.Random, topic_words: list[str]) -> str:
+    words = []
+    for _ in range(rng.randint(8, 16)):
+        pool = topic_words if rng.random() < 0.45 else COMMON_WORDS
+        words.append(rng.choice(pool))
+    # 고유 식별 토큰 - 질의가 특정 페이지를 가리킬 수 있도록
+    words.append(f"ref{rng.randint(0, 10 ** 6):06d}")
+    return " ".join(words).capitalize() + "."
+
+
+def _page_text(rng: random.Random, topic_words: list[str], sentences: int) -> str:
+    return " ".join(_sentence(rng, topic_words) for _ in range(sentences))
+
+
+def _wrap(text: str, width: int = CHARS_PER_LINE) -> list[str]:
+    lines, current = [], ""
+    for word in text.split():
+        if current and len(current) + 1 + len(word) > width:
+            lines.append(current)
+            current = word
+        else:
+            current = f"{current} {word}" if current else word
+    if current:
+        lines.append(current)
+    return lines
+
+
+def _escape(line: str) -> str:
+    return line.replace("\\", "\\\\").replace("(", "\\(").replace(")", "\\)")
+
+
+def make_pdf(pages: list[str]) -> bytes:
+    """페이지별 텍스트로 최소 PDF 생성"""
+    objects: list[bytes] = []
+
+    def add(obj: bytes) -> int:
+        objects.append(obj)
+        return len(objects)
+
+    catalog_id = add(b"")  # 나중에 채움
+    pages_id = add(b"")
+    font_id = add(b"<< /Type /Font /Subtype /Type1 /BaseFont /Helvetica >>")
+
+    page_ids = []
+    for text in pages:
+        lines = _wrap(text)[:LINES_PER_PAGE]
+        ops = ["BT", "/F1 10 Tf", "13 TL", "50 750 Td"]
+        for line in lines:
+            ops.append(f"({_escape(line)}) Tj T*")
+        ops.append("ET")
+        stream = "\n".join(ops).encode("latin-1", errors="replace")
+        content_id = add(
+            b"<< /Length %d >>\nstream\n" % len(stream) + stream + b"\nendstream"
+        )
+        page_ids.append(add(
+            b"<< /Type /Page /Parent %d 0 R /MediaBox [0 0 612 792] "
+            b"/Resources << /Font << /F1 %d 0 R >> >> /Contents %d 0 R >>"
+            % (pages_id, font_id, content_id)
+        ))
+
+    objects[catalog_id - 1] = b"<< /Type /Catalog /Pages %d 0 R >>" % pages_id
+    kids = b" ".join(b"%d 0 R" % pid for pid in page_ids)
+    objects[pages_id - 1] = (
+        b"<< /Type /Pages /Kids [" + kids + b"] /Count %d >>" % len(page_ids)
+    )
+
+    out = bytearray(b"%PDF-1.4\n")
+    offsets = []
+    for number, obj in enumerate(objects, start=1):
+        offsets.append(len(out))
+        out += b"%d 0 obj\n" % number + obj + b"\nendobj\n"
+
+    xref_offset = len(out)
+    out += b"xref\n0 %d\n" % (len(objects) + 1)
+    out += b"0000000000 65535 f \n"
+    for offset in offsets:
+        out += b"%010d 00000 n \n" % offset
+    out += (
+        b"trailer\n<< /Size %d /Root %d 0 R >>\nstartxref\n%d\n%%%%EOF\n"
+        % (len(objects) + 1, catalog_id, xref_offset)
+    )
+    return bytes(out)
+
+
+def generate_corpus(
+    num_documents: int,
+    pages_per_document: int = 5,
+    sentences_per_page: int = 30,
+    seed: int = 42,
+) -> list[SyntheticDocument]:
+    """합성 PDF 문서 목록 생성 (seed 가 같으면 동일한 결과)"""
+    rng = random.Random(seed)
+    topics = sorted(TOPICS)
+    documents = []
+    for i in range(num_documents):
+        topic = topics[i % len(topics)]
+        pages = [
+            _page_text(rng, TOPICS[topic], sentences_per_page)
+            for _ in range(pages_per_document)
+        ]
+        document = SyntheticDocument(
+            filename=f"bench-{topic}-{i:05d}.pdf",
+            topic=topic,
+            pages=pages,
+        )
+        document.content = make_pdf(pages)
+        documents.append(document)
+    return documents
+
+
+def generate_queries(
+    documents: list[SyntheticDocument],
+    num_queries: int,
+    seed: int = 7,
+) -> list[SyntheticQuery]:
+    """문서의 한 문장을 발췌하여 정답이 알려진 질의 생성"""
+    rng = random.Random(seed)
+    queries = []
+    for _ in range(num_queries):
+        document = rng.choice(documents)
+        page_index = rng.randrange(len(document.pages))
+        sentences = [
+            s.strip() for s in document.pages[page_index].split(".") if s.strip()
+        ]
+        queries.append(SyntheticQuery(
+            query=rng.choice(sentences),
+            filename=document.filename,
+            page_number=page_index + 1,
+            topic=document.topic,
+        ))
+    return queries
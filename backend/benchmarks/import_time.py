@@ -0,0 +1,107 @@
+"""`python -X importtime` 기반 모듈 import 시간 측정
+
+사용법 (backend 디렉토리에서):
+    python -m benchmarks.import_time
+    python -m benchmarks.import_time --module app.main --top 30 --runs 5
+"""
+
+import argparse
+import json
+import statistics
+import subprocess
+import sys
+from dataclasses import dataclass
+
+
+@dataclass
+class ImportEntry:
+    """단일 모듈 import 측정값 (마이크로초)"""
+    module: str
+    self_us: int
+    cumulative_us: int
+
+
+def parse_importtime(stderr: str) -> list[ImportEntry]:
+    """-X importtime 출력 파싱"""
+    entries = []
+    for line in stderr.splitlines():
+        if not line.startswith("import time:"):
+            continue
+        parts = line[len("import time:"):].split("|")
+        if len(parts) != 3:
+            continue
+        self_us, cumulative_us, module = parts
+        if not self_us.strip().isdigit():
+            continue  # 헤더 행
+        entries.append(ImportEntry(
+            module=module.strip(),
+            self_us=int(self_us),
+            cumulative_us=int(cumulative_us),
+        ))
+    return entries
+
+
+def measure(module: str) -> list[ImportEntry]:
+    """새 인터프리터에서 모듈을 import 하고 측정값 반환"""
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        capture_output=True,
+        text=True,
+    )
+    if result.returncode != 0:
+        raise RuntimeError(
+            f"import {module} failed:\n{result.stderr[-2000:]}"
+        )
+    return parse_importtime(result.stderr)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Import time benchmark")
+    parser.add_argument("--module", default="app.main")
+    parser.add_argument("--runs", type=int, default=3)
+    parser.add_argument("--top", type=int, default=20)
+    parser.add_argument("--json", action="store_true", help="JSON 형식으로 출력")
+    args = parser.parse_args()
+
+    totals = []
+    last_entries: list[ImportEntry] = []
+    for _ in range(args.runs):
+        last_entries = measure(args.module)
+        root = next(
+            (e for e in reversed(last_entries) if e.module == args.module),
+            None,
+        )
+        totals.append(root.cumulative_us if root else 0)
+
+    # 최상위 패키지 단위로 self 시간 합산
+    by_package: dict[str, int] = {}
+    for entry in last_entries:
+        package = entry.module.split(".")[0]
+        by_package[package] = by_package.get(package, 0) + entry.self_us
+    top_packages = sorted(by_package.items(), key=lambda x: -x[1])[:args.top]
+
+    report = {
+        "module": args.module,
+        "runs": args.runs,
+        "total_ms_median": statistics.median(totals) / 1000,
+        "total_ms_min": min(totals) / 1000,
+        "modules_imported": len(last_entries),
+        "top_packages_ms": {name: us / 1000 for name, us in top_packages},
+    }
+
+    if args.json:
+        print(json.dumps(report, indent=2))
+        return
+
+    print(f"import {args.module}: "
+          f"median {report['total_ms_median']:.1f} ms, "
+          f"min {report['total_ms_min']:.1f} ms "
+          f"({report['modules_imported']} modules, {args.runs} runs)")
+    print()
+    print(f"{'package':<40} {'self ms':>10}")
+    for name, ms in report["top_packages_ms"].items():
+        print(f"{name:<40} {ms:>10.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,154 @@
+"""asyncio 기반 API 부하 생성기
+
+실행 중인 서버의 /api/search, /api/search/chat, /api/documents/upload 에
+가중치에 따라 요청을 섞어 보내고 엔드포인트별 처리량과 지연 시간 백분위를 출력한다.
+외부 서비스 없이 측정하려면 서버를 fake Provider 로 실행한다:
+
+    LLM_PROVIDER=fake EMBEDDING_PROVIDER=fake EMBEDDING_MODEL=hash \\
+        uvicorn app.main:app --port 8000
+
+사용법 (backend 디렉토리에서):
+    python -m benchmarks.load_test --concurrency 32 --duration 60 --mix search=8,chat=2,upload=1
+"""
+
+import argparse
+import asyncio
+import random
+import time
+from collections import defaultdict
+
+import httpx
+
+from benchmarks.common import latency_summary, print_table, dump_json
+from benchmarks.corpus import generate_corpus, generate_queries
+
+
+def _parse_mix(value: str) -> dict[str, int]:
+    mix = {}
+    for part in value.split(","):
+        name, _, weight = part.partition("=")
+        if name not in ("search", "chat", "upload"):
+            raise argparse.ArgumentTypeError(f"Unknown endpoint: {name}")
+        mix[name] = int(weight or 1)
+    return mix
+
+
+class LoadGenerator:
+    """가중치 기반 요청 혼합 부하 생성기"""
+
+    def __init__(self, args):
+        self.args = args
+        self.rng = random.Random(args.seed)
+        self.documents = generate_corpus(args.upload_pool, args.pages, seed=args.seed)
+        self.queries = generate_queries(self.documents, 200, seed=args.seed + 1)
+        self.latencies: dict[str, list[float]] = defaultdict(list)
+        self.errors: dict[str, int] = defaultdict(int)
+        self.status_codes: dict[str, dict[int, int]] = defaultdict(lambda: defaultdict(int))
+
+    def _pick_endpoint(self) -> str:
+        names = list(self.args.mix)
+        weights = [self.args.mix[n] for n in names]
+        return self.rng.choices(names, weights=weights)[0]
+
+    async def _request(self, client: httpx.AsyncClient, endpoint: str) -> httpx.Response:
+        if endpoint == "upload":
+            document = self.rng.choice(self.documents)
+            return await client.post(
+                "/api/documents/upload",
+                files={"file": (document.filename, document.content, "application/pdf")},
+            )
+        query = self.rng.choice(self.queries).query
+        path = "/api/search" if endpoint == "search" else "/api/search/chat"
+        return await client.post(path, json={"query": query, "top_k": self.args.top_k})
+
+    async def _worker(self, client: httpx.AsyncClient, deadline: float, budget: list[int]):
+        while time.perf_counter() < deadline:
+            if budget[0] <= 0:
+                return
+            budget[0] -= 1
+            endpoint = self._pick_endpoint()
+            started = time.perf_counter()
+            try:
+                response = await self._request(client, endpoint)
+                self.status_codes[endpoint][response.status_code] += 1
+                if response.status_code >= 400:
+                    self.errors[endpoint] += 1
+                    continue
+            except httpx.HTTPError:
+                self.errors[endpoint] += 1
+                continue
+            self.latencies[endpoint].append(time.perf_counter() - started)
+
+    async def run(self) -> dict:
+        args = self.args
+        limits = httpx.Limits(max_connections=args.concurrency)
+        async with httpx.AsyncClient(
+            base_url=args.base_url, timeout=args.timeout, limits=limits
+        ) as client:
+            started = time.perf_counter()
+            deadline = started + args.duration
+            budget = [args.requests or float("inf")]
+            await asyncio.gather(*[
+                self._worker(client, deadline, budget)
+                for _ in range(args.concurrency)
+            ])
+            elapsed = time.perf_counter() - started
+
+        endpoints = []
+        for name in args.mix:
+            latencies = self.latencies[name]
+            endpoints.append({
+                "endpoint": name,
+                "ok": len(latencies),
+                "errors": self.errors[name],
+                "rps": len(latencies) / elapsed,
+                **latency_summary(latencies),
+                "status_codes": dict(self.status_codes[name]),
+            })
+        total_ok = sum(len(v) for v in self.latencies.values())
+        return {
+            "seconds": elapsed,
+            "concurrency": args.concurrency,
+            "total_ok": total_ok,
+            "total_errors": sum(self.errors.values()),
+            "throughput_rps": total_ok / elapsed,
+            "endpoints": endpoints,
+        }
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="API load generator")
+    parser.add_argument("--base-url", default="http://localhost:8000")
+    parser.add_argument("--concurrency", type=int, default=16)
+    parser.add_argument("--duration", type=float, default=30.0, help="초")
+    parser.add_argument("--requests", type=int, default=0, help="총 요청 수 (0 은 시간 기준)")
+    parser.add_argument("--mix", type=_parse_mix, default={"search": 8, "chat": 2, "upload": 1})
+    parser.add_argument("--top-k", type=int, default=5)
+    parser.add_argument("--upload-pool", type=int, default=20, help="업로드용 합성 PDF 수")
+    parser.add_argument("--pages", type=int, default=3)
+    parser.add_argument("--timeout", type=float, default=60.0)
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--json", action="store_true")
+    return parser.parse_args()
+
+
+def main():
+    args = parse_args()
+    report = asyncio.run(LoadGenerator(args).run())
+
+    if args.json:
+        dump_json(report)
+        return
+
+    print(f"{report['total_ok']} ok / {report['total_errors']} errors in "
+          f"{report['seconds']:.1f}s at concurrency {report['concurrency']} "
+          f"({report['throughput_rps']:.1f} req/s)")
+    print()
+    print_table(
+        report["endpoints"],
+        ["endpoint", "ok", "errors", "rps", "p50_ms", "p90_ms", "p99_ms", "max_ms"],
+    )
+
+
+if __name__ == "__main__":
+    main()
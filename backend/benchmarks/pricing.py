@@ -0,0 +1,56 @@
+"""모델별 토큰 단가 (USD / 1M tokens)
+
+공개 가격표 기준 근사치이며, 최신 가격은 --prices JSON 파일로 덮어쓴다.
+로컬 Provider(ollama, lmstudio, huggingface, fake)는 0 으로 계산한다.
+"""
+
+import json
+from typing import Optional
+
+# (provider, model) -> {"prompt": 입력 단가, "completion": 출력 단가}
+DEFAULT_PRICES: dict[tuple[str, str], dict[str, float]] = {
+    ("openai", "gpt-4o"): {"prompt": 2.50, "completion": 10.00},
+    ("openai", "gpt-4o-mini"): {"prompt": 0.15, "completion": 0.60},
+    ("openai", "gpt-4-turbo"): {"prompt": 10.00, "completion": 30.00},
+    ("openai", "gpt-4"): {"prompt": 30.00, "completion": 60.00},
+    ("openai", "gpt-3.5-turbo"): {"prompt": 0.50, "completion": 1.50},
+    ("openai", "text-embedding-3-small"): {"prompt": 0.02, "completion": 0.0},
+    ("openai", "text-embedding-3-large"): {"prompt": 0.13, "completion": 0.0},
+    ("openai", "text-embedding-ada-002"): {"prompt": 0.10, "completion": 0.0},
+    ("google", "gemini-1.5-pro"): {"prompt": 1.25, "completion": 5.00},
+    ("google", "gemini-1.5-flash"): {"prompt": 0.075, "completion": 0.30},
+    ("xai", "grok-beta"): {"prompt": 5.00, "completion": 15.00},
+    ("xai", "grok-2"): {"prompt": 2.00, "completion": 10.00},
+}
+
+LOCAL_PROVIDERS = {"ollama", "lmstudio", "huggingface", "fake"}
+
+
+def load_prices(path: Optional[str]) -> dict[tuple[str, str], dict[str, float]]:
+    """기본 단가에 JSON 파일({"provider:model": {"prompt": .., "completion": ..}}) 병합"""
+    prices = dict(DEFAULT_PRICES)
+    if path:
+        with open(path) as f:
+            for key, value in json.load(f).items():
+                provider, _, model = key.partition(":")
+                prices[(provider, model)] = value
+    return prices
+
+
+def estimate_cost(
+    prices: dict[tuple[str, str], dict[str, float]],
+    provider: str,
+    model: str,
+    prompt_tokens: int,
+    completion_tokens: int = 0,
+) -> Optional[float]:
+    """예상 비용 (USD), 단가를 모르면 None"""
+    if provider in LOCAL_PROVIDERS:
+        return 0.0
+    price = prices.get((provider, model))
+    if price is None:
+        return None
+    return (
+        prompt_tokens * price.get("prompt", 0.0)
+        + completion_tokens * price.get("completion", 0.0)
+    ) / 1_000_000
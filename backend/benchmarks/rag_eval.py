@@ -0,0 +1,228 @@
+"""오프라인 RAG 품질/비용 평가
+
+(질문, 정답 문서/페이지) JSONL 을 RAGService.search (및 선택적으로 chat) 로
+실행하여 설정별 hit@k, MRR, 지연 시간 백분위, 토큰 수, 예상 비용을 비교한다.
+
+입력 JSONL 한 줄 예:
+    {"question": "환불 정책은?", "expected_document": "policy.pdf", "expected_page": 3}
+    (expected_document 는 원본 파일명 또는 문서 ID, expected_page 는 선택)
+
+사용법 (backend 디렉토리에서):
+    python -m benchmarks.rag_eval questions.jsonl --top-k 3,5,10
+    python -m benchmarks.rag_eval questions.jsonl --chat \\
+        --llm openai:gpt-4o-mini --llm openai:gpt-4o --top-k 5 --concurrency 8
+"""
+
+import argparse
+import asyncio
+import json
+import time
+from dataclasses import dataclass
+from typing import Optional
+
+from app.config import get_settings
+from app.dependencies import ProviderManager
+from app.providers.base import LLMConfig, LLMMessage, LLMResponse
+from app.providers.governor import estimate_tokens
+from app.providers.llm.base import BaseLLMProvider
+from app.providers.registry import ProviderRegistry
+from app.providers.wrappers import LLMProviderWrapper
+from app.schemas import SearchResult
+from app.services.rag_service import RAGService
+from benchmarks.common import latency_summary, print_table, dump_json
+from benchmarks.pricing import load_prices, estimate_cost
+
+
+@dataclass
+class EvalItem:
+    """평가 질문"""
+    question: str
+    expected_document: str
+    expected_page: Optional[int] = None
+
+
+class UsageRecordingLLMProvider(LLMProviderWrapper):
+    """LLM 토큰 사용량 누적 (usage 가 없으면 글자 수 기반 추정)"""
+
+    def __init__(self, inner: BaseLLMProvider):
+        super().__init__(inner)
+        self.prompt_tokens = 0
+        self.completion_tokens = 0
+        self.estimated = False
+
+    async def generate(
+        self,
+        messages: list[LLMMessage],
+        **kwargs
+    ) -> LLMResponse:
+        response = await self.inner.generate(messages, **kwargs)
+        usage = response.usage or {}
+        prompt = usage.get("prompt_tokens", usage.get("input_tokens"))
+        completion = usage.get("completion_tokens", usage.get("output_tokens"))
+        if prompt is None or completion is None:
+            self.estimated = True
+            prompt = sum(estimate_tokens(m.content) for m in messages)
+            completion = estimate_tokens(response.content)
+        self.prompt_tokens += prompt
+        self.completion_tokens += completion
+        return response
+
+
+def load_items(path: str) -> list[EvalItem]:
+    items = []
+    with open(path) as f:
+        for line in f:
+            if not line.strip():
+                continue
+            data = json.loads(line)
+            items.append(EvalItem(
+                question=data["question"],
+                expected_document=str(data["expected_document"]),
+                expected_page=data.get("expected_page"),
+            ))
+    return items
+
+
+def first_hit_rank(item: EvalItem, results: list[SearchResult]) -> Optional[int]:
+    """정답이 처음 나타난 순위 (1부터), 없으면 None"""
+    for rank, result in enumerate(results, start=1):
+        if item.expected_document not in (result.filename, str(result.document_id)):
+            continue
+        if item.expected_page is not None and result.page_number != item.expected_page:
+            continue
+        return rank
+    return None
+
+
+async def evaluate_config(
+    items: list[EvalItem],
+    embedding,
+    llm: Optional[UsageRecordingLLMProvider],
+    top_k: int,
+    concurrency: int,
+) -> dict:
+    """단일 설정 평가"""
+    rag = RAGService(llm, embedding)
+    semaphore = asyncio.Semaphore(concurrency)
+    latencies: list[float] = []
+    ranks: list[Optional[int]] = []
+    errors = 0
+
+    async def run(item: EvalItem):
+        nonlocal errors
+        async with semaphore:
+            started = time.perf_counter()
+            try:
+                if llm is not None:
+                    _, results = await rag.chat(item.question, top_k)
+                else:
+                    results = await rag.search(item.question, top_k)
+            except Exception:
+                errors += 1
+                return
+            latencies.append(time.perf_counter() - started)
+            ranks.append(first_hit_rank(item, results))
+
+    await asyncio.gather(*[run(item) for item in items])
+
+    answered = len(ranks) or 1
+    return {
+        "top_k": top_k,
+        "questions": len(items),
+        "errors": errors,
+        "hit@k": sum(1 for r in ranks if r is not None) / answered,
+        "mrr": sum(1 / r for r in ranks if r is not None) / answered,
+        **latency_summary(latencies),
+    }
+
+
+def _parse_llm(value: str) -> tuple[str, str]:
+    provider, _, model = value.partition(":")
+    if not model:
+        raise argparse.ArgumentTypeError("--llm must be provider:model")
+    return provider, model
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="Offline RAG evaluation")
+    parser.add_argument("dataset", help="질문 JSONL 파일")
+    parser.add_argument("--top-k", default="5", help="쉼표로 구분된 top_k 목록")
+    parser.add_argument("--chat", action="store_true", help="LLM 응답 생성까지 평가")
+    parser.add_argument("--llm", type=_parse_llm, action="append",
+                        help="provider:model (반복 가능, 기본값은 현재 설정)")
+    parser.add_argument("--temperature", type=float, default=None)
+    parser.add_argument("--concurrency", type=int, default=4)
+    parser.add_argument("--prices", default=None, help="단가 JSON 파일")
+    parser.add_argument("--json", action="store_true")
+    return parser.parse_args()
+
+
+def main():
+    args = parse_args()
+    settings = get_settings()
+    items = load_items(args.dataset)
+    top_ks = [int(k) for k in args.top_k.split(",") if k]
+    prices = load_prices(args.prices)
+
+    # 설정별로 이벤트 루프가 새로 생성되므로 Governor 가 없는 원본 Provider 사용
+    embedding = ProviderRegistry.get_embedding_provider(
+        ProviderManager.get_embedding_config(settings)
+    )
+    embedding_name = (embedding.provider_name, embedding.config.model_name)
+
+    llm_specs: list[Optional[tuple[str, str]]] = [None]
+    if args.chat:
+        llm_specs = args.llm or [(settings.llm_provider, settings.llm_model)]
+
+    rows = []
+    for spec in llm_specs:
+        for top_k in top_ks:
+            llm = None
+            if spec is not None:
+                provider, model = spec
+                llm = UsageRecordingLLMProvider(ProviderRegistry.get_llm_provider(LLMConfig(
+                    provider=provider,
+                    model_name=model,
+                    temperature=(args.temperature if args.temperature is not None
+                                 else settings.llm_temperature),
+                    api_key=settings.get_api_key_for_provider(provider),
+                    base_url=settings.get_base_url_for_provider(provider),
+                )))
+
+            row = asyncio.run(evaluate_config(items, embedding, llm, top_k, args.concurrency))
+
+            # 쿼리 임베딩 비용 (질문 글자 수 기반 추정)
+            embedding_tokens = sum(estimate_tokens(i.question) for i in items)
+            embedding_cost = estimate_cost(prices, *embedding_name, embedding_tokens)
+            row["embedding"] = ":".join(embedding_name)
+            row["llm"] = ":".join(spec) if spec else "-"
+            row["prompt_tokens"] = llm.prompt_tokens if llm else 0
+            row["completion_tokens"] = llm.completion_tokens if llm else 0
+            row["tokens_estimated"] = llm.estimated if llm else False
+            llm_cost = (estimate_cost(prices, spec[0], spec[1],
+                                      row["prompt_tokens"], row["completion_tokens"])
+                        if spec else 0.0)
+            if embedding_cost is None or llm_cost is None:
+                row["cost_usd"] = None
+                row["cost_per_1k_usd"] = None
+            else:
+                row["cost_usd"] = embedding_cost + llm_cost
+                row["cost_per_1k_usd"] = row["cost_usd"] / len(items) * 1000
+            rows.append(row)
+
+    if args.json:
+        dump_json({"dataset": args.dataset, "results": rows})
+        return
+
+    print_table(rows, [
+        "llm", "top_k", "hit@k", "mrr", "p50_ms", "p90_ms", "p99_ms",
+        "prompt_tokens", "completion_tokens", "cost_per_1k_usd", "errors",
+    ])
+    if any(r["tokens_estimated"] for r in rows):
+        print("\n* 일부 Provider 는 usage 를 반환하지 않아 토큰 수를 추정했습니다.")
+    if any(r["cost_usd"] is None for r in rows):
+        print("* 단가를 모르는 모델은 비용이 비어 있습니다 (--prices 로 지정).")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,275 @@
+"""검색 벤치마크 - 합성 코퍼스 적재, 검색 지연 시간, recall@k
+
+PDFService 로 합성 PDF 를 적재한 뒤, 여러 동시성 수준에서 RAGService 검색
+지연 시간을 측정하고 인덱스 검색 결과를 인덱스를 끈 정확(brute-force)
+검색 결과와 비교하여 recall@k 를 계산한다. 벤치마크 문서는 전용 컬렉션(bench)에
+적재하며, 평가할 인덱스는 그 파티션에만 만든다.
+
+사용법 (backend 디렉토리에서, 전용 DB 권장):
+    DATABASE_URL=postgresql+psycopg://localhost:5432/ragdoc_bench \\
+        python -m benchmarks.retrieval --documents 200 --index hnsw --ef-search 40
+"""
+
+import argparse
+import asyncio
+import tempfile
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+from langchain.text_splitter import RecursiveCharacterTextSplitter
+from sqlalchemy import text
+
+from app.database import SessionLocal, engine, init_db
+from app.providers.base import EmbeddingConfig
+from app.providers.registry import ProviderRegistry
+from app.services.pdf_service import PDFService
+from app.services.collection_service import create_partition, partition_name
+from app.services.rag_service import RAGService
+from benchmarks.common import latency_summary, print_table, dump_json
+from benchmarks.corpus import generate_corpus, generate_queries
+
+BENCH_PREFIX = "bench-"
+BENCH_INDEX = "bench_document_chunks_embedding_idx"
+BENCH_COLLECTION = "bench"
+BENCH_PARTITION = partition_name(BENCH_COLLECTION)
+
+
+def create_embedding_provider(dimension: int):
+    """결정적 해시 임베딩(fake) Provider 생성"""
+    return ProviderRegistry.get_embedding_provider(EmbeddingConfig(
+        provider="fake",
+        model_name="hash",
+        dimension=dimension,
+    ))
+
+
+def ensure_bench_collection():
+    """벤치마크 컬렉션과 파티션 생성"""
+    with engine.begin() as conn:
+        conn.execute(
+            text("INSERT INTO collections (name) VALUES (:name) ON CONFLICT (name) DO NOTHING"),
+            {"name": BENCH_COLLECTION},
+        )
+        create_partition(conn, BENCH_COLLECTION)
+
+
+def reset_bench_data():
+    """이전 벤치마크 문서 삭제"""
+    with SessionLocal() as db:
+        db.execute(text("""
+            DELETE FROM document_chunks WHERE document_id IN (
+                SELECT id FROM documents WHERE original_filename LIKE :prefix
+            )
+        """), {"prefix": f"{BENCH_PREFIX}%"})
+        db.execute(
+            text("DELETE FROM documents WHERE original_filename LIKE :prefix"),
+            {"prefix": f"{BENCH_PREFIX}%"},
+        )
+        db.commit()
+
+
+async def ingest(documents, pdf_service: PDFService) -> dict:
+    """PDFService 로 코퍼스 적재 및 처리량 측정"""
+    pages = sum(len(d.pages) for d in documents)
+    chunks = 0
+    started = time.perf_counter()
+    with SessionLocal() as db:
+        for document in documents:
+            record = await pdf_service.process_pdf(
+                file_content=document.content,
+                original_filename=document.filename,
+                db=db,
+                collection=BENCH_COLLECTION,
+            )
+            chunks += db.execute(
+                text("SELECT count(*) FROM document_chunks "
+                     "WHERE collection = :collection AND document_id = :id"),
+                {"collection": BENCH_COLLECTION, "id": record.id},
+            ).scalar()
+    elapsed = time.perf_counter() - started
+    return {
+        "documents": len(documents),
+        "pages": pages,
+        "chunks": chunks,
+        "seconds": elapsed,
+        "documents_per_s": len(documents) / elapsed,
+        "pages_per_s": pages / elapsed,
+        "chunks_per_s": chunks / elapsed,
+    }
+
+
+def create_index(args):
+    """평가할 ANN 인덱스 생성 (컬렉션 기본 인덱스는 제거)"""
+    with SessionLocal() as db:
+        db.execute(text(f"DROP INDEX IF EXISTS {BENCH_PARTITION}_embedding_hnsw"))
+        db.execute(text(f"DROP INDEX IF EXISTS {BENCH_INDEX}"))
+        if args.index == "hnsw":
+            db.execute(text(
+                f"CREATE INDEX {BENCH_INDEX} ON {BENCH_PARTITION} "
+                f"USING hnsw (embedding vector_cosine_ops) "
+                f"WITH (m = {args.hnsw_m}, ef_construction = {args.hnsw_ef_construction})"
+            ))
+        elif args.index == "ivfflat":
+            db.execute(text(
+                f"CREATE INDEX {BENCH_INDEX} ON {BENCH_PARTITION} "
+                f"USING ivfflat (embedding vector_cosine_ops) "
+                f"WITH (lists = {args.ivf_lists})"
+            ))
+        db.execute(text(f"ANALYZE {BENCH_PARTITION}"))
+        db.commit()
+
+
+def drop_index():
+    """평가용 인덱스 제거 후 컬렉션 기본 인덱스 복원"""
+    with engine.begin() as conn:
+        conn.execute(text(f"DROP INDEX IF EXISTS {BENCH_INDEX}"))
+        create_partition(conn, BENCH_COLLECTION)
+
+
+def _session_settings(db, args, exact: bool = False):
+    """검색 세션 GUC 설정"""
+    if exact:
+        # 검색 SQL 은 prepared statement 라서 캐시된 generic plan (ANN 인덱스)이 재사용될
+        # 수 있음 → 매 실행 현재 GUC 로 다시 계획하도록 강제
+        db.execute(text("SET plan_cache_mode = force_custom_plan"))
+        db.execute(text("SET enable_indexscan = off"))
+        db.execute(text("SET enable_bitmapscan = off"))
+        return
+    if args.ef_search:
+        db.execute(text(f"SET hnsw.ef_search = {int(args.ef_search)}"))
+    if args.probes:
+        db.execute(text(f"SET ivfflat.probes = {int(args.probes)}"))
+
+
+def run_search(rag: RAGService, query: str, top_k: int, args, exact=False):
+    """독립 세션에서 검색 1회 실행 (워커 스레드용)"""
+    with SessionLocal() as db:
+        _session_settings(db, args, exact)
+        started = time.perf_counter()
+        # single-flight 를 거치지 않는 내부 경로로 순수 검색 비용 측정
+        results = asyncio.run(
+            rag._search(query, db, top_k, None, collection=BENCH_COLLECTION)
+        )
+        return time.perf_counter() - started, results
+
+
+def measure_latency(rag, queries, args) -> list[dict]:
+    """동시성 수준별 검색 지연 시간"""
+    rows = []
+    for concurrency in args.concurrency:
+        started = time.perf_counter()
+        with ThreadPoolExecutor(max_workers=concurrency) as pool:
+            timings = list(pool.map(
+                lambda q: run_search(rag, q.query, args.top_k, args)[0],
+                queries,
+            ))
+        elapsed = time.perf_counter() - started
+        rows.append({
+            "concurrency": concurrency,
+            "qps": len(queries) / elapsed,
+            **latency_summary(timings),
+        })
+    return rows
+
+
+def measure_recall(rag, queries, args) -> dict:
+    """인덱스 검색 vs 정확 검색 recall@k, 정답 문서/페이지 적중률"""
+    recall_sum = 0.0
+    hits = 0
+    for query in queries:
+        _, approx = run_search(rag, query.query, args.top_k, args)
+        _, exact = run_search(rag, query.query, args.top_k, args, exact=True)
+        exact_ids = {r.chunk_id for r in exact}
+        if exact_ids:
+            recall_sum += len(exact_ids & {r.chunk_id for r in approx}) / len(exact_ids)
+        if any(r.filename == query.filename and r.page_number == query.page_number
+               for r in approx):
+            hits += 1
+    return {
+        f"recall@{args.top_k}": recall_sum / len(queries),
+        f"hit@{args.top_k}": hits / len(queries),
+    }
+
+
+def _int_list(value: str) -> list[int]:
+    return [int(v) for v in value.split(",") if v]
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="Retrieval benchmark")
+    parser.add_argument("--documents", type=int, default=100)
+    parser.add_argument("--pages", type=int, default=5, help="문서당 페이지 수")
+    parser.add_argument("--sentences", type=int, default=30, help="페이지당 문장 수")
+    parser.add_argument("--queries", type=int, default=100)
+    parser.add_argument("--top-k", type=int, default=5)
+    parser.add_argument("--concurrency", type=_int_list, default=[1, 4, 16])
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--dimension", type=int, default=1536)
+    parser.add_argument("--chunk-size", type=int, default=1000)
+    parser.add_argument("--chunk-overlap", type=int, default=200)
+    parser.add_argument("--index", choices=["none", "hnsw", "ivfflat"], default="none")
+    parser.add_argument("--hnsw-m", type=int, default=16)
+    parser.add_argument("--hnsw-ef-construction", type=int, default=64)
+    parser.add_argument("--ef-search", type=int, default=None)
+    parser.add_argument("--ivf-lists", type=int, default=100)
+    parser.add_argument("--probes", type=int, default=None)
+    parser.add_argument("--skip-ingest", action="store_true", help="기존 벤치마크 데이터 재사용")
+    parser.add_argument("--keep-index", action="store_true")
+    parser.add_argument("--json", action="store_true")
+    return parser.parse_args()
+
+
+def main():
+    args = parse_args()
+    init_db()
+    ensure_bench_collection()
+
+    embedding = create_embedding_provider(args.dimension)
+    documents = generate_corpus(args.documents, args.pages, args.sentences, args.seed)
+    queries = generate_queries(documents, args.queries, seed=args.seed + 1)
+
+    report = {"config": vars(args)}
+
+    if not args.skip_ingest:
+        reset_bench_data()
+        pdf_service = PDFService(embedding)
+        pdf_service.upload_dir = Path(tempfile.mkdtemp(prefix="ragbench-"))
+        pdf_service.text_splitter = RecursiveCharacterTextSplitter(
+            chunk_size=args.chunk_size,
+            chunk_overlap=args.chunk_overlap,
+            length_function=len,
+        )
+        report["ingestion"] = asyncio.run(ingest(documents, pdf_service))
+
+    create_index(args)
+    try:
+        rag = RAGService(None, embedding)
+        report["latency"] = measure_latency(rag, queries, args)
+        report["quality"] = measure_recall(rag, queries, args)
+    finally:
+        if not args.keep_index:
+            drop_index()
+
+    if args.json:
+        dump_json(report)
+        return
+
+    if "ingestion" in report:
+        ing = report["ingestion"]
+        print(f"Ingestion: {ing['documents']} docs / {ing['pages']} pages / "
+              f"{ing['chunks']} chunks in {ing['seconds']:.1f}s "
+              f"({ing['pages_per_s']:.1f} pages/s, {ing['chunks_per_s']:.1f} chunks/s)")
+        print()
+    print(f"Search latency (index={args.index}, top_k={args.top_k}):")
+    print_table(
+        report["latency"],
+        ["concurrency", "qps", "p50_ms", "p90_ms", "p99_ms", "max_ms"],
+    )
+    print()
+    for name, value in report["quality"].items():
+        print(f"{name}: {value:.3f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,131 @@
+"""쿼리 벡터 파라미터 전송 방식 마이크로벤치마크
+
+이전 방식 (str(list) 문자열 + ::vector 캐스트 두 번, 매번 파싱/계획)과
+현재 방식 (pgvector 어댑터 binary 전송, 거리 한 번 계산, prepared statement)의
+쿼리당 오버헤드를 비교한다. 기본은 클라이언트 측 인코딩 비용만 측정하며,
+--database 를 주면 실제 DB 에서 쿼리 지연 시간도 측정한다.
+
+사용법 (backend 디렉토리에서):
+    python -m benchmarks.vector_binding --iterations 2000
+    python -m benchmarks.vector_binding --database --collection bench --iterations 500
+"""
+
+import argparse
+import time
+
+import numpy as np
+from psycopg.adapt import PyFormat
+
+from benchmarks.common import latency_summary, print_table, dump_json
+
+BEFORE_SQL = """
+    SELECT dc.id, 1 - (dc.embedding <=> %(embedding)s::vector) as score
+    FROM document_chunks dc
+    WHERE dc.collection = %(collection)s
+    ORDER BY dc.embedding <=> %(embedding)s::vector
+    LIMIT %(limit)s
+"""
+
+AFTER_SQL = """
+    SELECT dc.id, dc.embedding <=> %(embedding)s as distance
+    FROM document_chunks dc
+    WHERE dc.collection = %(collection)s
+    ORDER BY distance
+    LIMIT %(limit)s
+"""
+
+
+def _random_vectors(count: int, dimension: int, seed: int) -> list[list[float]]:
+    rng = np.random.default_rng(seed)
+    return rng.standard_normal((count, dimension)).tolist()
+
+
+def measure_encoding(vectors: list[list[float]]) -> list[dict]:
+    """클라이언트 측 파라미터 인코딩 비용과 전송 크기"""
+    from pgvector.utils import Vector
+
+    rows = []
+    timings, size = [], 0
+    for vector in vectors:
+        started = time.perf_counter()
+        payload = str(vector).encode()
+        timings.append(time.perf_counter() - started)
+        size = len(payload)
+    rows.append({"method": "text_literal", "bytes": size, **latency_summary(timings)})
+
+    timings = []
+    for vector in vectors:
+        started = time.perf_counter()
+        payload = Vector._to_db_binary(np.asarray(vector, dtype=np.float32))
+        timings.append(time.perf_counter() - started)
+        size = len(payload)
+    rows.append({"method": "binary", "bytes": size, **latency_summary(timings)})
+    return rows
+
+
+def measure_queries(vectors: list[list[float]], args) -> list[dict]:
+    """DB 쿼리 지연 시간 (같은 커넥션에서 방식별 순차 실행)"""
+    from app.database import engine
+
+    raw = engine.raw_connection()
+    try:
+        conn = raw.driver_connection
+        conn.autocommit = True
+        try:
+            conn.adapters.get_dumper(np.ndarray, PyFormat.AUTO)
+        except Exception:
+            raise RuntimeError("pgvector adapter not registered (run init_db first)")
+
+        variants = [
+            ("text_literal", BEFORE_SQL, lambda v: str(v), False),
+            ("binary", AFTER_SQL, lambda v: np.asarray(v, dtype=np.float32), False),
+            ("binary_prepared", AFTER_SQL, lambda v: np.asarray(v, dtype=np.float32), True),
+        ]
+        rows = []
+        for name, sql, to_param, prepare in variants:
+            timings = []
+            for vector in vectors:
+                params = {
+                    "embedding": to_param(vector),
+                    "collection": args.collection,
+                    "limit": args.top_k,
+                }
+                started = time.perf_counter()
+                conn.execute(sql, params, prepare=prepare).fetchall()
+                timings.append(time.perf_counter() - started)
+            rows.append({"method": name, **latency_summary(timings)})
+        return rows
+    finally:
+        raw.close()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Vector parameter binding benchmark")
+    parser.add_argument("--iterations", type=int, default=1000)
+    parser.add_argument("--dimension", type=int, default=1536)
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--database", action="store_true", help="DB 쿼리 지연 시간도 측정")
+    parser.add_argument("--collection", default="documents")
+    parser.add_argument("--top-k", type=int, default=5)
+    parser.add_argument("--json", action="store_true")
+    args = parser.parse_args()
+
+    vectors = _random_vectors(args.iterations, args.dimension, args.seed)
+    report = {"config": vars(args), "encoding": measure_encoding(vectors)}
+    if args.database:
+        report["queries"] = measure_queries(vectors, args)
+
+    if args.json:
+        dump_json(report)
+        return
+
+    print(f"Parameter encoding (dimension={args.dimension}):")
+    print_table(report["encoding"], ["method", "bytes", "p50_ms", "p99_ms", "max_ms"])
+    if "queries" in report:
+        print()
+        print(f"Query latency (collection={args.collection}, top_k={args.top_k}):")
+        print_table(report["queries"], ["method", "p50_ms", "p90_ms", "p99_ms", "max_ms"])
+
+
+if __name__ == "__main__":
+    main()
@@ -2,6 +2,7 @@ import axios from 'axios';
 import type {
   Document,
   DocumentListResponse,
+  DocumentListParams,
   UploadResponse,
   SearchResponse,
   ChatResponse,
@@ -39,8 +40,8 @@ export const documentApi = {
     return response.data;
   },
 
-  list: async (): Promise<DocumentListResponse> => {
-    const response = await api.get<DocumentListResponse>('/documents');
+  list: async (params?: DocumentListParams): Promise<DocumentListResponse> => {
+    const response = await api.get<DocumentListResponse>('/documents', { params });
     return response.data;
   },
 
@@ -10,11 +10,30 @@ export interface Document {
   file_size: number;
   page_count: number | null;
   created_at: string;
+  collection: string;
+  metadata: Record<string, unknown>;
 }
 
 export interface DocumentListResponse {
   documents: Document[];
   total: number;
+  total_is_estimate: boolean;
+  next_cursor: string | null;
+}
+
+export interface DocumentListParams {
+  limit?: number;
+  cursor?: string;
+  collection?: string;
+  filename_prefix?: string;
+  embedding_provider?: string;
+  embedding_model?: string;
+}
+
+export interface Collection {
+  name: string;
+  created_at: string;
+  document_count: number;
 }
 
 export interface UploadResponse {
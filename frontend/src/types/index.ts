@@ -7,11 +7,14 @@
 export type {
   Document,
   DocumentListResponse,
+  DocumentListParams,
+  Collection,
   UploadResponse,
 } from './document';
 
 // Search types
 export type {
+  SearchFields,
   SearchQuery,
   SearchResult,
   SearchResponse,
@@ -78,6 +78,10 @@ export interface DownloadStatus {
   status: 'pending' | 'downloading' | 'completed' | 'failed' | 'not_found';
   progress?: number;
   error?: string;
+  downloaded_bytes?: number;
+  total_bytes?: number;
+  files_completed?: number;
+  files_total?: number;
 }
 
 export interface DownloadRequest {
@@ -3,17 +3,23 @@
  * Synced with backend: app/schemas.py
  */
 
+export type SearchFields = 'ids' | 'snippet' | 'content';
+
 export interface SearchQuery {
   query: string;
   top_k?: number;
+  collection?: string;
   document_ids?: number[];
+  filters?: Record<string, unknown>;
+  fields?: SearchFields;
 }
 
 export interface SearchResult {
   chunk_id: number;
   document_id: number;
   filename: string;
-  content: string;
+  content: string | null;
+  snippet: string | null;
   page_number: number | null;
   score: number;
 }
@@ -25,11 +31,20 @@ export interface SearchResponse {
 
 export interface ChatQuery {
   query: string;
+  collection?: string;
   document_ids?: number[];
+  filters?: Record<string, unknown>;
   top_k?: number;
+  llm_provider?: string;
+  llm_model?: string;
+  temperature?: number;
+  variant?: string;
 }
 
 export interface ChatResponse {
   answer: string;
   sources: SearchResult[];
+  llm_provider?: string;
+  llm_model?: string;
+  variant?: string;
 }